@@ -26,8 +26,10 @@ pages = [
                     "fields/boolean.md",
                     "fields/integer.md",
                     "fields/float.md",
+                    "fields/decimal.md",
                     "fields/file.md",
                     "fields/list.md",
+                    "fields/array.md",
                 ]
             },
             {
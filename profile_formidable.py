@@ -7,7 +7,11 @@ Exercises the main code paths:
 3. Field setting & validation
 4. NestedForms (multiple sub-forms)
 5. SlugField (unicode normalization)
-6. HTML rendering
+6. URLField (ASCII, mixed-case and IDN hosts)
+7. DateField, DateTimeField and TimeField (ISO, 12h and other formats)
+8. HTML rendering
+
+It also reports the garbage collections and peak memory of a batch of requests.
 
 Run:
     uv run python profile_formidable.py
@@ -18,7 +22,10 @@ Outputs:
 """
 
 import cProfile
+import gc
 import pstats
+import timeit
+import tracemalloc
 
 import formidable as f
 
@@ -120,11 +127,119 @@ def workload_slug(iterations=2000):
         "The Quick Brown Fox Jumps Over The Lazy Dog 123!@#$%",
         "ñoño año español café résumé naïve",
         "ა ბ გ დ ე ვ ზ თ ი კ ლ მ ნ ო პ",
+        # Already slugs, the common case when editing
+        "hello-world-ca-va-tres-bien",
+        "the-quick-brown-fox-jumps-over-the-lazy-dog-123",
     ]
     for _ in range(iterations):
         for text in texts:
             slugify(text)
 
+    # With a cache, for repeated titles
+    field = f.SlugField(cache_size=128)
+    for _ in range(iterations):
+        for text in texts:
+            field.filter_value(text)
+
+
+URLS = {
+    "ascii": "https://example.com/path/to/page?q=1",
+    "mixed-case": "HTTPS://WWW.Example.COM/Path/To/Page?q=1",
+    "idn": "https://bücher.example/path/to/page?q=1",
+}
+
+
+def workload_url(iterations=2000):
+    """Measure URL field normalization."""
+    field = f.URLField()
+    for _ in range(iterations):
+        for url in URLS.values():
+            field.filter_value(url)
+
+
+def benchmark_url(number=20_000):
+    """Microseconds per `URLField.filter_value()` call, by kind of URL."""
+    field = f.URLField()
+    return {
+        kind: timeit.timeit(lambda url=url: field.filter_value(url), number=number)
+        / number * 1e6
+        for kind, url in URLS.items()
+    }
+
+
+def benchmark_url_worst_case(sizes=(10_000, 100_000, 1_000_000)):
+    """
+    Milliseconds per `URLField.filter_value()` call for crafted inputs of
+    increasing size. The time must grow linearly with the size.
+    """
+    field = f.URLField()
+    crafted = {
+        "dots": lambda n: "http://a" + "a." * n + "\t",
+        "colons": lambda n: "http://a" + ":" * n + "x y",
+        "host": lambda n: "http://" + "a" * n + " b",
+    }
+    results = {}
+    for kind, make in crafted.items():
+        for size in sizes:
+            value = make(size)
+            start = timeit.default_timer()
+            try:
+                field.filter_value(value)
+            except ValueError:
+                pass
+            results[(kind, size)] = (timeit.default_timer() - start) * 1e3
+    return results
+
+
+DATES = {
+    "iso date": (f.DateField(), "2024-05-17"),
+    "iso datetime": (f.DateTimeField(), "2024-05-17T10:20:30"),
+    "other format": (f.DateField("%d/%m/%Y"), "17/05/2024"),
+    "list of formats": (f.DateField(["%Y-%m-%d", "%d/%m/%Y"]), "17/05/2024"),
+    "time 24h": (f.TimeField(), "14:30:15"),
+    "time 12h": (f.TimeField(), "2:30 PM"),
+}
+
+
+def workload_dates(iterations=5000):
+    """Measure date, datetime and time parsing."""
+    for _ in range(iterations):
+        for field, value in DATES.values():
+            field.filter_value(value)
+
+
+def benchmark_dates(number=20_000):
+    """Microseconds per `filter_value()` call, by kind of date or time field."""
+    return {
+        kind: timeit.timeit(lambda: field.filter_value(value), number=number)
+        / number * 1e6
+        for kind, (field, value) in DATES.items()
+    }
+
+
+NUMBERS = {
+    "float": (f.FloatField(gt=0), "1234.56"),
+    "float de": (f.FloatField(gt=0, locale="de"), "1.234,56"),
+    "decimal": (f.DecimalField(), "1234.56"),
+    "decimal money": (
+        f.DecimalField(precision=10, scale=2, gt=0, multiple_of="0.05"),
+        "1234.55",
+    ),
+}
+
+
+def benchmark_numbers(number=20_000):
+    """Microseconds to set and validate a value, by kind of number field."""
+
+    def run(field, value):
+        field.set(value)
+        field.validate()
+
+    return {
+        kind: timeit.timeit(lambda: run(field, value), number=number) / number * 1e6
+        for kind, (field, value) in NUMBERS.items()
+    }
+
 
 def workload_parser(iterations=2000):
     """Measure raw parser performance."""
@@ -134,6 +249,23 @@ def workload_parser(iterations=2000):
         parse(data)
 
 
+def measure_gc(iterations=10_000):
+    """Count GC collections (per generation) and peak memory for a batch of requests."""
+    data = make_flat_reqdata(n_addresses=5)
+    gc.collect()
+    before = [gen["collections"] for gen in gc.get_stats()]
+    tracemalloc.start()
+    for _ in range(iterations):
+        form = ContactForm(data)
+        form.is_valid
+    del form
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    after = [gen["collections"] for gen in gc.get_stats()]
+    collections = [b - a for a, b in zip(before, after, strict=True)]
+    return collections, peak
+
+
 def run_all():
     """Run all workloads together for a combined profile."""
     workload_init_only()
@@ -141,6 +273,8 @@ def run_all():
     workload_large_nested()
     workload_render_html()
     workload_slug()
+    workload_url()
+    workload_dates()
     workload_parser()
 
 
@@ -172,5 +306,31 @@ if __name__ == "__main__":
     stats.sort_stats("tottime")
     stats.print_stats(30)
 
+    print("\n GC AND MEMORY PER 10K REQUESTS")
+    print("=" * 70)
+    collections, peak = measure_gc()
+    print(f"GC collections (gen0, gen1, gen2): {collections}")
+    print(f"Peak traced memory: {peak / 1024:.1f} KiB")
+
+    print("\n URL NORMALIZATION (us per value)")
+    print("=" * 70)
+    for kind, usec in benchmark_url().items():
+        print(f"{kind:>12}: {usec:.2f}")
+
+    print("\n URL WORST CASE (ms per value)")
+    print("=" * 70)
+    for (kind, size), msec in benchmark_url_worst_case().items():
+        print(f"{kind:>12} {size:>9,}: {msec:.3f}")
+
+    print("\n DATE AND TIME PARSING (us per value)")
+    print("=" * 70)
+    for kind, usec in benchmark_dates().items():
+        print(f"{kind:>16}: {usec:.2f}")
+
+    print("\n NUMBERS (us per value)")
+    print("=" * 70)
+    for kind, usec in benchmark_numbers().items():
+        print(f"{kind:>16}: {usec:.2f}")
+
     print(f"\nFull profile saved to: profile_results.prof")
     print("Visualize with: uv run snakeviz profile_results.prof")
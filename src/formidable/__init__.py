@@ -3,11 +3,14 @@ Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
 from . import errors  # noqa
+from .cache import CacheBackend, MemoryCache, SQLiteCache, cached  # noqa
 from .fields import (
+  ArrayField,  # noqa
   BooleanField,  # noqa
   BoolField,  # noqa
   DateField,  # noqa
   DateTimeField,  # noqa
+  DecimalField,  # noqa
   EmailField,  # noqa
   Field,  # noqa
   FileField,  # noqa
@@ -21,4 +24,5 @@ from .fields import (
   TimeField,  # noqa
   URLField,  # noqa
 )
-from .form import RESERVED_NAMES, Form  # noqa
+from .form import RESERVED_NAMES, ColumnsResult, Form, ValidationResult, expensive  # noqa
+from .pool import FormPool  # noqa
@@ -0,0 +1,248 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+
+Validate big CSV/JSONL files with a form class, using all the CPU cores.
+"""
+
+import array
+import csv
+import datetime
+import decimal
+import functools
+import importlib
+import itertools
+import json
+import os
+import typing as t
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+from .form import ValidationResult
+
+
+if t.TYPE_CHECKING:
+    from .form import Form
+
+
+FORMATS = ("csv", "jsonl")
+
+
+class ImportSummary(t.NamedTuple):
+    """
+    The result of `bulk_import()`.
+    """
+
+    # Number of records read.
+    total: int
+    # Number of valid records.
+    valid: int
+    # Number of invalid records.
+    invalid: int
+
+
+def get_form_ref(FormClass: "type[Form]") -> str:
+    """
+    Returns a picklable reference ("module:QualName") to a form class, that can be
+    imported back in a worker process.
+    """
+    ref = f"{FormClass.__module__}:{FormClass.__qualname__}"
+    try:
+        found = load_form_class(ref)
+    except (ImportError, AttributeError):
+        found = None
+    if found is not FormClass:
+        raise ValueError(
+            f"{FormClass.__qualname__} must be defined at the top level of a module, "
+            "so it can be imported by the worker processes"
+        )
+    return ref
+
+
+@functools.cache
+def load_form_class(ref: str) -> "type[Form]":
+    """
+    Imports a form class from a reference made by `get_form_ref()`.
+    The result is cached, so each worker process imports it only once.
+    """
+    module_name, _, qualname = ref.partition(":")
+    obj: t.Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def read_rows(path: str | Path, format: str | None = None) -> Iterator[dict[str, t.Any]]:
+    """
+    Streams the records of a CSV file (with a header row) or a JSONL file
+    (one JSON object per line) as dictionaries.
+
+    Args:
+        path:
+            Path of the file.
+        format:
+            Either "csv" or "jsonl". If `None`, it's guessed from the file extension.
+
+    """
+    format = _get_format(path, format)
+    with open(path, encoding="utf-8", newline="") as fp:
+        if format == "csv":
+            yield from csv.DictReader(fp)
+            return
+        for line in fp:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def validate_rows(
+    FormClass: "type[Form]",
+    rows: Iterable[t.Any],
+    *,
+    chunk_size: int = 1000,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[ValidationResult]:
+    """
+    Validates the records in `rows` in chunks, in a pool of worker processes.
+
+    The results are yielded in the same order as the records. At most
+    `max_pending` chunks are submitted but not yet consumed at any time, so the
+    memory use doesn't depend on the number of records.
+
+    Args:
+        FormClass:
+            The form class to validate the records with. It must be defined at the
+            top level of a module, so the worker processes can import it.
+        rows:
+            An iterable of request data records.
+        chunk_size:
+            Number of records sent to a worker at a time. Defaults to `1000`.
+        max_workers:
+            Number of worker processes. Defaults to the number of CPUs.
+            If `0`, the records are validated in this process instead.
+        max_pending:
+            Maximum number of chunks in flight. Defaults to twice the number of workers.
+
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("`chunk_size` must be a positive integer")
+
+    if max_workers == 0:
+        yield from FormClass.validate_many(rows)
+        return
+
+    form_ref = get_form_ref(FormClass)
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * max_workers
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    pending: deque[Future[list[ValidationResult]]] = deque()
+    try:
+        for chunk in _chunked(rows, chunk_size):
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_validate_chunk, form_ref, chunk))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def bulk_import(
+    FormClass: "type[Form]",
+    path: str | Path,
+    *,
+    data_path: str | Path,
+    errors_path: str | Path,
+    format: str | None = None,
+    chunk_size: int = 1000,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+) -> ImportSummary:
+    """
+    Validates all the records of a CSV or JSONL file with a form class, using a
+    pool of worker processes.
+
+    The cleaned data of the valid records is written, as soon as it's ready, to
+    `data_path`, one JSON object per line. The errors of the invalid records are
+    written to `errors_path` as `{"row": <record number>, "errors": {...}}` lines,
+    where the record number starts at 1.
+
+    Args:
+        FormClass:
+            The form class to validate the records with. It must be defined at the
+            top level of a module, so the worker processes can import it.
+        path:
+            Path of the file to import.
+        data_path:
+            Path of the JSONL file for the cleaned data.
+        errors_path:
+            Path of the JSONL file for the errors.
+        format:
+            Either "csv" or "jsonl". If `None`, it's guessed from the file extension.
+        chunk_size:
+            Number of records sent to a worker at a time. Defaults to `1000`.
+        max_workers:
+            Number of worker processes. Defaults to the number of CPUs.
+            If `0`, the records are validated in this process instead.
+        max_pending:
+            Maximum number of chunks in flight. Defaults to twice the number of workers.
+
+    """
+    format = _get_format(path, format)
+    rows = read_rows(path, format)
+    results = validate_rows(
+        FormClass,
+        rows,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        max_pending=max_pending,
+    )
+    total = valid = 0
+    with (
+        open(data_path, "w", encoding="utf-8") as data_fp,
+        open(errors_path, "w", encoding="utf-8") as errors_fp,
+    ):
+        for total, result in enumerate(results, start=1):
+            if result.valid:
+                valid += 1
+                data_fp.write(_to_json(result.data) + "\n")
+            else:
+                errors_fp.write(_to_json({"row": total, "errors": result.errors}) + "\n")
+
+    return ImportSummary(total=total, valid=valid, invalid=total - valid)
+
+
+def _chunked(rows: Iterable[t.Any], size: int) -> Iterator[list[t.Any]]:
+    it = iter(rows)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def _validate_chunk(form_ref: str, rows: Iterable[t.Any]) -> list[ValidationResult]:
+    FormClass = load_form_class(form_ref)
+    return list(FormClass.validate_many(rows))
+
+
+def _get_format(path: str | Path, format: str | None) -> str:
+    if format is None:
+        format = Path(path).suffix.lstrip(".").lower()
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format `{format}`, must be one of {FORMATS}")
+    return format
+
+
+def _json_default(value: t.Any) -> t.Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, array.array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _to_json(value: t.Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
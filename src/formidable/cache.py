@@ -0,0 +1,408 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+
+Cache the results of custom validators across requests.
+"""
+
+import datetime
+import decimal
+import functools
+import inspect
+import json
+import threading
+import time
+import typing as t
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+
+# Types of the values that can be used as cache keys. Other values (e.g.: objects
+# whose `repr()` is not stable) are always validated without the cache.
+KEY_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    uuid.UUID,
+)
+
+
+class CacheBackend:
+    """
+    Base class for the storage of cached validation results.
+
+    The keys are strings and the values are never `None`. Implementations must
+    be safe to use from multiple threads.
+    """
+
+    def get(self, key: str) -> t.Any:
+        """
+        Returns the value stored for `key`, or `None` if it's missing or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: t.Any, ttl: float | None = None) -> None:
+        """
+        Stores `value` for `key` for `ttl` seconds (forever if `ttl` is `None`).
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Removes `key`, if present.
+        """
+        raise NotImplementedError
+
+    def clear(self, prefix: str = "") -> None:
+        """
+        Removes all the keys that start with `prefix`.
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    An in-process, least-recently-used cache.
+
+    The `hits` and `misses` attributes count the results of `get()`.
+
+    Args:
+        max_size:
+            Maximum number of entries. Defaults to `1024`.
+
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("`max_size` must be a positive integer")
+        self.max_size = max_size
+        self._data: OrderedDict[str, tuple[float | None, t.Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> t.Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires, value = item
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: t.Any, ttl: float | None = None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            if not prefix:
+                self._data.clear()
+                self.hits = self.misses = 0
+                return
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                del self._data[key]
+
+
+class SQLiteCache(CacheBackend):
+    """
+    A cache stored in a SQLite database file, so it can be shared by all the
+    processes of the application running in the same machine.
+
+    The values are stored as JSON, so only the simple ones are cached: strings,
+    numbers, booleans, `None`, decimals, dates, times, UUIDs, and lists, tuples,
+    and dictionaries (with string keys) of them. Values of other types are not
+    stored. Anyone who can write to the file can change the results of your
+    validators, so keep it in a directory only your application can write to.
+
+    When there are more than `max_size` entries, the expired ones and then the
+    oldest ones are removed.
+
+    Args:
+        path:
+            Path of the database file. It's created if it doesn't exist.
+        max_size:
+            Maximum number of entries. Defaults to `10_000`.
+
+    """
+
+    # How many writes to do between checks of the size of the table.
+    PRUNE_EVERY = 64
+
+    def __init__(self, path: str | Path, *, max_size: int = 10_000):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("`max_size` must be a positive integer")
+        import sqlite3  # Slow to import and not needed by the other backends
+
+        self.path = str(path)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=5,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS formidable_cache "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM formidable_cache").fetchone()[0]
+
+    def get(self, key: str) -> t.Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM formidable_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires = row
+            if expires is not None and expires <= time.time():
+                self._conn.execute("DELETE FROM formidable_cache WHERE key = ?", (key,))
+                return None
+        try:
+            return _from_json(value)
+        except (ValueError, TypeError, KeyError):
+            return None  # Not written by this version, e.g.: an old pickled value
+
+    def set(self, key: str, value: t.Any, ttl: float | None = None) -> None:
+        try:
+            data = _to_json(value)
+        except (TypeError, ValueError):
+            return
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO formidable_cache (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                (key, data, expires),
+            )
+            self._writes += 1
+            if self._writes >= self.PRUNE_EVERY:
+                self._writes = 0
+                self._prune()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM formidable_cache WHERE key = ?", (key,))
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM formidable_cache WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _prune(self) -> None:
+        self._conn.execute(
+            "DELETE FROM formidable_cache WHERE expires <= ?", (time.time(),)
+        )
+        self._conn.execute(
+            "DELETE FROM formidable_cache WHERE rowid IN "
+            "(SELECT rowid FROM formidable_cache ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+            (self.max_size,),
+        )
+
+
+def cached(
+    ttl: float | None = 60,
+    *,
+    max_size: int = 1024,
+    backend: CacheBackend | None = None,
+) -> t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]]:
+    """
+    Decorator that caches the results of a `validate_<name>` method by value, so
+    repeated checks of the same value (e.g.: "is this username taken?") don't
+    repeat their I/O. Both the returned values and the raised `ValueError`s are
+    cached.
+
+    The validator must depend only on the value, not on the rest of the form.
+    Async validators are supported.
+
+    Args:
+        ttl:
+            Seconds to keep each result. If `None`, results never expire.
+            Defaults to `60`.
+        max_size:
+            Maximum number of results kept by the default in-process backend.
+            Defaults to `1024`.
+        backend:
+            The storage for the results, e.g.: a `SQLiteCache` shared by all the
+            processes. Defaults to a new `MemoryCache(max_size)`.
+
+    Example:
+        ```python
+        class SignUpForm(f.Form):
+            username = f.TextField()
+
+            @f.cached(ttl=30)
+            def validate_username(self, value):
+                if db.username_exists(value):
+                    raise ValueError("taken")
+                return value
+
+        # After a new user is saved
+        SignUpForm.validate_username.invalidate("juanpablo")
+        ```
+
+    The decorated method has two extra attributes: `invalidate(value)`, to remove
+    the result for a value, and `cache_clear()`, to remove all its results.
+
+    """
+    if ttl is not None and (
+        isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0
+    ):
+        raise ValueError("`ttl` must be a positive number or `None`")
+    store = backend if backend is not None else MemoryCache(max_size)
+
+    def decorator(func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        prefix = f"{func.__module__}.{func.__qualname__}:"
+
+        def get_key(value: t.Any) -> str | None:
+            if not _is_cacheable(value):
+                return None
+            return f"{prefix}{type(value).__name__}:{value!r}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: t.Any) -> t.Any:
+                key = get_key(args[-1])
+                if key is None:
+                    return await func(*args)
+                hit = store.get(key)
+                if hit is not None:
+                    return _replay(hit)
+                try:
+                    result = await func(*args)
+                except ValueError as e:
+                    store.set(key, (False, e.args), ttl)
+                    raise
+                store.set(key, (True, result), ttl)
+                return result
+
+            wrapper: t.Any = async_wrapper
+
+        else:
+
+            @functools.wraps(func)
+            def sync_wrapper(*args: t.Any) -> t.Any:
+                key = get_key(args[-1])
+                if key is None:
+                    return func(*args)
+                hit = store.get(key)
+                if hit is not None:
+                    return _replay(hit)
+                try:
+                    result = func(*args)
+                except ValueError as e:
+                    store.set(key, (False, e.args), ttl)
+                    raise
+                store.set(key, (True, result), ttl)
+                return result
+
+            wrapper = sync_wrapper
+
+        def invalidate(value: t.Any) -> None:
+            key = get_key(value)
+            if key is not None:
+                store.delete(key)
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = lambda: store.clear(prefix)
+        wrapper.cache = store
+        return wrapper
+
+    return decorator
+
+
+# Tags of the JSON objects of the values that JSON doesn't have.
+# All the objects are tagged, so a dictionary can't be mistaken for one.
+_DECODERS: dict[str, t.Callable[[t.Any], t.Any]] = {
+    "tuple": tuple,
+    "dict": dict,
+    "decimal": decimal.Decimal,
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "uuid": uuid.UUID,
+}
+
+
+def _encode(value: t.Any) -> t.Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"t": "tuple", "v": [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("Only dictionaries with string keys can be cached")
+        return {"t": "dict", "v": [[key, _encode(item)] for key, item in value.items()]}
+    if isinstance(value, decimal.Decimal):
+        return {"t": "decimal", "v": str(value)}
+    if isinstance(value, datetime.datetime):
+        return {"t": "datetime", "v": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"t": "date", "v": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"t": "time", "v": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"t": "uuid", "v": str(value)}
+    raise TypeError(f"Values of type {type(value).__name__} can't be cached")
+
+
+def _decode(obj: dict[str, t.Any]) -> t.Any:
+    return _DECODERS[obj["t"]](obj["v"])
+
+
+def _to_json(value: t.Any) -> str:
+    return json.dumps(_encode(value), separators=(",", ":"))
+
+
+def _from_json(data: t.Any) -> t.Any:
+    return json.loads(data, object_hook=_decode)
+
+
+def _is_cacheable(value: t.Any) -> bool:
+    if isinstance(value, (list, tuple)):
+        return all(_is_cacheable(item) for item in value)
+    return isinstance(value, KEY_TYPES)
+
+
+def _replay(hit: tuple[bool, t.Any]) -> t.Any:
+    ok, result = hit
+    if ok:
+        return result
+    raise ValueError(*result)
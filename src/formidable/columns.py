@@ -0,0 +1,168 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+
+Helpers for validating columns of values (all the values of a field in a batch
+of records) at once, instead of one form at a time.
+"""
+
+import typing as t
+from collections.abc import Callable, Sequence
+
+from . import errors as err
+
+
+# NumPy is optional and slow to import, so it's imported on first use.
+# `False` means "not imported yet" and `None` means "not installed".
+_np: t.Any = False
+
+
+if t.TYPE_CHECKING:
+    from .fields.base import Field
+
+
+# A constraint to check over a column: the error code and a predicate that is
+# `True` for the invalid values. The predicate is called either with a single value
+# or, when NumPy is used, with an array of values.
+Check = tuple[str, Callable[[t.Any], t.Any]]
+
+
+def get_numpy() -> t.Any:
+    """
+    Returns the `numpy` module, or `None` if it isn't installed.
+    """
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+
+def has_custom_hooks(field: "Field") -> bool:
+    """
+    Whether the form bound a custom filter or validator to the field.
+    """
+    return "_custom_filter" in field.__dict__ or "_custom_validator" in field.__dict__
+
+
+def filter_column(
+    field: "Field",
+    values: Sequence[t.Any],
+    cast: Callable[[t.Any], t.Any] | None = None,
+) -> tuple[list[t.Any], list[str | None]]:
+    """
+    Converts a column of raw values with the `filter_value()` of the field.
+    Follows the same rules as `Field.set()`, but without custom filters.
+
+    Args:
+        field:
+            The field whose rules to apply.
+        values:
+            The raw values.
+        cast:
+            An optional callable, like `int`, to try first on the whole column at once.
+            It must behave like `field.filter_value()` for non-empty values.
+
+    Returns:
+        The list of converted values and the list of error codes (`None` if there
+        is no error).
+
+    """
+    if cast is not None:
+        try:
+            return list(map(cast, values)), [None] * len(values)
+        except (ValueError, TypeError, OverflowError):
+            pass
+
+    cleaned: list[t.Any] = []
+    errors: list[str | None] = []
+    max_input_length = field.max_input_length
+    for value in values:
+        if value is None:
+            value = field.default_value
+        if (
+            max_input_length is not None
+            and isinstance(value, (str, bytes))
+            and len(value) > max_input_length
+        ):
+            cleaned.append(value)
+            errors.append(err.INPUT_TOO_LONG)
+            continue
+        if field.required and value in (None, ""):
+            cleaned.append(value)
+            errors.append(err.REQUIRED)
+            continue
+        try:
+            cleaned.append(field.filter_value(value))
+            errors.append(None)
+        except (ValueError, TypeError) as e:
+            cleaned.append(value)
+            errors.append(e.args[0] if e.args and e.args[0] in err.MESSAGES else err.INVALID)
+
+    return cleaned, errors
+
+
+def check_column(
+    values: list[t.Any],
+    errors: list[str | None],
+    checks: list[Check],
+    *,
+    dtype: str | None = None,
+) -> None:
+    """
+    Updates `errors` with the code of the first failing check of each value that
+    doesn't have an error yet and is not `None`.
+
+    If NumPy is installed and a `dtype` is given, the checks are evaluated on
+    whole arrays at once.
+    """
+    if not checks:
+        return
+
+    index = [i for i, error in enumerate(errors) if error is None and values[i] is not None]
+    if not index:
+        return
+
+    np = get_numpy() if dtype is not None else None
+    if np is not None:
+        try:
+            array = np.asarray([values[i] for i in index], dtype=dtype)
+        except (ValueError, TypeError, OverflowError):
+            array = None
+        if array is not None:
+            pending = np.ones(len(index), dtype=bool)
+            for code, fails in checks:
+                failed = pending & fails(array)
+                for pos in np.flatnonzero(failed).tolist():
+                    errors[index[pos]] = code
+                pending &= ~failed
+            return
+
+    for i in index:
+        value = values[i]
+        for code, fails in checks:
+            if fails(value):
+                errors[i] = code
+                break
+
+
+def one_of_check(one_of: t.Any) -> Check:
+    """
+    Returns a check for the `one_of` constraint that uses a hashed index of the
+    allowed values when possible.
+    """
+    allowed = list(one_of)
+    try:
+        members: t.Any = frozenset(allowed)
+    except TypeError:
+        members = allowed
+    np = get_numpy()
+
+    def fails(value: t.Any) -> t.Any:
+        if np is not None and isinstance(value, np.ndarray):
+            return ~np.isin(value, allowed)
+        return value not in members
+
+    return err.ONE_OF, fails
@@ -11,6 +11,8 @@ GTE = "gte"
 LT = "lt"
 LTE = "lte"
 MULTIPLE_OF = "multiple_of"
+PRECISION = "precision"
+SCALE = "scale"
 
 MIN_ITEMS = "min_items"
 MAX_ITEMS = "max_items"
@@ -18,6 +20,7 @@ MAX_ITEMS = "max_items"
 MIN_LENGTH = "min_length"
 MAX_LENGTH = "max_length"
 PATTERN = "pattern"
+INPUT_TOO_LONG = "input_too_long"
 
 PAST_DATE = "past_date"
 FUTURE_DATE = "future_date"
@@ -33,6 +36,8 @@ INVALID_URL = "invalid_url"
 INVALID_EMAIL = "invalid_email"
 INVALID_SLUG = "invalid_slug"
 
+TIMEOUT = "timeout"
+
 MESSAGES = {
     INVALID: "Invalid value",
     REQUIRED: "Field is required",
@@ -43,6 +48,8 @@ MESSAGES = {
     LT: "Must be less than {lt}",
     LTE: "Must be less than or equal to {lte}",
     MULTIPLE_OF: "Must be a multiple of {multiple_of}",
+    PRECISION: "Must have at most {precision} digits",
+    SCALE: "Must have at most {scale} decimal places",
 
     MIN_ITEMS: "Must have at least {min_items} items",
     MAX_ITEMS: "Must have at most {max_items} items",
@@ -50,6 +57,7 @@ MESSAGES = {
     MIN_LENGTH: "Must have at least {min_length} characters",
     MAX_LENGTH: "Must have at most {max_length} characters",
     PATTERN: "Invalid format",
+    INPUT_TOO_LONG: "Must have at most {max_input_length} characters",
 
     PAST_DATE: "Must be a date in the past",
     FUTURE_DATE: "Must be a date in the future",
@@ -63,5 +71,7 @@ MESSAGES = {
 
     INVALID_URL: "Doesn't seem to be a valid URL",
     INVALID_EMAIL: "Doesn't seem to be a valid email address",
-    INVALID_SLUG: "A valid 'slug' can only have a-z letters, numbers, underscores, or hyphens"
+    INVALID_SLUG: "A valid 'slug' can only have a-z letters, numbers, underscores, or hyphens",
+
+    TIMEOUT: "Took too long to validate, please try again",
 }
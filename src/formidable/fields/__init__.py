@@ -1,7 +1,9 @@
+from .array import ArrayField  # noqa
 from .base import Field  # noqa
 from .boolean import BooleanField, BoolField  # noqa
 from .date import DateField  # noqa
 from .datetime import DateTimeField  # noqa
+from .decimal import DecimalField  # noqa
 from .email import EmailField  # noqa
 from .file import FileField  # noqa
 from .formfield import FormField  # noqa
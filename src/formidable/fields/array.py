@@ -0,0 +1,246 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import array
+import math
+import typing as t
+from collections.abc import Iterable
+
+from .. import errors as err
+from ..columns import get_numpy
+from .list import ListField, _all_in
+
+
+# The `array` typecodes and NumPy dtypes of the supported item types.
+TYPECODES = {int: "q", float: "d"}
+DTYPES = {"q": "int64", "d": "float64"}
+
+
+class ArrayField(ListField):
+    """
+    A field for lists of numbers (IDs, coordinates, measurements, etc.), that
+    stores them in a compact `array.array` of 64-bit integers or floats instead
+    of a list of Python objects.
+
+    The values are cast straight into the array, and the range constraints are
+    checked over the whole array at once (with NumPy, if installed), so lists
+    with hundreds of thousands of numbers use a fraction of the memory and time
+    of a `ListField`.
+
+    If `strict` is `True`, any casting error will raise an exception. If `strict` is
+    `False` (the default), the error will be ignored and the value will not be added
+    to the final array.
+
+    Args:
+        type:
+            The type of the items: `int` (the default) or `float`.
+        strict:
+            Whether to enforce strict type checking. Defaults to `False`.
+        required:
+            Whether the field is required. Defaults to `True`.
+        default:
+            Default value for the field. Can be a static value or a callable.
+            Defaults to an empty array.
+        min_items:
+            Minimum number of items in the array. Defaults to None (no minimum).
+        max_items:
+            Maximum number of items in the array. Defaults to None (no maximum).
+        unique:
+            Whether to remove the repeated values, keeping the first one of each.
+            Defaults to `False`.
+        sort:
+            Whether to sort the values. Defaults to `False`.
+        gt:
+            Every value must be greater than this. Defaults to `None`.
+        gte:
+            Every value must be greater than or equal to this. Defaults to `None`.
+        lt:
+            Every value must be less than this. Defaults to `None`.
+        lte:
+            Every value must be less than or equal to this. Defaults to `None`.
+        multiple_of:
+            Every value must be a multiple of this. Defaults to `None`.
+        one_of:
+            List of values that the values must be one of. Defaults to `None`.
+        messages:
+            Dictionary of error codes to custom error message templates.
+            These override the default error messages for this specific field.
+            Example: {"required": "This field cannot be empty"}.
+
+    """
+
+    def __init__(
+        self,
+        type: type[int] | type[float] = int,
+        *,
+        strict: bool = False,
+        required: bool = True,
+        default: t.Any = None,
+        min_items: int | None = None,
+        max_items: int | None = None,
+        unique: bool = False,
+        sort: bool = False,
+        gt: int | float | None = None,
+        gte: int | float | None = None,
+        lt: int | float | None = None,
+        lte: int | float | None = None,
+        multiple_of: int | float | None = None,
+        one_of: Iterable[t.Any] | None = None,
+        messages: dict[str, str] | None = None,
+    ):
+        if type not in TYPECODES:
+            raise ValueError("`type` must be `int` or `float`")
+        self.typecode = TYPECODES[type]
+
+        for name, limit in (
+            ("gt", gt),
+            ("gte", gte),
+            ("lt", lt),
+            ("lte", lte),
+            ("multiple_of", multiple_of),
+        ):
+            if limit is not None and not isinstance(limit, (int, float)):
+                raise ValueError(f"`{name}` must be an integer or float")
+        self.gt = gt
+        self.gte = gte
+        self.lt = lt
+        self.lte = lte
+        self.multiple_of = multiple_of
+
+        if default is None:
+            default = array.array(self.typecode)
+
+        super().__init__(
+            type,
+            strict=strict,
+            required=required,
+            default=default,
+            min_items=min_items,
+            max_items=max_items,
+            unique=unique,
+            sort=sort,
+            one_of=one_of,
+            messages=messages,
+        )
+
+    def filter_value(self, items: t.Any) -> array.array:  # type:ignore
+        """
+        Convert the value to an array of numbers.
+        """
+        if isinstance(items, array.array):
+            if items.typecode == self.typecode and not (self.unique or self.sort):
+                return array.array(self.typecode, items)
+            items = items.tolist()
+        elif isinstance(items, tuple):
+            items = list(items)
+        values = super().filter_value(items)
+        if not isinstance(values, array.array):
+            values = array.array(self.typecode, values)
+        return values
+
+    def validate_value(self) -> bool:
+        """
+        Validate the field value against the defined constraints.
+        """
+        values = self.value
+        if self.min_items is not None and len(values) < self.min_items:
+            self.error = err.MIN_ITEMS
+            self.error_args = {"min_items": self.min_items}
+            return False
+
+        if self.max_items is not None and len(values) > self.max_items:
+            self.error = err.MAX_ITEMS
+            self.error_args = {"max_items": self.max_items}
+            return False
+
+        if not values:
+            return True
+
+        np = get_numpy()
+        if np is not None:
+            values = np.frombuffer(values, dtype=DTYPES[self.typecode])
+
+        # NaNs never fail a range check (like in a `FloatField`), so they are
+        # left out of the minimum and maximum
+        numbers = values
+        if self.typecode == "d":
+            if np is not None:
+                nans = np.isnan(values)
+                if nans.any():
+                    numbers = values[~nans]
+            elif any(map(math.isnan, values)):
+                numbers = [value for value in values if not math.isnan(value)]
+
+        if len(numbers):
+            if np is not None:
+                low, high = numbers.min(), numbers.max()
+            else:
+                low, high = min(numbers), max(numbers)
+            error = self._get_range_error(low, high)
+            if error is not None:
+                self.error = error
+                self.error_args = {error: getattr(self, error)}
+                return False
+
+        if self.multiple_of is not None:
+            if np is not None:
+                invalid = bool((values % self.multiple_of != 0).any())
+            else:
+                invalid = any(value % self.multiple_of != 0 for value in values)
+            if invalid:
+                self.error = err.MULTIPLE_OF
+                self.error_args = {"multiple_of": self.multiple_of}
+                return False
+
+        if self.one_of and not _all_in(self.value, self._one_of_index, self.one_of):
+            self.error = err.ONE_OF
+            self.error_args = {"one_of": self.one_of}
+            return False
+
+        return True
+
+    def _get_range_error(self, low: t.Any, high: t.Any) -> str | None:
+        if self.gt is not None and low <= self.gt:
+            return err.GT
+        if self.gte is not None and low < self.gte:
+            return err.GTE
+        if self.lt is not None and high >= self.lt:
+            return err.LT
+        if self.lte is not None and high > self.lte:
+            return err.LTE
+        return None
+
+    def _cast(self, items: list[t.Any]) -> array.array:  # type:ignore
+        try:
+            return array.array(self.typecode, map(self.type, items))
+        except Exception:
+            pass  # Cast item by item to skip or raise the invalid ones
+
+        values = array.array(self.typecode)
+        for item in items:
+            try:
+                value = self.type(item)
+            except OverflowError:
+                raise self._get_overflow_error(item) from None
+            except Exception:
+                if self.strict:
+                    raise
+                continue
+            try:
+                values.append(value)
+            except OverflowError:
+                raise self._get_overflow_error(value) from None
+
+        return values
+
+    def _get_overflow_error(self, number: t.Any) -> ValueError:
+        """
+        A valid number that doesn't fit in the array, like an integer of more than
+        64 bits, is reported as out of the range of the field, or as invalid,
+        instead of being skipped.
+        """
+        error = self._get_range_error(number, number)
+        if error is None:
+            return ValueError(err.INVALID)
+        return ValueError(error, {error: getattr(self, error)})
@@ -2,9 +2,11 @@
 Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
+import inspect
 import itertools
 import typing as t
-from collections.abc import Iterable
+import weakref
+from collections.abc import Collection, Container, Iterable, Sequence
 
 from markupsafe import Markup
 
@@ -12,7 +14,12 @@ from .. import errors as err
 
 
 if t.TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor, Future
+    from datetime import datetime
+
     from ..form import Form
+    from .lookups import Lookups
 
 
 _field_counter = itertools.count()
@@ -35,7 +42,9 @@ class Field:
 
     """
 
-    parent: "Form | None" = None
+    # Weak reference to the form that owns this field, so a discarded form
+    # can be freed by refcounting instead of waiting for the cyclic GC.
+    _parent: "weakref.ref[Form] | None" = None
     name_format: str = "{name}"
     field_name: str = ""
     default: t.Any = None
@@ -50,6 +59,28 @@ class Field:
     # Whether the value of this field is a list of values.
     multiple: bool = False
 
+    # Whether validating this field is slow and blocking (e.g.: it does network
+    # requests), so it should run in the form's executor, if there is one.
+    expensive: bool = False
+    # Pending validation running in an executor.
+    _future: "Future[tuple[bool, Field]] | None" = None
+    # Time budget, in seconds, for validating this field. Usually set
+    # with the `timeouts` option of the form `Meta`.
+    timeout: float | None = None
+    # Whether this field, or any of its sub-forms, needs a slow lookup (e.g.: a DNS
+    # query) that can be done for many fields at once before validating them.
+    _has_lookups: bool = False
+    # Whether this field, or any of its sub-forms, compares its value with the
+    # current time, and the time taken by the form when its validation started.
+    _uses_clock: bool = False
+    _now: "datetime | None" = None
+    # Maximum length of a string input. Longer inputs are rejected before any
+    # filter runs, so they can't make the field do a lot of work.
+    max_input_length: int | None = None
+    # Allowed values, and a hashed index of them, built once (see `one_of`).
+    _one_of: t.Any = None
+    _one_of_index: Container[t.Any] = ()
+
     def __init__(
         self,
         *,
@@ -77,6 +108,42 @@ class Field:
         ]
         return f"{self.__class__.__name__}({', '.join(attrs)})"
 
+    @property
+    def parent(self) -> "Form | None":
+        """
+        The form that owns this field, if any (and if it is still alive).
+        """
+        if self._parent is None:
+            return None
+        return self._parent()
+
+    @parent.setter
+    def parent(self, form: "Form | None") -> None:
+        self._parent = None if form is None else weakref.ref(form)
+
+    @property
+    def one_of(self) -> t.Any:
+        """
+        The allowed values for the field, if any.
+        """
+        return self._one_of
+
+    @one_of.setter
+    def one_of(self, values: Iterable[t.Any] | None) -> None:
+        # Build the index once, so checking a value doesn't depend on the
+        # number of allowed values.
+        if values is not None and not isinstance(values, Collection):
+            values = list(values)
+        self._one_of = values
+        if values is None:
+            self._one_of_index = ()
+            return
+        try:
+            self._one_of_index = frozenset(values)
+        except TypeError:
+            # Some values are not hashable
+            self._one_of_index = tuple(values)
+
     @property
     def name(self) -> str:
         return self.name_format.format(name=self.field_name)
@@ -108,16 +175,37 @@ class Field:
     def set_name_format(self, name_format: str):
         self.name_format = name_format
 
+    def reset(self) -> None:
+        """
+        Clears the value and errors of the field, as if it had just been created.
+        """
+        self.value = self.default_value
+        self.error = None
+        self.error_args = None
+        self._error = None
+        self._error_args = None
+        self._cancel_validation()
+
     def set(self, reqvalue: t.Any, objvalue: t.Any = None):
         self.error = None
         self.error_args = None
         self._error = None
         self._error_args = None
+        self._cancel_validation()
 
         value = objvalue if reqvalue is None else reqvalue
         if value is None:
             value = self.default_value
 
+        if (
+            self.max_input_length is not None
+            and isinstance(value, (str, bytes))
+            and len(value) > self.max_input_length
+        ):
+            self._error = err.INPUT_TOO_LONG
+            self._error_args = {"max_input_length": self.max_input_length}
+            return
+
         try:
             value = self._custom_filter(value)
         except ValueError as e:
@@ -148,20 +236,31 @@ class Field:
             f"{self.__class__.__name__}.filter_value() must be implemented"
         )
 
-    def validate(self) -> bool:
+    def validate(self, timeout: float | None = None) -> bool:
         """
         Validates the field's current value using both built-in and custom validators.
 
+        Args:
+            timeout:
+                If the validation is running in an executor, maximum number of
+                seconds to wait for it. Raises `TimeoutError` if exceeded.
+
         Returns:
             bool: True if validation passes, False if any validation fails.
 
         """
-        if self._error is not None:
-            self.error = self._error
-            self.error_args = self._error_args
-            return False
+        if self._future is not None:
+            future = self._future
+            valid, clone = future.result(timeout)
+            self._future = None
+            self.value = clone.value
+            self.error = clone.error
+            self.error_args = clone.error_args
+            return valid
+        return self._validate()
 
-        if self.error is not None:
+    def _validate(self) -> bool:
+        if not self._promote_error():
             return False
 
         self.validate_value()
@@ -170,12 +269,52 @@ class Field:
             return False
 
         try:
-            self.value = self._custom_validator(self.value)
+            value = self._custom_validator(self.value)
+        except ValueError as e:
+            self._set_validator_error(e)
+            return False
+
+        if inspect.isawaitable(value):
+            if inspect.iscoroutine(value):
+                value.close()
+            raise RuntimeError(
+                f"The validator of `{self.field_name}` is async, "
+                "use `await form.ais_valid()` instead."
+            )
+
+        self.value = value
+        return True
+
+    async def avalidate(self, limiter: "asyncio.Semaphore") -> bool:
+        """
+        Like `validate()`, but also supports async custom validators.
+
+        Args:
+            limiter:
+                Semaphore that bounds how many async validators run at the same time.
+
+        Returns:
+            bool: True if validation passes, False if any validation fails.
+
+        """
+        if not self._promote_error():
+            return False
+
+        await self.avalidate_value(limiter)
+
+        if self.error:
+            return False
+
+        try:
+            value = self._custom_validator(self.value)
+            if inspect.isawaitable(value):
+                async with limiter:
+                    value = await value
         except ValueError as e:
-            self.error = e.args[0] if e.args else err.INVALID
-            self.error_args = e.args[1] if len(e.args) > 1 else None
+            self._set_validator_error(e)
             return False
 
+        self.value = value
         return True
 
     def validate_value(self) -> bool:
@@ -189,9 +328,94 @@ class Field:
         """
         return True
 
+    def validate_column(self, values: Sequence[t.Any]) -> tuple[list[t.Any], list[t.Any]]:
+        """
+        Filters and validates a column of values, e.g.: all the values of this
+        field in a batch of records.
+
+        Subclasses can override it with a faster, column-oriented version.
+
+        Returns:
+            The list of cleaned values and the list of errors (`None` for the
+            valid values).
+
+        """
+        cleaned = []
+        errors = []
+        for value in values:
+            self.set(value)
+            self.validate()
+            cleaned.append(self.value)
+            errors.append(self.error)
+        self.reset()
+        return cleaned, errors
+
+    async def avalidate_value(self, limiter: "asyncio.Semaphore") -> bool:
+        """
+        Async version of `validate_value()`, used by `avalidate()`.
+        Only fields that contain forms need to override it.
+        """
+        return self.validate_value()
+
     def save(self) -> t.Any:
         return self.value
 
+    def _submit_validation(self, executor: "Executor") -> None:
+        """
+        If the field is expensive, starts its validation in the executor.
+        `validate()` will then wait for the result.
+        """
+        if self.expensive and self._future is None:
+            self._future = executor.submit(self._validate_copy)
+
+    def _cancel_validation(self) -> None:
+        """
+        Cancels the validation started by `_submit_validation()`, if it's still
+        pending, so its result is never used for another value.
+        """
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def _collect_lookups(self, lookups: "Lookups") -> None:
+        """
+        Adds the lookups that this field needs before being validated to `lookups`.
+        """
+
+    def _set_now(self, now: "datetime") -> None:
+        """
+        Sets the time taken by the form when its validation started, so all the
+        fields of the form and its sub-forms use the same "now".
+        """
+        self._now = now
+
+    def _validate_copy(self) -> "tuple[bool, Field]":
+        """
+        Validates a copy of the field, so a validation that runs out of time
+        can be abandoned without it changing the field later.
+        """
+        clone = self.__copy__()
+        clone._future = None
+        return clone._validate(), clone
+
+    def _promote_error(self) -> bool:
+        """
+        Promotes the pending error recorded by `set()`, if any.
+        Returns `False` if the field already has an error.
+        """
+        if self._error is not None:
+            self.error = self._error
+            self.error_args = self._error_args
+            return False
+        return self.error is None
+
+    def _set_validator_error(self, e: ValueError) -> None:
+        self.error = e.args[0] if e.args else err.INVALID
+        self.error_args = e.args[1] if len(e.args) > 1 else None
+
+    def _get_data(self) -> t.Any:
+        return self.value
+
     def _custom_filter(self, value: t.Any) -> t.Any:
         return value
 
@@ -0,0 +1,44 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import datetime
+from collections.abc import Callable
+
+
+# A function that returns the current time, as an aware datetime in UTC.
+Clock = Callable[[], datetime.datetime]
+
+
+def utcnow() -> datetime.datetime:
+    """
+    The default clock: the current time of the system, in UTC.
+    """
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def get_now(
+    clock: Clock | None,
+    now: datetime.datetime | None,
+    offset: int | float,
+) -> datetime.datetime:
+    """
+    Returns the current time for the past/future checks of a field, moved by its
+    `offset` in hours.
+
+    Args:
+        clock:
+            The clock of the field, if it has its own.
+        now:
+            The time taken by the form when its validation started, if any.
+        offset:
+            Timezone offset in hours.
+
+    """
+    if clock is not None:
+        now = clock()
+    elif now is None:
+        now = utcnow()
+    if offset:
+        now += datetime.timedelta(hours=offset)
+    return now
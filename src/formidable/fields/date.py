@@ -4,10 +4,13 @@ Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 
 import datetime
 import typing as t
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from .. import errors as err
+from ..columns import Check, check_column, filter_column, has_custom_hooks, one_of_check
 from .base import Field
+from .clock import Clock, get_now
+from .dateparse import DateParser, get_formats
 
 
 class DateField(Field):
@@ -16,7 +19,11 @@ class DateField(Field):
 
     Args:
         format:
-            The format of the date string. Defaults to '%Y-%m-%d'.
+            The `strptime()` format of the date string, or a list of formats
+            to accept, e.g.: `["%Y-%m-%d", "%d/%m/%Y"]`. The ISO formats are
+            tried first, because they are parsed much faster than the rest, and
+            the others in the given order, so with "%d/%m/%Y" before "%m/%d/%Y",
+            "03/04/2025" is always April 3. Defaults to '%Y-%m-%d'.
         required:
             Whether the field is required. Defaults to `True`.
         default:
@@ -33,6 +40,11 @@ class DateField(Field):
         offset:
             Timezone offset in hours (floats are allowed) for calculating "today" when
             `past_date` or `future_date` are used. Defaults to `0` (UTC timezone).
+        clock:
+            A function that returns the current time, as an aware datetime in UTC,
+            for the `past_date` and `future_date` checks. Defaults to the time taken
+            by the form when its validation started (see `Meta.clock`), or to the
+            system clock if the field is used without a form.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
         messages:
@@ -44,7 +56,7 @@ class DateField(Field):
 
     def __init__(
         self,
-        format="%Y-%m-%d",
+        format: str | Sequence[str] = "%Y-%m-%d",
         *,
         required: bool = True,
         default: t.Any = None,
@@ -53,11 +65,12 @@ class DateField(Field):
         past_date: bool = False,
         future_date: bool = False,
         offset: int | float = 0,
+        clock: Clock | None = None,
         one_of: Iterable[t.Any] | None = None,
         messages: dict[str, str] | None = None,
-        _utcnow: datetime.datetime | None = None,
     ):
         self.format = format
+        self._parser = DateParser(get_formats(format))
 
         if after_date and isinstance(after_date, str):
             after_date = self.filter_value(after_date)
@@ -74,8 +87,8 @@ class DateField(Field):
             raise ValueError("`offset` must be an integer or float representing hours")
         self.offset = offset
 
-        # For easier testing
-        self._utcnow = _utcnow
+        self.clock = clock
+        self._uses_clock = bool(past_date or future_date)
 
         if one_of is not None:
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
@@ -98,7 +111,7 @@ class DateField(Field):
     def filter_value(self, value: str | datetime.date | None) -> datetime.date | None:
         """
         Convert the value to a Python date.
-        The date is expected to be in the format `DateField.format`.
+        The date is expected to be in one of the formats of `DateField.format`.
         """
         if value is None or value == "":
             return None
@@ -106,7 +119,7 @@ class DateField(Field):
             return value.date()
         if isinstance(value, datetime.date):
             return value
-        return datetime.datetime.strptime(value, self.format).date()
+        return self._parser.parse(value).date()
 
     def validate_value(self) -> bool:
         """
@@ -124,9 +137,7 @@ class DateField(Field):
             self.error_args = {"before_date": self.before_date}
             return False
 
-        now = self._utcnow or datetime.datetime.now(datetime.timezone.utc)
-        if self.offset:
-            now += datetime.timedelta(hours=self.offset)
+        now = get_now(self.clock, self._now, self.offset)
         today = now.date()
 
         if self.past_date and self.value >= today:
@@ -136,9 +147,43 @@ class DateField(Field):
             self.error = err.FUTURE_DATE
             return False
 
-        if self.one_of and self.value not in self.one_of:
+        if self.one_of and self.value not in self._one_of_index:
             self.error = err.ONE_OF
             self.error_args = {"one_of": self.one_of}
             return False
 
         return True
+
+    def validate_column(self, values: Sequence[t.Any]) -> tuple[list[t.Any], list[t.Any]]:
+        """
+        Filters and validates a column of values at once.
+        """
+        if has_custom_hooks(self):
+            return super().validate_column(values)
+
+        cleaned, errors = filter_column(self, values)
+        check_column(cleaned, errors, self._get_checks())
+        return cleaned, errors
+
+    def _get_checks(self) -> list[Check]:
+        after_date, before_date = self.after_date, self.before_date
+
+        checks: list[Check] = []
+        if after_date:
+            checks.append((err.AFTER_DATE, lambda value: value <= after_date))
+        if before_date:
+            checks.append((err.BEFORE_DATE, lambda value: value >= before_date))
+
+        if self.past_date or self.future_date:
+            # "today" is calculated once for the whole column
+            now = get_now(self.clock, self._now, self.offset)
+            today = now.date()
+
+            if self.past_date:
+                checks.append((err.PAST_DATE, lambda value: value >= today))
+            if self.future_date:
+                checks.append((err.FUTURE_DATE, lambda value: value <= today))
+
+        if self.one_of:
+            checks.append(one_of_check(self.one_of))
+        return checks
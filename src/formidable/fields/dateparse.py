@@ -0,0 +1,170 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import datetime
+from collections.abc import Sequence
+
+
+# Formats that `datetime.fromisoformat()` can parse, many times faster than
+# `datetime.strptime()` (that also imports the `_strptime` module on first use).
+ISO_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+)
+
+_DIGITS = {"%Y": "0000", "%m": "00", "%d": "00", "%H": "00", "%M": "00", "%S": "00"}
+
+# The `strptime()` directives that match numbers, and the ones that match words.
+_NUMBER_DIRECTIVES = set("dmyYHIMSfjUWwuCGVg")
+_WORD_DIRECTIVES = set("aAbBp")
+
+
+class ISOShape:
+    """
+    The exact shape of the strings in an ISO format, e.g.: "0000-00-00" for
+    "%Y-%m-%d". Only the strings with that shape are parsed with
+    `datetime.fromisoformat()`, because `strptime()` also accepts things like
+    "2025-1-5", and `fromisoformat()` things like "20250105".
+    """
+
+    __slots__ = ("length", "separators", "hour")
+
+    def __init__(self, format: str):
+        shape = _get_shape(format)
+        self.length = len(shape)
+        self.separators = tuple((i, char) for i, char in enumerate(shape) if char != "0")
+        # Newer versions of `fromisoformat()` accept "24:00" as the next midnight
+        hour = format.find("%H")
+        self.hour = len(_get_shape(format[:hour])) if hour >= 0 else None
+
+    def matches(self, value: str) -> bool:
+        if len(value) != self.length or not value.isascii():
+            return False
+        for i, char in self.separators:
+            if value[i] != char:
+                return False
+        return self.hour is None or value[self.hour : self.hour + 2] != "24"
+
+
+class DateParser:
+    """
+    Parses date and datetime strings in one or more `strptime()` formats.
+
+    The ISO formats are moved ahead of the declared order and tried first, with
+    `datetime.fromisoformat()` when the string has the right shape, and then the
+    rest in the declared order.
+
+    The format that matched last is remembered and tried first next time, so
+    a list of formats costs about the same as a single one when most values use
+    the same format. A format is remembered only if none of the formats before it
+    can match the same strings (e.g.: "%m/%d/%Y" after "%d/%m/%Y" is not),
+    so the result never depends on the values parsed before.
+
+    Args:
+        formats:
+            The `strptime()` formats to try.
+
+    """
+
+    __slots__ = ("formats", "_shapes", "_memo", "_last")
+
+    def __init__(self, formats: Sequence[str]):
+        self.formats = tuple(sorted(formats, key=lambda fmt: fmt not in ISO_FORMATS))
+        self._shapes = tuple(
+            ISOShape(fmt) if fmt in ISO_FORMATS else None for fmt in self.formats
+        )
+        # Whether each format can be tried ahead of the ones before it
+        words = [_get_words(fmt) for fmt in self.formats]
+        self._memo = tuple(
+            word is not None and None not in words[:i] and word not in words[:i]
+            for i, word in enumerate(words)
+        )
+        self._last = 0
+
+    def parse(self, value: str) -> datetime.datetime:
+        """
+        Returns the datetime of the first format that matches the value, or
+        raises a `ValueError` if none does.
+        """
+        last = self._last
+        try:
+            return self._parse(value, last)
+        except ValueError:
+            if len(self.formats) == 1:
+                raise
+
+        for i in range(len(self.formats)):
+            if i == last:
+                continue
+            try:
+                result = self._parse(value, i)
+            except ValueError:
+                continue
+            if self._memo[i]:
+                self._last = i
+            return result
+
+        raise ValueError(f"{value!r} does not match any of the formats {self.formats}")
+
+    def _parse(self, value: str, i: int) -> datetime.datetime:
+        shape = self._shapes[i]
+        if shape is not None and shape.matches(value):
+            try:
+                return datetime.datetime.fromisoformat(value)
+            except ValueError:
+                pass  # Let strptime() raise its own error
+        return datetime.datetime.strptime(value, self.formats[i])
+
+
+def _get_shape(format: str) -> str:
+    for directive, digits in _DIGITS.items():
+        format = format.replace(directive, digits)
+    return format
+
+
+def _get_words(format: str) -> str | None:
+    """
+    Returns the kind of strings matched by a format, e.g.: "0/0/0" for both
+    "%d/%m/%Y" and "%m/%d/%Y", or `None` for a directive that can match anything.
+    Two formats with different kinds can never match the same string.
+    """
+    words = []
+    i = 0
+    while i < len(format):
+        char = format[i]
+        if char == "%":
+            directive = format[i + 1 : i + 2]
+            i += 2
+            if directive in _NUMBER_DIRECTIVES:
+                char = "0"
+            elif directive in _WORD_DIRECTIVES:
+                char = "a"
+            elif directive == "%":
+                char = "%"
+            else:
+                return None
+        else:
+            i += 1
+            if char.isspace():
+                char = " "
+            elif char.isdigit():
+                char = "0"
+            elif char.isalpha():
+                char = "a"
+        if not words or words[-1] != char or char not in "0a ":
+            words.append(char)
+    return "".join(words)
+
+
+def get_formats(format: str | Sequence[str]) -> tuple[str, ...]:
+    """
+    Validates the `format` argument of the date fields and returns it as a tuple.
+    """
+    formats = (format,) if isinstance(format, str) else tuple(format or ())
+    if not formats or not all(isinstance(fmt, str) for fmt in formats):
+        raise ValueError("`format` must be a string or a list of strings")
+    return formats
@@ -4,10 +4,13 @@ Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 
 import datetime
 import typing as t
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from .. import errors as err
+from ..columns import Check, check_column, filter_column, has_custom_hooks, one_of_check
 from .base import Field
+from .clock import Clock, get_now
+from .dateparse import DateParser, get_formats
 
 
 class DateTimeField(Field):
@@ -16,7 +19,11 @@ class DateTimeField(Field):
 
     Args:
         format:
-            The format of the datetime string. Defaults to '%Y-%m-%dT%H:%M:%S'.
+            The `strptime()` format of the datetime string, or a list of formats
+            to accept, e.g.: `["%Y-%m-%d", "%d/%m/%Y"]`. The ISO formats are
+            tried first, because they are parsed much faster than the rest, and
+            the others in the given order, so with "%d/%m/%Y" before "%m/%d/%Y",
+            "03/04/2025" is always April 3. Defaults to '%Y-%m-%dT%H:%M:%S'.
         required:
             Whether the field is required. Defaults to `True`.
         default:
@@ -33,6 +40,11 @@ class DateTimeField(Field):
         offset:
             Timezone offset in hours (floats are allowed) for calculating "now" when
             `past_date` or `future_date` are used. Defaults to `0` (UTC timezone).
+        clock:
+            A function that returns the current time, as an aware datetime in UTC,
+            for the `past_date` and `future_date` checks. Defaults to the time taken
+            by the form when its validation started (see `Meta.clock`), or to the
+            system clock if the field is used without a form.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
         messages:
@@ -44,7 +56,7 @@ class DateTimeField(Field):
 
     def __init__(
         self,
-        format="%Y-%m-%dT%H:%M:%S",
+        format: str | Sequence[str] = "%Y-%m-%dT%H:%M:%S",
         *,
         required: bool = True,
         default: t.Any = None,
@@ -53,11 +65,12 @@ class DateTimeField(Field):
         past_date: bool = False,
         future_date: bool = False,
         offset: int | float = 0,
+        clock: Clock | None = None,
         one_of: Iterable[t.Any] | None = None,
         messages: dict[str, str] | None = None,
-        _utcnow: datetime.datetime | None = None,
     ):
         self.format = format
+        self._parser = DateParser(get_formats(format))
 
         if after_date and isinstance(after_date, str):
             after_date = self.filter_value(after_date)
@@ -74,8 +87,8 @@ class DateTimeField(Field):
             raise ValueError("`offset` must be an integer or float representing hours")
         self.offset = offset
 
-        # For easier testing
-        self._utcnow = _utcnow
+        self.clock = clock
+        self._uses_clock = bool(past_date or future_date)
 
         if one_of is not None:
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
@@ -98,13 +111,13 @@ class DateTimeField(Field):
     def filter_value(self, value: str | datetime.datetime | None) -> datetime.datetime | None:
         """
         Convert the value to a Python datetime.
-        The datetime is expected to be in the format `DateTimeField.format`.
+        The datetime is expected to be in one of the `DateTimeField.format` formats.
         """
         if value is None or value == "":
             return None
         if isinstance(value, datetime.datetime):
             return value
-        return datetime.datetime.strptime(value, self.format)
+        return self._parser.parse(value)
 
     def validate_value(self) -> bool:
         """
@@ -122,9 +135,7 @@ class DateTimeField(Field):
             self.error_args = {"before_date": self.before_date}
             return False
 
-        now = self._utcnow or datetime.datetime.now(datetime.timezone.utc)
-        if self.offset:
-            now += datetime.timedelta(hours=self.offset)
+        now = get_now(self.clock, self._now, self.offset)
         now = now.replace(tzinfo=None)
 
         if self.past_date and self.value >= now:
@@ -134,9 +145,43 @@ class DateTimeField(Field):
             self.error = err.FUTURE_DATE
             return False
 
-        if self.one_of and self.value not in self.one_of:
+        if self.one_of and self.value not in self._one_of_index:
             self.error = err.ONE_OF
             self.error_args = {"one_of": self.one_of}
             return False
 
         return True
+
+    def validate_column(self, values: Sequence[t.Any]) -> tuple[list[t.Any], list[t.Any]]:
+        """
+        Filters and validates a column of values at once.
+        """
+        if has_custom_hooks(self):
+            return super().validate_column(values)
+
+        cleaned, errors = filter_column(self, values)
+        check_column(cleaned, errors, self._get_checks())
+        return cleaned, errors
+
+    def _get_checks(self) -> list[Check]:
+        after_date, before_date = self.after_date, self.before_date
+
+        checks: list[Check] = []
+        if after_date:
+            checks.append((err.AFTER_DATE, lambda value: value <= after_date))
+        if before_date:
+            checks.append((err.BEFORE_DATE, lambda value: value >= before_date))
+
+        if self.past_date or self.future_date:
+            # "now" is calculated once for the whole column
+            now = get_now(self.clock, self._now, self.offset)
+            now = now.replace(tzinfo=None)
+
+            if self.past_date:
+                checks.append((err.PAST_DATE, lambda value: value >= now))
+            if self.future_date:
+                checks.append((err.FUTURE_DATE, lambda value: value <= now))
+
+        if self.one_of:
+            checks.append(one_of_check(self.one_of))
+        return checks
@@ -0,0 +1,300 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import math
+import typing as t
+from collections.abc import Iterable, Sequence
+from decimal import Decimal, InvalidOperation
+
+from .. import errors as err
+from ..columns import filter_column, has_custom_hooks
+from .number import NumberField
+
+
+# Decimals with a larger (or smaller) exponent are rejected, because checking
+# them would need integers with that many digits.
+MAX_EXPONENT = 1000
+
+
+def to_decimal(value: t.Any) -> Decimal:
+    """
+    Converts a string or a number to a finite `Decimal`, or raises a `ValueError`.
+    Floats are converted from their shortest representation, so `0.1` is
+    `Decimal("0.1")` and not `Decimal("0.1000000000000000055511151231257827...")`.
+    """
+    if isinstance(value, Decimal):
+        number = value
+    elif isinstance(value, str) or (isinstance(value, int) and not isinstance(value, bool)):
+        try:
+            number = Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f"Invalid decimal {value!r}") from None
+    elif isinstance(value, float):
+        number = Decimal(repr(value))
+    else:
+        raise TypeError(f"Invalid decimal {value!r}")
+
+    if not number.is_finite() or abs(number.adjusted()) > MAX_EXPONENT:
+        raise ValueError(f"Invalid decimal {value!r}")
+    return number
+
+
+def get_places(value: Decimal) -> int:
+    """
+    Returns the number of decimal places of a `Decimal`, not counting the
+    trailing zeros.
+    """
+    _, den = value.as_integer_ratio()
+    places = 0
+    # `den` is a product of 2s and 5s, and each step removes one of each
+    while den != 1:
+        den //= math.gcd(den, 10)
+        places += 1
+    return places
+
+
+def count_digits(value: Decimal) -> int:
+    """
+    Returns the number of digits of a `Decimal`, not counting the trailing
+    zeros of the decimal places, e.g.: 3 for "12.30", and 2 for "0.05".
+    """
+    _, digits, exponent = value.as_tuple()
+    assert isinstance(exponent, int)
+    return max(max(len(digits) + exponent, 0) + get_places(value), 1)
+
+
+class DecimalField(NumberField):
+    """
+    A field that converts its input to a `decimal.Decimal`, for money and other
+    quantities that must be exact.
+
+    The value is compared with the `gt`, `gte`, `lt`, `lte`, and `multiple_of`
+    limits as an integer number of the smallest unit they use (e.g.: cents),
+    computed once when the field is created, so `multiple_of=Decimal("0.1")`
+    accepts "0.3", and the checks don't depend on the current decimal context.
+
+    Args:
+        required:
+            Whether the field is required. Defaults to `True`.
+        default:
+            Default value for the field. Can be a static value or a callable.
+            Defaults to `None`.
+        precision:
+            Maximum number of digits of the value. If `scale` is also set, the
+            digits are counted with `scale` decimal places, like in a SQL
+            `NUMERIC(precision, scale)` column. Defaults to `None` (no limit).
+        scale:
+            Maximum number of decimal places of the value, not counting the
+            trailing zeros. Defaults to `None` (no limit).
+        gt:
+            Value must be greater than this. Defaults to `None`.
+        gte:
+            Value must be greater than or equal to this. Defaults to `None`.
+        lt:
+            Value must be less than this. Defaults to `None`.
+        lte:
+            Value must be less than or equal to this. Defaults to `None`.
+        multiple_of:
+            Value must be a multiple of this. Defaults to `None`.
+        one_of:
+            List of values that the field value must be one of. Defaults to `None`.
+        locale:
+            The locale of the input, like "de" or "fr_CH", to accept numbers written
+            with its thousands and decimal separators, e.g.: "1.234,5" in German.
+            Defaults to `None`, which only accepts the Python syntax.
+        messages:
+            Dictionary of error codes to custom error message templates.
+            These override the default error messages for this specific field.
+            Example: {"required": "This field cannot be empty"}.
+
+    The limits can be integers, `Decimal`s, strings, or floats (that are read
+    by their shortest representation, so `0.1` is `Decimal("0.1")`).
+
+    """
+
+    column_cast = staticmethod(to_decimal)
+
+    def __init__(
+        self,
+        *,
+        required: bool = True,
+        default: t.Any = None,
+        precision: int | None = None,
+        scale: int | None = None,
+        gt: int | float | str | Decimal | None = None,
+        gte: int | float | str | Decimal | None = None,
+        lt: int | float | str | Decimal | None = None,
+        lte: int | float | str | Decimal | None = None,
+        multiple_of: int | float | str | Decimal | None = None,
+        one_of: Iterable[t.Any] | None = None,
+        locale: str | None = None,
+        messages: dict[str, str] | None = None,
+    ):
+        if precision is not None and (not isinstance(precision, int) or precision < 1):
+            raise ValueError("`precision` must be a positive integer")
+        self.precision = precision
+
+        if scale is not None and (not isinstance(scale, int) or scale < 0):
+            raise ValueError("`scale` must be a non-negative integer")
+        if precision is not None and scale is not None and scale > precision:
+            raise ValueError("`scale` cannot be greater than `precision`")
+        self.scale = scale
+
+        limits = {}
+        for name, limit in (
+            ("gt", gt),
+            ("gte", gte),
+            ("lt", lt),
+            ("lte", lte),
+            ("multiple_of", multiple_of),
+        ):
+            if limit is not None:
+                try:
+                    limits[name] = to_decimal(limit)
+                except (ValueError, TypeError):
+                    raise ValueError(f"`{name}` must be a number") from None
+        if limits.get("multiple_of", 1) <= 0:
+            raise ValueError("`multiple_of` must be greater than zero")
+
+        super().__init__(
+            required=required,
+            default=default,
+            one_of=one_of,
+            locale=locale,
+            messages=messages,
+        )
+        self.gt = limits.get("gt")
+        self.gte = limits.get("gte")
+        self.lt = limits.get("lt")
+        self.lte = limits.get("lte")
+        self.multiple_of = limits.get("multiple_of")
+
+        # Whether `_check()` has anything to do
+        self._has_checks = bool(limits) or precision is not None or scale is not None
+
+        # The values are checked as integers of `10 ** -units` (e.g.: cents),
+        # the smallest unit used by the scale and the limits.
+        units = max([scale or 0, *map(get_places, limits.values())])
+        self._unit = 10**units
+        # `scaled % self._scale_unit` must be zero for a value within the scale
+        self._scale_unit = 10 ** (units - scale) if scale is not None else 1
+        self._max_scaled = None
+        if precision is not None and scale is not None:
+            self._max_scaled = 10 ** (precision + units - scale)
+
+        # The limits, as *twice* the number of units. A value between two units
+        # is placed at the odd number in between, so it can be compared exactly.
+        self._gt = self._to_halves(self.gt)
+        self._gte = self._to_halves(self.gte)
+        self._lt = self._to_halves(self.lt)
+        self._lte = self._to_halves(self.lte)
+        # The lowest and highest valid positions, to check all of them at once
+        lows = [self._gt + 1] if self._gt is not None else []
+        lows += [self._gte] if self._gte is not None else []
+        highs = [self._lt - 1] if self._lt is not None else []
+        highs += [self._lte] if self._lte is not None else []
+        self._low = max(lows, default=-math.inf)
+        self._high = min(highs, default=math.inf)
+        self._multiple_of = (
+            self._to_units(self.multiple_of) if self.multiple_of is not None else 0
+        )
+
+    def filter_value(self, value: t.Any) -> Decimal | None:
+        """
+        Convert the value to a `decimal.Decimal`.
+        """
+        if value is None or value == "":
+            return None
+        if self._parse is not None:
+            return self._parse(value)
+        return to_decimal(value)
+
+    def validate_value(self) -> bool:
+        """
+        Validate the field value against the defined constraints.
+        """
+        if self.value is None:
+            return True
+
+        error = self._check(self.value) if self._has_checks else None
+        if error is not None:
+            self.error = error
+            self.error_args = {error: getattr(self, error)}
+            return False
+
+        if self.one_of and self.value not in self._one_of_index:
+            self.error = err.ONE_OF
+            self.error_args = {"one_of": self.one_of}
+            return False
+
+        return True
+
+    def validate_column(self, values: Sequence[t.Any]) -> tuple[list[t.Any], list[t.Any]]:
+        """
+        Filters and validates a column of values at once.
+        """
+        if has_custom_hooks(self):
+            return super().validate_column(values)
+
+        cleaned, errors = filter_column(self, values, cast=self._parse or self.column_cast)
+        check = self._check if self._has_checks else None
+        one_of = self._one_of_index if self.one_of else None
+        if check is None and one_of is None:
+            return cleaned, errors
+
+        for i, value in enumerate(cleaned):
+            if errors[i] is not None or value is None:
+                continue
+            error = check(value) if check is not None else None
+            if error is None and one_of is not None and value not in one_of:
+                error = err.ONE_OF
+            errors[i] = error
+        return cleaned, errors
+
+    def _check(self, value: Decimal) -> str | None:
+        """
+        Returns the code of the first constraint, other than `one_of`,
+        that the value fails, if any.
+        """
+        num, den = value.as_integer_ratio()
+        scaled, rest = divmod(num * self._unit, den)
+        if rest:
+            if self.scale is not None:
+                return err.SCALE
+            position = 2 * scaled + 1
+        else:
+            if scaled % self._scale_unit:
+                return err.SCALE
+            position = 2 * scaled
+
+        if self.precision is not None:
+            if self._max_scaled is not None:
+                if abs(scaled) >= self._max_scaled:
+                    return err.PRECISION
+            elif count_digits(value) > self.precision:
+                return err.PRECISION
+
+        if not self._low <= position <= self._high:
+            return self._get_range_error(position)
+
+        if self._multiple_of and (rest or scaled % self._multiple_of):
+            return err.MULTIPLE_OF
+
+        return None
+
+    def _get_range_error(self, position: int) -> str:
+        if self._gt is not None and position <= self._gt:
+            return err.GT
+        if self._gte is not None and position < self._gte:
+            return err.GTE
+        if self._lt is not None and position >= self._lt:
+            return err.LT
+        return err.LTE
+
+    def _to_units(self, value: Decimal) -> int:
+        num, den = value.as_integer_ratio()
+        return num * self._unit // den
+
+    def _to_halves(self, value: Decimal | None) -> int | None:
+        return None if value is None else 2 * self._to_units(value)
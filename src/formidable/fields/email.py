@@ -2,8 +2,13 @@
 Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
+import itertools
+import os
+import threading
 import typing as t
-from collections.abc import Iterable
+import weakref
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 
 try:
@@ -12,9 +17,18 @@ except ImportError:
     validate_email = None  # type: ignore
 
 from .. import errors as err
+from ..cache import MemoryCache
 from .base import Field
 
 
+if t.TYPE_CHECKING:
+    from .lookups import Lookups
+
+
+# A callable that takes a domain name and returns whether it can receive mail.
+Resolver = Callable[[str], bool]
+
+
 class EmailField(Field):
     """
     A field for normalizing and validating email addresses.
@@ -40,6 +54,12 @@ class EmailField(Field):
         check_dns:
             If `True`, DNS queries are made to check that the domain name in the email
             address (the part after the @-sign) can receive mail. Defaults to `False`.
+            The check is done on validation and makes the field "expensive", so it
+            runs in the form executor, if there is one.
+        resolver:
+            A callable that takes a domain name and returns whether it can receive
+            mail, used when `check_dns` is `True`. Defaults to `resolve_domain()`,
+            that uses the `email_validator` library.
         allow_smtputf8:
             Accept non-ASCII characters in the local part of the address
             (before the @-sign). These email addresses require that your mail
@@ -50,6 +70,9 @@ class EmailField(Field):
         strict:
             if `True`, validates that the local part of the email is at most
             64 characters long.
+        max_input_length:
+            Inputs longer than this are rejected with an "input_too_long" error
+            before being parsed. Defaults to `1024`.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
         messages:
@@ -57,8 +80,33 @@ class EmailField(Field):
             These override the default error messages for this specific field.
             Example: {"required": "This field cannot be empty"}.
 
+    The results of the normalization and of the DNS checks are cached, so repeated
+    addresses cost a dictionary lookup. The caches are shared by all the email
+    fields, and their `hits`/`misses` attributes can be used to monitor them:
+    `EmailField.normalize_cache` (failures included) and `EmailField.dns_cache`,
+    with the results by resolver and domain (see `get_dns_key()`), that expire
+    after `EmailField.dns_ttl` seconds.
+
+    Before validating a form, the domains of all its email fields with `check_dns`,
+    including those in sub-forms, are collected and the ones not in the cache are
+    resolved at the same time, in a shared pool of up to `EmailField.dns_max_workers`
+    threads, created on first use.
+    `Form.validate_many()` does the same for batches of records.
+
     """
 
+    # Normalized addresses (or "" if invalid) by options and input.
+    normalize_cache: MemoryCache = MemoryCache(max_size=4096)
+
+    # Results of the DNS checks by resolver and domain.
+    dns_cache: MemoryCache = MemoryCache(max_size=4096)
+
+    # Seconds to keep the results of the DNS checks.
+    dns_ttl: float = 300
+
+    # Maximum number of domains resolved at the same time.
+    dns_max_workers: int = 16
+
     def __init__(
         self,
         *,
@@ -67,13 +115,23 @@ class EmailField(Field):
         check_dns: bool = False,
         allow_smtputf8: bool = False,
         strict: bool = True,
+        resolver: Resolver | None = None,
+        max_input_length: int | None = 1024,
         one_of: Iterable[str] | None = None,
         messages: dict[str, str] | None = None,
     ):
         self.check_dns = check_dns
+        self.expensive = check_dns
+        self._has_lookups = check_dns
+        self.resolver = resolver or resolve_domain
         self.allow_smtputf8 = allow_smtputf8
         self.strict = strict
 
+        if max_input_length is not None:
+            if not isinstance(max_input_length, int) or max_input_length < 1:
+                raise ValueError("`max_input_length` must be a positive integer")
+            self.max_input_length = max_input_length
+
         if one_of is not None:
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
                 raise ValueError("`one_of` must be an iterable (but not a string) or `None`")
@@ -100,16 +158,24 @@ class EmailField(Field):
                 "The 'email_validator' package is required for EmailField. "
                 "Please install it with 'pip install email_validator'."
             )
-        try:
-            validated = validate_email(
-                value,
-                check_deliverability=self.check_dns,
-                allow_smtputf8=self.allow_smtputf8,
-                strict=self.strict,
-            )
-            return validated.normalized
-        except (ValueError, TypeError):
-            raise ValueError(err.INVALID_EMAIL) from None
+
+        key = f"{self.allow_smtputf8:d}{self.strict:d}:{value}"
+        normalized = self.normalize_cache.get(key)
+        if normalized is None:
+            try:
+                normalized = validate_email(
+                    value,
+                    check_deliverability=False,
+                    allow_smtputf8=self.allow_smtputf8,
+                    strict=self.strict,
+                ).normalized
+            except (ValueError, TypeError):
+                normalized = ""
+            self.normalize_cache.set(key, normalized)
+
+        if not normalized:
+            raise ValueError(err.INVALID_EMAIL)
+        return normalized
 
     def validate_value(self) -> bool:
         """
@@ -118,9 +184,141 @@ class EmailField(Field):
         if not self.value:
             return True
 
-        if self.one_of and self.value not in self.one_of:
+        if self.check_dns and not self._is_deliverable(self.value):
+            self.error = err.INVALID_EMAIL
+            return False
+
+        if self.one_of and self.value not in self._one_of_index:
             self.error = err.ONE_OF
             self.error_args = {"one_of": self.one_of}
             return False
 
         return True
+
+    def _is_deliverable(self, value: str) -> bool:
+        """
+        Checks that the domain of the address can receive mail.
+        """
+        domain = value.rpartition("@")[2]
+        key = get_dns_key(self.resolver, domain)
+        deliverable = self.dns_cache.get(key)
+        if deliverable is None:
+            deliverable = bool(self.resolver(domain))
+            self.dns_cache.set(key, deliverable, self.dns_ttl)
+        return deliverable
+
+    def _collect_lookups(self, lookups: "Lookups") -> None:
+        if self.check_dns and self.value and self.error is None and self._error is None:
+            domain = self.value.rpartition("@")[2]
+            lookups.domains.setdefault(
+                get_dns_key(self.resolver, domain), (domain, self.resolver)
+            )
+
+
+def resolve_domain(domain: str) -> bool:
+    """
+    Checks, with DNS queries, that a domain name can receive mail.
+    """
+    if validate_email is None:
+        raise ImportError(
+            "The 'email_validator' package is required for EmailField. "
+            "Please install it with 'pip install email_validator'."
+        )
+    import idna
+    from email_validator import EmailUndeliverableError
+    from email_validator.deliverability import validate_email_deliverability
+
+    try:
+        ascii_domain = idna.encode(domain, uts46=True).decode("ascii")
+        validate_email_deliverability(ascii_domain, domain)
+    except (EmailUndeliverableError, idna.IDNAError):
+        return False
+    return True
+
+
+# A unique key for each custom resolver, so the results of different resolvers
+# are cached apart. The keys are never reused, even after a resolver is freed.
+_resolver_keys: "weakref.WeakKeyDictionary[Resolver, str]" = weakref.WeakKeyDictionary()
+_strong_resolver_keys: dict[int, tuple[Resolver, str]] = {}
+_resolver_counter = itertools.count(1)
+_resolver_lock = threading.Lock()
+
+
+def get_dns_key(resolver: Resolver, domain: str) -> str:
+    """
+    Returns the key of the result of a DNS check in `EmailField.dns_cache`: the
+    domain for the default resolver, and "r<number>:<domain>" for the others.
+    """
+    if resolver is resolve_domain:
+        return domain
+    try:
+        prefix = _resolver_keys.get(resolver)
+    except TypeError:
+        # Can't be weakly referenced, so it's kept alive to keep its `id()` unique
+        prefix = _strong_resolver_keys.get(id(resolver), (None, None))[1]
+        if prefix is None:
+            with _resolver_lock:
+                prefix = _strong_resolver_keys.setdefault(
+                    id(resolver), (resolver, f"r{next(_resolver_counter)}")
+                )[1]
+        return f"{prefix}:{domain}"
+
+    if prefix is None:
+        with _resolver_lock:
+            prefix = _resolver_keys.setdefault(resolver, f"r{next(_resolver_counter)}")
+    return f"{prefix}:{domain}"
+
+
+# Shared by all the DNS prefetches, so the threads are started only once.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=EmailField.dns_max_workers,
+                    thread_name_prefix="formidable-dns",
+                )
+    return _executor
+
+
+def _reset_executor() -> None:
+    # The threads of the pool don't exist in a forked child process
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+def prefetch_domains(domains: dict[str, tuple[str, Resolver]]) -> None:
+    """
+    Resolves at the same time the domains that are not in `EmailField.dns_cache`,
+    and stores the results.
+
+    Args:
+        domains:
+            A dictionary of the `get_dns_key()` of each check, and its domain
+            and resolver.
+
+    A domain whose resolver raises an exception is left out of the cache.
+    """
+    cache = EmailField.dns_cache
+    pending = [(key, *check) for key, check in domains.items() if cache.get(key) is None]
+    # A single domain is resolved later by its field, maybe in the form executor
+    if len(pending) < 2:
+        return
+
+    executor = _get_executor()
+    futures = [
+        (key, executor.submit(resolver, domain)) for key, domain, resolver in pending
+    ]
+    for key, future in futures:
+        if future.exception() is None:
+            cache.set(key, bool(future.result()), EmailField.dns_ttl)
@@ -9,7 +9,12 @@ from .base import Field
 
 
 if t.TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from datetime import datetime
+
     from ..form import Form
+    from .lookups import Lookups
 
 
 class FormField(Field):
@@ -36,6 +41,8 @@ class FormField(Field):
     ):
         self.FormClass = FormClass
         self.form = FormClass()
+        self._has_lookups = FormClass._has_lookups
+        self._uses_clock = FormClass._uses_clock
         super().__init__(required=required, default=default)
 
     def __copy__(self):
@@ -52,6 +59,10 @@ class FormField(Field):
     def set_messages(self, messages: dict[str, str]):
         self.form._set_messages(messages)
 
+    def reset(self) -> None:
+        super().reset()
+        self.form.reset()
+
     def set(self, reqvalue: t.Any, objvalue: t.Any = None):
         self.error = None
         self.error_args = None
@@ -74,9 +85,30 @@ class FormField(Field):
             return False
         return True
 
+    async def avalidate_value(self, limiter: "asyncio.Semaphore") -> bool:
+        if not await self.form._ais_valid(limiter):
+            self.error = self.form.get_errors()
+            return False
+        return True
+
     def save(self) -> t.Any:
         return self.form.save()
 
+    def _submit_validation(self, executor: "Executor") -> None:
+        self.form._submit_validation(executor)
+
+    def _cancel_validation(self) -> None:
+        self.form._cancel_validation()
+
+    def _collect_lookups(self, lookups: "Lookups") -> None:
+        self.form._collect_lookups(lookups)
+
+    def _set_now(self, now: "datetime") -> None:
+        self.form._set_now(now)
+
+    def _get_data(self) -> t.Any:
+        return self.form._get_data()
+
     def _custom_filter(
         self,
         reqvalue: t.Any,
@@ -9,6 +9,11 @@ from .. import errors as err
 from .base import Field
 
 
+# Types that can cast the whole list at once, because calling them has no side
+# effects, so if an item fails, the list can be cast again item by item.
+FAST_TYPES = (int, float, str)
+
+
 class ListField(Field):
     """
     A field that represents a list of same-type values.
@@ -23,6 +28,9 @@ class ListField(Field):
     `False` (the default), the error will be ignored and the value will not be added
     to the final list.
 
+    The values can be made unique and/or sorted. This and the `one_of` check take
+    linear time (plus the sorting), so lists with thousands of items are fine.
+
     Args:
         type:
             A callable that is used to cast the items in the list. Defaults to `None` (no casting).
@@ -37,6 +45,12 @@ class ListField(Field):
             Minimum number of items in the list. Defaults to None (no minimum).
         max_items:
             Maximum number of items in the list. Defaults to None (no maximum).
+        unique:
+            Whether to remove the repeated values, keeping the first one of each.
+            The `min_items` and `max_items` checks use the list without them.
+            Defaults to `False`.
+        sort:
+            Whether to sort the values. Defaults to `False`.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
         messages:
@@ -58,6 +72,8 @@ class ListField(Field):
         default: t.Any = None,
         min_items: int | None = None,
         max_items: int | None = None,
+        unique: bool = False,
+        sort: bool = False,
         one_of: Iterable[t.Any] | None = None,
         messages: dict[str, str] | None = None,
     ):
@@ -72,6 +88,9 @@ class ListField(Field):
             raise ValueError("`max_items` must be a positive integer")
         self.max_items = max_items
 
+        self.unique = unique
+        self.sort = sort
+
         if one_of is not None:
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
                 raise ValueError("`one_of` must be an iterable (but not a string) or `None`")
@@ -96,7 +115,22 @@ class ListField(Field):
             items = [items]
 
         if self.type is None:
-            return items
+            values = items
+        else:
+            values = self._cast(items)
+
+        if self.unique:
+            values = _dedupe(values)
+        if self.sort:
+            values = sorted(values)
+        return values
+
+    def _cast(self, items: list[t.Any]) -> list[t.Any]:
+        if self.type in FAST_TYPES:
+            try:
+                return list(map(self.type, items))
+            except Exception:
+                pass  # Cast item by item to skip or raise the invalid ones
 
         values = []
         for item in items:
@@ -122,11 +156,31 @@ class ListField(Field):
             self.error_args = {"max_items": self.max_items}
             return False
 
-        if self.one_of:
-            for value in self.value:
-                if value not in self.one_of:
-                    self.error = err.ONE_OF
-                    self.error_args = {"one_of": self.one_of}
-                    return False
+        if self.one_of and not _all_in(self.value, self._one_of_index, self.one_of):
+            self.error = err.ONE_OF
+            self.error_args = {"one_of": self.one_of}
+            return False
 
         return True
+
+
+def _dedupe(values: list[t.Any]) -> list[t.Any]:
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:
+        # Some values are not hashable
+        unique: list[t.Any] = []
+        for value in values:
+            if value not in unique:
+                unique.append(value)
+        return unique
+
+
+def _all_in(values: list[t.Any], index: t.Any, one_of: t.Any) -> bool:
+    if isinstance(index, frozenset):
+        try:
+            return index.issuperset(values)
+        except TypeError:
+            # Some values are not hashable
+            return all(value in one_of for value in values)
+    return all(value in index for value in values)
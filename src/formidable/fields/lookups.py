@@ -0,0 +1,39 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import typing as t
+
+from .email import Resolver, prefetch_domains
+from .slug import SlugLookup, assign_unique_slugs
+
+
+if t.TYPE_CHECKING:
+    from .slug import SlugField
+
+
+class Lookups:
+    """
+    The slow lookups (DNS queries, database queries, etc.) that the fields of a
+    form and its sub-forms, or of a batch of forms, need before being validated.
+
+    They are collected from all the fields first, so each kind of lookup is done
+    once for all of them, instead of once per field.
+    """
+
+    __slots__ = ("domains", "slugs")
+
+    def __init__(self) -> None:
+        # Email domains to check, and their resolvers, by their key in the cache.
+        self.domains: dict[str, tuple[str, Resolver]] = {}
+        # Slug fields that must have a unique value, by lookup.
+        self.slugs: dict[SlugLookup, list["SlugField"]] = {}
+
+    def run(self) -> None:
+        """
+        Does all the collected lookups.
+        """
+        if self.domains:
+            prefetch_domains(self.domains)
+        for lookup, fields in self.slugs.items():
+            assign_unique_slugs(lookup, fields)
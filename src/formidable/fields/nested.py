@@ -11,7 +11,12 @@ from .base import Field
 
 
 if t.TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from datetime import datetime
+
     from ..form import Form
+    from .lookups import Lookups
 
 
 class NestedForms(Field):
@@ -45,6 +50,8 @@ class NestedForms(Field):
     ):
         self.FormClass = FormClass
         self.empty_form = FormClass()
+        self._has_lookups = FormClass._has_lookups
+        self._uses_clock = FormClass._uses_clock
 
         self.forms = []
         self.pk = getattr(self.empty_form.Meta, "pk", "id")
@@ -82,6 +89,10 @@ class NestedForms(Field):
         super().set_messages(messages)
         self.empty_form._set_messages(self.messages)
 
+    def reset(self) -> None:
+        super().reset()
+        self.forms = []
+
     def set(
         self,
         reqvalue: dict[str, t.Any] | None = None,
@@ -174,13 +185,46 @@ class NestedForms(Field):
             results.append(result)
         return results
 
+    def _submit_validation(self, executor: "Executor") -> None:
+        for form in self.forms:
+            form._submit_validation(executor)
+
+    def _cancel_validation(self) -> None:
+        for form in self.forms:
+            form._cancel_validation()
+
+    def _collect_lookups(self, lookups: "Lookups") -> None:
+        for form in self.forms:
+            form._collect_lookups(lookups)
+
+    def _set_now(self, now: "datetime") -> None:
+        for form in self.forms:
+            form._set_now(now)
+
+    def _get_data(self) -> list[t.Any]:
+        return [form._get_data() for form in self.forms if not form._deleted]
+
     def validate_value(self) -> bool:
         """
         Validate the field value against the defined constraints.
         """
+        valid = [not form.is_invalid for form in self.forms]
+        return self._check_forms(valid)
+
+    async def avalidate_value(self, limiter: "asyncio.Semaphore") -> bool:
+        """
+        Validate the field value against the defined constraints.
+        The forms are validated concurrently.
+        """
+        import asyncio  # Slow to import and not needed by sync code
+
+        valid = await asyncio.gather(*(form._ais_valid(limiter) for form in self.forms))
+        return self._check_forms(valid)
+
+    def _check_forms(self, valid: list[bool]) -> bool:
         sub_errors = {}
         for index, form in enumerate(self.forms):
-            if form.is_invalid:
+            if not valid[index]:
                 sub_errors[index] = form.get_errors()
 
         if sub_errors:
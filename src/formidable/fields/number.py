@@ -3,10 +3,12 @@ Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
 import typing as t
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 
 from .. import errors as err
+from ..columns import Check, check_column, filter_column, has_custom_hooks, one_of_check
 from .base import Field
+from .numparse import get_parser
 
 
 class NumberField(Field):
@@ -31,6 +33,10 @@ class NumberField(Field):
             Value must be a multiple of this. Defaults to `None`.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
+        locale:
+            The locale of the input, like "de" or "fr_CH", to accept numbers written
+            with its thousands and decimal separators, e.g.: "1.234,5" in German.
+            Defaults to `None`, which only accepts the Python syntax.
         messages:
             Dictionary of error codes to custom error message templates.
             These override the default error messages for this specific field.
@@ -38,6 +44,14 @@ class NumberField(Field):
 
     """
 
+    # Used by `validate_column()` to convert a whole column at once
+    # and, if NumPy is installed, to check it as an array.
+    column_cast: Callable[[t.Any], t.Any] | None = None
+    column_dtype: str | None = None
+
+    # Converts the input written in the `locale` of the field, if it has one
+    _parse: Callable[[t.Any], t.Any] | None = None
+
     def __init__(
         self,
         *,
@@ -49,6 +63,7 @@ class NumberField(Field):
         lte: int | float | None = None,
         multiple_of: int | float | None = None,
         one_of: Iterable[t.Any] | None = None,
+        locale: str | None = None,
         messages: dict[str, str] | None = None,
     ):
         if gt is not None and not isinstance(gt, (int, float)):
@@ -75,6 +90,7 @@ class NumberField(Field):
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
                 raise ValueError("`one_of` must be an iterable (but not a string) or `None`")
         self.one_of = one_of
+        self.locale = locale
 
         super().__init__(
             required=required,
@@ -114,13 +130,56 @@ class NumberField(Field):
             self.error_args = {"multiple_of": self.multiple_of}
             return False
 
-        if self.one_of and self.value not in self.one_of:
+        if self.one_of and self.value not in self._one_of_index:
             self.error = err.ONE_OF
             self.error_args = {"one_of": self.one_of}
             return False
 
         return True
 
+    @property
+    def locale(self) -> str | None:
+        return self._locale
+
+    @locale.setter
+    def locale(self, locale: str | None) -> None:
+        if locale is None:
+            self._parse = None
+        else:
+            self._parse = get_parser(locale).wrap(self.column_cast or float)
+        self._locale = locale
+
+    def validate_column(self, values: Sequence[t.Any]) -> tuple[list[t.Any], list[t.Any]]:
+        """
+        Filters and validates a column of values at once.
+        """
+        if has_custom_hooks(self):
+            return super().validate_column(values)
+
+        cast = self.column_cast if self._parse is None else self._parse
+        cleaned, errors = filter_column(self, values, cast=cast)
+        check_column(cleaned, errors, self._get_checks(), dtype=self.column_dtype)
+        return cleaned, errors
+
+    def _get_checks(self) -> list[Check]:
+        gt, gte, lt, lte = self.gt, self.gte, self.lt, self.lte
+        multiple_of = self.multiple_of
+
+        checks: list[Check] = []
+        if gt is not None:
+            checks.append((err.GT, lambda value: value <= gt))
+        if gte is not None:
+            checks.append((err.GTE, lambda value: value < gte))
+        if lt is not None:
+            checks.append((err.LT, lambda value: value >= lt))
+        if lte is not None:
+            checks.append((err.LTE, lambda value: value > lte))
+        if multiple_of is not None:
+            checks.append((err.MULTIPLE_OF, lambda value: value % multiple_of != 0))
+        if self.one_of:
+            checks.append(one_of_check(self.one_of))
+        return checks
+
 
 class FloatField(NumberField):
     """
@@ -144,6 +203,10 @@ class FloatField(NumberField):
             Value must be a multiple of this. Defaults to `None`.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
+        locale:
+            The locale of the input, like "de" or "fr_CH", to accept numbers written
+            with its thousands and decimal separators, e.g.: "1.234,5" in German.
+            Defaults to `None`, which only accepts the Python syntax.
         messages:
             Dictionary of error codes to custom error message templates.
             These override the default error messages for this specific field.
@@ -151,12 +214,17 @@ class FloatField(NumberField):
 
     """
 
+    column_cast = float
+    column_dtype = "float64"
+
     def filter_value(self, value: str | int | float | None) -> float | None:
         """
         Convert the value to a Python float type.
         """
         if value is None or value == "":
             return None
+        if self._parse is not None:
+            return self._parse(value)
         return float(value)
 
 
@@ -182,6 +250,10 @@ class IntegerField(NumberField):
             Value must be a multiple of this. Defaults to `None`.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
+        locale:
+            The locale of the input, like "de" or "fr_CH", to accept numbers written
+            with its thousands and decimal separators, e.g.: "1.234,5" in German.
+            Defaults to `None`, which only accepts the Python syntax.
         messages:
             Dictionary of error codes to custom error message templates.
             These override the default error messages for this specific field.
@@ -189,10 +261,15 @@ class IntegerField(NumberField):
 
     """
 
+    column_cast = int
+    column_dtype = "int64"
+
     def filter_value(self, value: str | int | float | None) -> int | None:
         """
         Convert the value to a Python integer type.
         """
         if value is None or value == "":
             return None
+        if self._parse is not None:
+            return self._parse(value)
         return int(value)
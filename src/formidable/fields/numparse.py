@@ -0,0 +1,145 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import functools
+import typing as t
+from collections.abc import Callable
+
+
+# The spaces used as thousands separators: regular, no-break, and narrow no-break.
+SPACES = " \u00a0\u202f"
+
+# The grouping (thousands) separators and the decimal separator of each language
+# or locale. The locales that are not listed use the ones of their language.
+SEPARATORS: dict[str, tuple[str, str]] = {
+    "en": (",", "."),
+    "ja": (",", "."),
+    "ko": (",", "."),
+    "zh": (",", "."),
+    "he": (",", "."),
+    "th": (",", "."),
+    "es_mx": (",", "."),
+    "de": (".", ","),
+    "es": (".", ","),
+    "it": (".", ","),
+    "nl": (".", ","),
+    "pt": (".", ","),
+    "da": (".", ","),
+    "el": (".", ","),
+    "id": (".", ","),
+    "ro": (".", ","),
+    "tr": (".", ","),
+    "fr": (SPACES, ","),
+    "bg": (SPACES, ","),
+    "cs": (SPACES, ","),
+    "fi": (SPACES, ","),
+    "hu": (SPACES, ","),
+    "nb": (SPACES, ","),
+    "no": (SPACES, ","),
+    "pl": (SPACES, ","),
+    "ru": (SPACES, ","),
+    "sk": (SPACES, ","),
+    "sv": (SPACES, ","),
+    "uk": (SPACES, ","),
+    "pt_pt": (SPACES, ","),
+    "de_ch": ("'’", "."),
+    "fr_ch": ("'’", "."),
+    "it_ch": ("'’", "."),
+}
+
+
+class NumberParser:
+    """
+    Normalizes the numbers written with the separators of a locale, e.g.:
+    "1.234,5" to "1234.5" in German, so they can be converted by `int()`,
+    `float()`, or `Decimal()`.
+
+    The thousands separators are removed only if they split the integer part in
+    groups of three digits, so an ambiguous value like "1.5" is rejected in German
+    instead of being read as 15.
+
+    Args:
+        group:
+            The thousands separator, or a string with all the accepted ones.
+        decimal:
+            The decimal separator.
+
+    """
+
+    __slots__ = ("group", "decimal", "_chars", "_table", "_cast_first")
+
+    def __init__(self, group: str, decimal: str):
+        self.group = group
+        self.decimal = decimal
+        # The characters that make a value need normalizing.
+        # Any other value is passed to the conversion function unchanged.
+        self._chars = group if decimal == "." else group + decimal
+        self._table = str.maketrans(dict.fromkeys(group, "\x00"))
+        # Unless "." is a thousands separator, a value that Python can convert
+        # as it is, is read the same in the locale, so it can be tried first.
+        self._cast_first = "." not in group
+
+    def normalize(self, value: str) -> str:
+        """
+        Returns the value with the separators of the locale replaced by the ones
+        understood by Python, or raises a `ValueError` if they are misplaced.
+        """
+        for char in self._chars:
+            if char in value:
+                break
+        else:
+            return value
+
+        number, point, fraction = value.strip().partition(self.decimal)
+        if self.decimal in fraction or fraction.translate(self._table) != fraction:
+            raise ValueError(f"Invalid number {value!r}")
+
+        groups = number.translate(self._table).split("\x00")
+        if len(groups) > 1:
+            if not (
+                1 <= len(groups[0].lstrip("+-")) <= 3
+                and all(len(group) == 3 for group in groups[1:])
+            ):
+                raise ValueError(f"Invalid number {value!r}")
+            number = "".join(groups)
+
+        return f"{number}.{fraction}" if point else number
+
+    def wrap(self, cast: Callable[[t.Any], t.Any]) -> Callable[[t.Any], t.Any]:
+        """
+        Returns a function that converts the values with `cast`, normalizing the
+        strings first if needed.
+        """
+        normalize = self.normalize
+
+        if self._cast_first:
+
+            def parse(value: t.Any) -> t.Any:
+                try:
+                    return cast(value)
+                except ValueError:
+                    if not isinstance(value, str):
+                        raise
+                return cast(normalize(value))
+
+        else:
+
+            def parse(value: t.Any) -> t.Any:
+                if isinstance(value, str) and not value.isdigit():
+                    value = normalize(value)
+                return cast(value)
+
+        return parse
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser(locale: str) -> NumberParser:
+    """
+    Returns the (cached) parser of a locale, like "de", "de_DE", or "pt-BR".
+    """
+    code = locale.split(".")[0].split("@")[0].replace("-", "_").lower()
+    separators = SEPARATORS.get(code) or SEPARATORS.get(code.split("_")[0])
+    if separators is None:
+        raise ValueError(f"Unsupported locale {locale!r}")
+    return NumberParser(*separators)
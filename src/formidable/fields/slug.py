@@ -2,325 +2,81 @@
 Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
+import functools
 import re
 import typing as t
 import unicodedata
+from collections import Counter
 from collections.abc import Callable, Iterable
 
+from .. import errors as err
 from .text import TextField
 
 
-CHAR_MAP = {
-    "à": "a",
-    "á": "a",
-    "â": "a",
-    "ã": "a",
-    "ä": "ae",
-    "ā": "a",
-    "ǎ": "a",
-    "ą": "a",
-    "ă": "a",
-    "å": "a",
-    "æ": "ae",
-    "ç": "c",
-    "ć": "c",
-    "č": "c",
-    "ĉ": "c",
-    "ċ": "c",
-    "ď": "d",
-    "đ": "d",
-    "è": "e",
-    "é": "e",
-    "ê": "e",
-    "ë": "e",
-    "ē": "e",
-    "ę": "e",
-    "ě": "e",
-    "ĕ": "e",
-    "ė": "e",
-    "ƒ": "f",
-    "ĝ": "g",
-    "ğ": "g",
-    "ġ": "g",
-    "ģ": "g",
-    "ĥ": "h",
-    "ħ": "h",
-    "ì": "i",
-    "í": "i",
-    "î": "i",
-    "ï": "i",
-    "ī": "i",
-    "ĩ": "i",
-    "ĭ": "i",
-    "į": "i",
-    "ı": "i",
-    "ĳ": "ij",
-    "ĵ": "j",
-    "ķ": "k",
-    "ĸ": "k",
-    "ł": "l",
-    "ľ": "l",
-    "ĺ": "l",
-    "ļ": "l",
-    "ŀ": "l",
-    "ñ": "n",
-    "ń": "n",
-    "ň": "n",
-    "ņ": "n",
-    "ŉ": "n",
-    "ŋ": "n",
-    "ò": "o",
-    "ó": "o",
-    "ô": "o",
-    "õ": "o",
-    "ǒ": "o",
-    "ö": "oe",
-    "ø": "o",
-    "ō": "o",
-    "ő": "o",
-    "ŏ": "o",
-    "œ": "oe",
-    "ŕ": "r",
-    "ř": "r",
-    "ŗ": "r",
-    "ś": "s",
-    "š": "s",
-    "ť": "t",
-    "ù": "u",
-    "ú": "u",
-    "û": "u",
-    "ü": "ue",
-    "ū": "u",
-    "ů": "u",
-    "ű": "u",
-    "ŭ": "u",
-    "ũ": "u",
-    "ų": "u",
-    "ŵ": "w",
-    "ÿ": "y",
-    "ý": "y",
-    "ŷ": "y",
-    "ż": "z",
-    "ź": "z",
-    "ž": "z",
-    "ß": "ss",
-    "ſ": "s",
-    "α": "a",
-    "ά": "a",
-    "ἀ": "a",
-    "ἁ": "a",
-    "ἂ": "a",
-    "ἃ": "a",
-    "ἄ": "a",
-    "ἅ": "a",
-    "ἆ": "a",
-    "ἇ": "a",
-    "ᾀ": "a",
-    "ᾁ": "a",
-    "ᾂ": "a",
-    "ᾃ": "a",
-    "ᾄ": "a",
-    "ᾅ": "a",
-    "ᾆ": "a",
-    "ᾇ": "a",
-    "ὰ": "a",
-    "ά": "a",
-    "ᾰ": "a",
-    "ᾱ": "a",
-    "ᾲ": "a",
-    "ᾳ": "a",
-    "ᾴ": "a",
-    "ᾶ": "a",
-    "ᾷ": "a",
-    "β": "b",
-    "γ": "g",
-    "δ": "d",
-    "ε": "e",
-    "έ": "e",
-    "ἐ": "e",
-    "ἑ": "e",
-    "ἒ": "e",
-    "ἓ": "e",
-    "ἔ": "e",
-    "ἕ": "e",
-    "ὲ": "e",
-    "έ": "e",
-    "ζ": "z",
-    "η": "i",
-    "ή": "i",
-    "ἠ": "i",
-    "ἡ": "i",
-    "ἢ": "i",
-    "ἣ": "i",
-    "ἤ": "i",
-    "ἥ": "i",
-    "ἦ": "i",
-    "ἧ": "i",
-    "ᾐ": "i",
-    "ᾑ": "i",
-    "ᾒ": "i",
-    "ᾓ": "i",
-    "ᾔ": "i",
-    "ᾕ": "i",
-    "ᾖ": "i",
-    "ᾗ": "i",
-    "ὴ": "i",
-    "ή": "i",
-    "ῂ": "i",
-    "ῃ": "i",
-    "ῄ": "i",
-    "ῆ": "i",
-    "ῇ": "i",
-    "ι": "i",
-    "ί": "i",
-    "ϊ": "i",
-    "ΐ": "i",
-    "ἰ": "i",
-    "ἱ": "i",
-    "ἲ": "i",
-    "ἳ": "i",
-    "ἴ": "i",
-    "ἵ": "i",
-    "ἶ": "i",
-    "ἷ": "i",
-    "ὶ": "i",
-    "ί": "i",
-    "ῐ": "i",
-    "ῑ": "i",
-    "ῒ": "i",
-    "ΐ": "i",
-    "ῖ": "i",
-    "ῗ": "i",
-    "κ": "k",
-    "θ": "th",
-    "λ": "l",
-    "μ": "m",
-    "ν": "n",
-    "ξ": "ks",
-    "ο": "o",
-    "ό": "o",
-    "ὀ": "o",
-    "ὁ": "o",
-    "ὂ": "o",
-    "ὃ": "o",
-    "ὄ": "o",
-    "ὅ": "o",
-    "ὸ": "o",
-    "ό": "o",
-    "π": "p",
-    "ρ": "r",
-    "ῤ": "r",
-    "ῥ": "r",
-    "σ": "s",
-    "ς": "s",
-    "τ": "t",
-    "υ": "y",
-    "ύ": "y",
-    "ϋ": "y",
-    "ΰ": "y",
-    "ὐ": "y",
-    "ὑ": "y",
-    "ὒ": "y",
-    "ὓ": "y",
-    "ὔ": "y",
-    "ὕ": "y",
-    "ὖ": "y",
-    "ὗ": "y",
-    "ὺ": "y",
-    "ύ": "y",
-    "ῠ": "y",
-    "ῡ": "y",
-    "ῢ": "y",
-    "ΰ": "y",
-    "ῦ": "y",
-    "ῧ": "y",
-    "φ": "f",
-    "χ": "x",
-    "ψ": "ps",
-    "ω": "o",
-    "ώ": "o",
-    "ὠ": "o",
-    "ὡ": "o",
-    "ὢ": "o",
-    "ὣ": "o",
-    "ὤ": "o",
-    "ὥ": "o",
-    "ὦ": "o",
-    "ὧ": "o",
-    "ᾠ": "o",
-    "ᾡ": "o",
-    "ᾢ": "o",
-    "ᾣ": "o",
-    "ᾤ": "o",
-    "ᾥ": "o",
-    "ᾦ": "o",
-    "ᾧ": "o",
-    "ὼ": "o",
-    "ώ": "o",
-    "ῲ": "o",
-    "ῳ": "o",
-    "ῴ": "o",
-    "ῶ": "o",
-    "ῷ": "o",
-    "ð": "d",
-    "Ð": "D",
-    "þ": "th",
-    "Þ": "TH",
-    "ა": "a",
-    "ბ": "b",
-    "გ": "g",
-    "დ": "d",
-    "ე": "e",
-    "ვ": "v",
-    "ზ": "z",
-    "თ": "t",
-    "ი": "i",
-    "კ": "k",
-    "ლ": "l",
-    "მ": "m",
-    "ნ": "n",
-    "ო": "o",
-    "პ": "p",
-    "ჟ": "zh",
-    "რ": "r",
-    "ს": "s",
-    "ტ": "t",
-    "უ": "u",
-    "ფ": "p",
-    "ქ": "k",
-    "ღ": "gh",
-    "ყ": "q",
-    "შ": "sh",
-    "ჩ": "ch",
-    "ც": "ts",
-    "ძ": "dz",
-    "წ": "ts",
-    "ჭ": "ch",
-    "ხ": "kh",
-    "ჯ": "j",
-    "ჰ": "h",
-}
+if t.TYPE_CHECKING:
+    from .lookups import Lookups
 
 
+# A callable that takes a list of candidate slugs and returns the ones that are
+# already taken, e.g.: with a single `SELECT slug FROM pages WHERE slug IN (...)`.
+SlugLookup = Callable[[list[str]], Iterable[str]]
+
+# Number of candidates of each slug checked in the first lookup. It doubles for
+# each new lookup, up to `UNIQUE_MAX_CANDIDATES`.
+UNIQUE_CANDIDATES = 10
+UNIQUE_MAX_CANDIDATES = 1000
+# Maximum number of lookups before giving up.
+UNIQUE_MAX_LOOKUPS = 20
+
 _rx_non_word = re.compile(r"[^\w\s-]")
 _rx_sep = re.compile(r"[-\s]+")
+# A string that `slugify()` would return unchanged
+_rx_slug = re.compile(r"[a-z0-9]+(?:(?:_|-(?!-))+[a-z0-9]+)*")
+
+# The transliteration table is only needed for non-ASCII values, so it's
+# imported on first use. `None` means "not imported yet".
+_translate_table: dict[int, str] | None = None
+
+
+def get_translate_table() -> dict[int, str]:
+    """
+    Returns the transliteration table used by `slugify()` for `str.translate()`.
+
+    Call it before forking worker processes to load the table only once.
+    """
+    global _translate_table
+    if _translate_table is None:
+        from .slug_table import TABLE
 
-# Pre-built translation table for str.translate() — much faster than
-# iterating char-by-char with CHAR_MAP.get() in Python.
-_TRANSLATE_TABLE = str.maketrans(
-    {ord(k): v for k, v in CHAR_MAP.items()}
-)
+        _translate_table = TABLE
+    return _translate_table
+
+
+def __getattr__(name: str) -> t.Any:
+    # `CHAR_MAP` is built on demand for backwards compatibility
+    if name == "CHAR_MAP":
+        from .slug_table import CHARS
+
+        return {char: repl for repl, chars in CHARS.items() for char in chars}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def slugify(value: str) -> str:
     """
     A very simple function to convert a string to a slug.
     """
-    value = unicodedata.normalize("NFKC", value).lower()
-    # Replace some non-ASCII characters
-    value = value.translate(_TRANSLATE_TABLE)
-    # Remove any remaining non-ASCII characters
-    value = value.encode("ascii", "ignore").decode("ascii")
+    if value.isascii():
+        # Already a slug, the common case when editing
+        if _rx_slug.fullmatch(value):
+            return value
+        # The Unicode normalization and transliteration don't change ASCII text
+        value = value.lower()
+    else:
+        value = unicodedata.normalize("NFKC", value).lower()
+        # Replace some non-ASCII characters
+        value = value.translate(_translate_table or get_translate_table())
+        # Remove any remaining non-ASCII characters
+        value = value.encode("ascii", "ignore").decode("ascii")
     # Replace non-word characters with hyphens
     value = _rx_non_word.sub("", value)
     # Replace whitespace and hyphens with a single hyphen
@@ -347,6 +103,21 @@ class SlugField(TextField):
         slugify:
             Optional callable that replaces the default slugify function.
             It should take a string and return a slugified version of it.
+        cache_size:
+            If greater than zero, the results of the slugify function for the
+            last `cache_size` different values are remembered, so repeated titles
+            are not processed again. The cache is shared by all the copies of the
+            field in the forms. Defaults to `0` (no cache).
+        max_input_length:
+            Inputs longer than this are rejected with an "input_too_long" error
+            before being slugified. Defaults to `4096`.
+        unique:
+            Optional callable to make the slug unique. It takes a list of candidate
+            slugs (e.g.: "hello", "hello-2", "hello-3", etc.) and returns the ones
+            that are already taken. On validation, the value is replaced by the first
+            free candidate. The slugs of all the fields with the same `unique`
+            callable in a form, its sub-forms, or a batch of `validate_many()`, are
+            checked together, with one call. Defaults to `None`.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
         messages:
@@ -362,18 +133,44 @@ class SlugField(TextField):
         required: bool = True,
         default: t.Any = None,
         slugify: Callable[[str], str] = slugify,
+        cache_size: int = 0,
+        max_input_length: int | None = 4096,
+        unique: SlugLookup | None = None,
         one_of: Iterable[str] | None = None,
         messages: dict[str, str] | None = None,
     ):
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise ValueError("`cache_size` must be a positive integer or zero")
+        if cache_size:
+            slugify = functools.lru_cache(maxsize=cache_size)(slugify)
         self.slugify = slugify
+        self.unique = unique
+        self.expensive = unique is not None
+        self._has_lookups = unique is not None
         super().__init__(
             required=required,
             default=default,
             strip=True,
+            max_input_length=max_input_length,
             one_of=one_of,
             messages=messages,
         )
 
+    # The current slug of the object being edited, that is not a collision.
+    _own_slug: t.Any = None
+    # Whether the value was already made unique.
+    _is_unique: bool = False
+
+    def reset(self) -> None:
+        super().reset()
+        self._own_slug = None
+        self._is_unique = False
+
+    def set(self, reqvalue: t.Any, objvalue: t.Any = None):
+        super().set(reqvalue, objvalue)
+        self._own_slug = objvalue
+        self._is_unique = False
+
     def filter_value(self, value: str | None) -> str:
         """
         Convert the value to a slugified string.
@@ -381,3 +178,84 @@ class SlugField(TextField):
         if value is None:
             return ""
         return self.slugify(value)
+
+    def validate_value(self) -> bool:
+        """
+        Validate the field value against the defined constraints.
+        """
+        if self.unique is not None and self.value and not self._is_unique:
+            assign_unique_slugs(self.unique, [self])
+            if self.error:
+                return False
+        return super().validate_value()
+
+    def _collect_lookups(self, lookups: "Lookups") -> None:
+        if (
+            self.unique is not None
+            and self.value
+            and not self._is_unique
+            and self.error is None
+            and self._error is None
+        ):
+            lookups.slugs.setdefault(self.unique, []).append(self)
+
+
+def assign_unique_slugs(lookup: SlugLookup, fields: list[SlugField]) -> None:
+    """
+    Makes the values of the slug fields unique, among them and for the `lookup`,
+    by adding to them the first free suffix: "-2", "-3", etc. The fields are
+    processed in order, so the result only depends on the taken slugs.
+
+    The candidates for all the fields are checked with a single call to `lookup`.
+    If none of them is free, more are checked, up to `UNIQUE_MAX_LOOKUPS` calls.
+    The fields for which no free slug was found get an "invalid" error.
+    """
+    used: set[str] = set()
+    pending = []
+    for field in fields:
+        # Keeping its own slug is not a collision
+        if field.value == field._own_slug and field.value not in used:
+            used.add(field.value)
+            field._is_unique = True
+        else:
+            pending.append(field)
+
+    next_num: dict[str, int] = {}
+    size = UNIQUE_CANDIDATES
+    for _ in range(UNIQUE_MAX_LOOKUPS):
+        if not pending:
+            return
+        # Enough candidates for all the fields with the same slug
+        numbers = {}
+        for base, count in Counter(field.value for field in pending).items():
+            start = next_num.get(base, 1)
+            next_num[base] = start + size + count - 1
+            numbers[base] = range(start, next_num[base])
+        candidates = [
+            _get_candidate(base, num) for base, nums in numbers.items() for num in nums
+        ]
+        taken = set(lookup(candidates))
+        taken.update(used)
+
+        missing = []
+        for field in pending:
+            for num in numbers[field.value]:
+                slug = _get_candidate(field.value, num)
+                if slug not in taken:
+                    taken.add(slug)
+                    used.add(slug)
+                    field.value = slug
+                    field._is_unique = True
+                    break
+            else:
+                missing.append(field)
+
+        pending = missing
+        size = min(size * 2, UNIQUE_MAX_CANDIDATES)
+
+    for field in pending:
+        field.error = err.INVALID
+
+
+def _get_candidate(base: str, num: int) -> str:
+    return base if num == 1 else f"{base}-{num}"
@@ -0,0 +1,56 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+
+Transliteration table for `slugify()`. It's only imported the first time a
+non-ASCII value is slugified.
+"""
+
+# The ASCII replacement and all the characters replaced by it.
+CHARS = {
+    "a": "àáâãāǎąăåαάἀἁἂἃἄἅἆἇᾀᾁᾂᾃᾄᾅᾆᾇὰάᾰᾱᾲᾳᾴᾶᾷა",
+    "ae": "äæ",
+    "b": "βბ",
+    "c": "çćčĉċ",
+    "ch": "ჩჭ",
+    "D": "Ð",
+    "d": "ďđδðდ",
+    "dz": "ძ",
+    "e": "èéêëēęěĕėεέἐἑἒἓἔἕὲέე",
+    "f": "ƒφ",
+    "g": "ĝğġģγგ",
+    "gh": "ღ",
+    "h": "ĥħჰ",
+    "i": "ìíîïīĩĭįıηήἠἡἢἣἤἥἦἧᾐᾑᾒᾓᾔᾕᾖᾗὴήῂῃῄῆῇιίϊΐἰἱἲἳἴἵἶἷὶίῐῑῒΐῖῗი",
+    "ij": "ĳ",
+    "j": "ĵჯ",
+    "k": "ķĸκკქ",
+    "kh": "ხ",
+    "ks": "ξ",
+    "l": "łľĺļŀλლ",
+    "m": "μმ",
+    "n": "ñńňņŉŋνნ",
+    "o": "òóôõǒøōőŏοόὀὁὂὃὄὅὸόωώὠὡὢὣὤὥὦὧᾠᾡᾢᾣᾤᾥᾦᾧὼώῲῳῴῶῷო",
+    "oe": "öœ",
+    "p": "πპფ",
+    "ps": "ψ",
+    "q": "ყ",
+    "r": "ŕřŗρῤῥრ",
+    "s": "śšſσςს",
+    "sh": "შ",
+    "ss": "ß",
+    "t": "ťτთტ",
+    "TH": "Þ",
+    "th": "θþ",
+    "ts": "ცწ",
+    "u": "ùúûūůűŭũųუ",
+    "ue": "ü",
+    "v": "ვ",
+    "w": "ŵ",
+    "x": "χ",
+    "y": "ÿýŷυύϋΰὐὑὒὓὔὕὖὗὺύῠῡῢΰῦῧ",
+    "z": "żźžζზ",
+    "zh": "ჟ",
+}
+
+# Table for `str.translate()`.
+TABLE = {ord(char): repl for repl, chars in CHARS.items() for char in chars}
@@ -27,6 +27,11 @@ class TextField(Field):
             Minimum length of the text. Defaults to `None` (no minimum).
         max_length:
             Maximum length of the text. Defaults to `None` (no maximum).
+        max_input_length:
+            Inputs longer than this are rejected with an "input_too_long" error
+            before being processed at all. Defaults to four times `max_length`,
+            to leave room for whitespace, or to `None` (no maximum) if there
+            is no `max_length`.
         pattern:
             A regex pattern string that the text must match
             (e.g., r"^[A-Za-z]+$" for letters only). Defaults to `None`.
@@ -47,6 +52,7 @@ class TextField(Field):
         strip: bool = True,
         min_length: int | None = None,
         max_length: int | None = None,
+        max_input_length: int | None = None,
         pattern: str | None = None,
         one_of: Iterable[str] | None = None,
         messages: dict[str, str] | None = None,
@@ -61,12 +67,21 @@ class TextField(Field):
             raise ValueError("`max_length` must be an integer")
         self.max_length = max_length
 
+        if max_input_length is None and max_length is not None:
+            max_input_length = 4 * max(max_length, 1)
+        if max_input_length is not None:
+            if not isinstance(max_input_length, int) or max_input_length < 1:
+                raise ValueError("`max_input_length` must be a positive integer")
+            self.max_input_length = max_input_length
+
+        rx_pattern = None
         if pattern is not None:
             try:
-                re.compile(pattern)
+                rx_pattern = re.compile(pattern)
             except (TypeError, ValueError, re.error) as e:
                 raise ValueError("Invalid regex pattern") from e
         self.pattern = pattern
+        self.rx_pattern = rx_pattern
 
         if one_of is not None:
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
@@ -109,12 +124,12 @@ class TextField(Field):
             self.error_args = {"max_length": self.max_length}
             return False
 
-        if self.pattern and not re.match(self.pattern, self.value):
+        if self.rx_pattern is not None and not self.rx_pattern.match(self.value):
             self.error = err.PATTERN
             self.error_args = {"pattern": self.pattern}
             return False
 
-        if self.one_of and self.value not in self.one_of:
+        if self.one_of and self.value not in self._one_of_index:
             self.error = err.ONE_OF
             self.error_args = {"one_of": self.one_of}
             return False
@@ -3,12 +3,59 @@ Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
 import datetime
-import re
 import typing as t
 from collections.abc import Iterable
 
 from .. import errors as err
 from .base import Field
+from .clock import Clock, get_now
+
+
+def parse_time(value: str) -> datetime.time | None:
+    """
+    Parses a time like "14", "14:30", "14:30:15", "2pm", "2:30 PM" or "2:30:15 pm".
+    Returns `None` if the value is not in one of those formats or it's not a
+    valid time.
+
+    The hours can have one or two digits (up to "29", so "25" is not a valid
+    time instead of an invalid format), and the minutes and seconds must have
+    two. "12 am" is midnight, and hours after 12 are kept as they are ("13 pm"
+    is 13:00).
+    """
+    # Split the AM/PM suffix, that can be separated by spaces
+    tt = value[-2:].lower()
+    if tt == "am" or tt == "pm":
+        value = value[:-2].rstrip()
+    else:
+        tt = ""
+
+    parts = value.split(":")
+    if len(parts) > 3:
+        return None
+    hour = parts[0]
+    if not (
+        hour.isascii()
+        and hour.isdigit()
+        and (len(hour) == 1 or (len(hour) == 2 and hour[0] <= "2"))
+    ):
+        return None
+    for part in parts[1:]:
+        if not (len(part) == 2 and part.isascii() and part.isdigit() and part[0] <= "5"):
+            return None
+
+    h = int(hour)
+    if tt == "pm" and h < 12:
+        h += 12
+    elif tt == "am" and h == 12:
+        h = 0
+    try:
+        return datetime.time(
+            h,
+            int(parts[1]) if len(parts) > 1 else 0,
+            int(parts[2]) if len(parts) > 2 else 0,
+        )
+    except ValueError:
+        return None
 
 
 class TimeField(Field):
@@ -32,6 +79,11 @@ class TimeField(Field):
         offset:
             Timezone offset in hours (floats are allowed) for calculating "now" when
             `past_time` or `future_time` are used. Defaults to `0` (UTC timezone).
+        clock:
+            A function that returns the current time, as an aware datetime in UTC,
+            for the `past_time` and `future_time` checks. Defaults to the time taken
+            by the form when its validation started (see `Meta.clock`), or to the
+            system clock if the field is used without a form.
         one_of:
             List of values that the field value must be one of. Defaults to `None`.
         messages:
@@ -41,20 +93,6 @@ class TimeField(Field):
 
     """
 
-    RX_TIME = re.compile(
-        (
-            r"^(?:"
-            r"(?P<hour>[0-2]?[0-9])"
-            r"|(?P<hour12>[0-2]?[0-9])\s*(?P<tt>am|pm)"
-            r"|(?P<hour_min>[0-2]?[0-9]):(?P<minute>[0-5][0-9])"
-            r"|(?P<hour12_min>[0-2]?[0-9]):(?P<minute12>[0-5][0-9])\s*(?P<tt_min>am|pm)"
-            r"|(?P<hour_sec>[0-2]?[0-9]):(?P<minute_sec>[0-5][0-9]):(?P<second>[0-5][0-9])"
-            r"|(?P<hour12_sec>[0-2]?[0-9]):(?P<minute12_sec>[0-5][0-9]):(?P<second12>[0-5][0-9])\s*(?P<tt_sec>am|pm)"
-            r")$"
-        ),
-        re.IGNORECASE,
-    )
-
     def __init__(
         self,
         *,
@@ -65,9 +103,9 @@ class TimeField(Field):
         past_time: bool = False,
         future_time: bool = False,
         offset: int | float = 0,
+        clock: Clock | None = None,
         one_of: Iterable[t.Any] | None = None,
         messages: dict[str, str] | None = None,
-        _utcnow: datetime.datetime | None = None,
     ):
         if after_time and isinstance(after_time, str):
             after_time = self.filter_value(after_time)
@@ -81,8 +119,8 @@ class TimeField(Field):
         self.future_time = future_time
         self.offset = offset
 
-        # For easier testing
-        self._utcnow = _utcnow
+        self.clock = clock
+        self._uses_clock = bool(past_time or future_time)
 
         if one_of is not None:
             if isinstance(one_of, str) or not isinstance(one_of, Iterable):
@@ -111,49 +149,10 @@ class TimeField(Field):
         if isinstance(value, datetime.time):
             return value
 
-        match = self.RX_TIME.match(value.strip())
-        if not match:
+        time = parse_time(value.strip())
+        if time is None:
             raise ValueError(f"Invalid time value: {value}")
-
-        try:
-            gd = match.groupdict()
-
-            # Get hour from whichever pattern matched
-            hour = int(
-                gd.get("hour")
-                or gd.get("hour12")
-                or gd.get("hour_min")
-                or gd.get("hour12_min")
-                or gd.get("hour_sec")
-                or gd.get("hour12_sec")
-                or 0
-            )
-            # Get minute from whichever pattern matched (or default to 0)
-            minute = int(
-                gd.get("minute")
-                or gd.get("minute12")
-                or gd.get("minute_sec")
-                or gd.get("minute12_sec")
-                or 0
-            )
-            # Get second (or default to 0)
-            second = int(
-                gd.get("second")
-                or gd.get("second12")
-                or 0
-            )
-            # Get AM/PM from whichever pattern matched
-            tt = (gd.get("tt") or gd.get("tt_min") or gd.get("tt_sec") or "").strip().upper()
-
-            # Handle AM/PM
-            if tt == "PM" and hour < 12:
-                hour += 12
-            elif tt == "AM" and hour == 12:
-                hour = 0
-
-            return datetime.time(hour, minute, second)
-        except (TypeError, ValueError):
-            raise ValueError(f"Invalid time value: {value}") from None
+        return time
 
     def validate_value(self) -> bool:
         """
@@ -172,9 +171,7 @@ class TimeField(Field):
             self.error_args = {"before_time": self.before_time}
             return False
 
-        now = self._utcnow or datetime.datetime.now(datetime.timezone.utc)
-        if self.offset:
-            now += datetime.timedelta(hours=self.offset)
+        now = get_now(self.clock, self._now, self.offset)
         now = now.time()
 
         if self.past_time and self.value >= now:
@@ -185,7 +182,7 @@ class TimeField(Field):
             self.error = err.FUTURE_TIME
             return False
 
-        if self.one_of and self.value not in self.one_of:
+        if self.one_of and self.value not in self._one_of_index:
             self.error = err.ONE_OF
             self.error_args = {"one_of": self.one_of}
             return False
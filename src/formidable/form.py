@@ -2,29 +2,109 @@
 Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
+import inspect
+import itertools
 import logging
+import time
 import typing as t
+import weakref
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
+from types import MethodType
 
 from markupsafe import Markup
 
+from . import errors as err
 from .common import get_pk
 from .fields.base import Field
+from .fields.clock import Clock, utcnow
+from .fields.lookups import Lookups
 from .fields.text import TextField
 from .parser import parse
 from .wrappers import ObjectManager
 
 
+if t.TYPE_CHECKING:
+    import asyncio
+    import datetime
+
+
 RESERVED_NAMES = (
+    "ais_valid",
+    "avalidate",
     "get_errors",
+    "get_timings",
     "hidden_tags",
+    "reset",
     "save",
     "validate",
+    "validate_many",
+    "validate_columns",
     "after_validate",
 )
 
 logger = logging.getLogger("formidable")
 
 
+class _WeakHook:
+    """
+    A `filter_<name>`/`validate_<name>` method bound to a form through a weak
+    reference, so the field storing it doesn't keep the form alive.
+    """
+
+    __slots__ = ("func", "form_ref")
+
+    def __init__(self, form: "Form", func: t.Callable[..., t.Any]):
+        self.func = func
+        self.form_ref = weakref.ref(form)
+
+    def __call__(self, *args: t.Any) -> t.Any:
+        return self.func(self.form_ref(), *args)
+
+
+def _get_hook(form: "Form", name: str) -> t.Callable[..., t.Any]:
+    hook = getattr(form, name)
+    if isinstance(hook, MethodType) and hook.__self__ is form:
+        return _WeakHook(form, hook.__func__)
+    # Static and class methods don't reference the form
+    return hook
+
+
+def _is_form_method(cls: type["Form"], name: str) -> bool:
+    """
+    Whether `name` is a method inherited from `Form` instead of a custom hook.
+    E.g.: `validate_many()` is not the validator of a field named "many".
+    """
+    return inspect.getattr_static(cls, name) is Form.__dict__.get(name)
+
+
+class ValidationResult(t.NamedTuple):
+    """
+    The result of validating one record with `Form.validate_many()`.
+    """
+
+    # Whether the record is valid.
+    valid: bool
+    # Field names and their errors, as returned by `form.get_errors()`.
+    errors: dict[str, t.Any]
+    # The cleaned values of the fields, or `None` if the record is invalid.
+    data: dict[str, t.Any] | None
+
+
+class ColumnsResult(t.NamedTuple):
+    """
+    The result of validating a batch of records with `Form.validate_columns()`.
+    """
+
+    # Field names and their columns of cleaned values.
+    columns: dict[str, list[t.Any]]
+    # Field names and their columns of errors (`None` for the valid values).
+    column_errors: dict[str, list[t.Any]]
+    # The errors of each record, as returned by `form.get_errors()`.
+    # An empty dictionary means the record is valid.
+    errors: list[dict[str, t.Any]]
+
+
 class DefaultMeta:
     # ORM class to use for creating new objects.
     orm_cls: t.Any = None
@@ -37,6 +117,36 @@ class DefaultMeta:
     # are error codes and values are human error messages.
     messages: dict[str, str]
 
+    # An executor (e.g.: a `concurrent.futures.ThreadPoolExecutor`, usually shared by
+    # many forms) to run the validation of the expensive fields in parallel.
+    executor: Executor | None = None
+
+    # Time budget, in seconds, for validating the whole form.
+    timeout: float | None = None
+
+    # Time budgets, in seconds, for validating individual fields.
+    # This argument should be a dictionary where keys are field names.
+    timeouts: dict[str, float]
+
+    # Error code for the fields that ran out of time. If `None`, those fields
+    # are considered valid instead.
+    timeout_error: str | None = err.TIMEOUT
+
+    # A function that returns the current time, as an aware datetime in UTC, for
+    # the past/future checks of the date and time fields. It's called once when the
+    # validation starts, so all the fields of the form and its sub-forms use the
+    # same time.
+    clock: Clock = utcnow
+
+
+def expensive(func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+    """
+    Decorator that marks a `validate_<name>` method as expensive (slow and blocking),
+    so its field is validated in the executor set in `Meta.executor`, if any.
+    """
+    func.expensive = True  # type: ignore
+    return func
+
 
 class Form():
     """
@@ -69,6 +179,7 @@ class Form():
 
     _valid: bool | None = None
     _deleted: bool = False
+    _timings: dict[str, float] = {}
 
     # Whether the form allows deletion of objects.
     # If set to True, the form will delete the object when the "_destroy"
@@ -79,8 +190,19 @@ class Form():
     _field_names: list[str]
     _custom_filters: set[str]
     _custom_validators: set[str]
+    _expensive_validators: set[str]
+    _has_budget: bool
+    _has_lookups: bool
+    _uses_clock: bool
+    # Names of the fields that compare their values with the current time.
+    _clock_fields: tuple[str, ...]
+    # The time taken when the validation started, shared with the sub-forms.
+    _now: "datetime.datetime | None" = None
     _ProcessedMeta: t.Any
 
+    # Number of records whose lookups are done together by `validate_many()`.
+    _lookups_batch_size: int = 100
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
@@ -118,6 +240,11 @@ class Form():
         cls._custom_validators = {
             n for n in field_names
             if callable(getattr(cls, f"validate_{n}", None))
+            and not _is_form_method(cls, f"validate_{n}")
+        }
+        cls._expensive_validators = {
+            n for n in cls._custom_validators
+            if getattr(getattr(cls, f"validate_{n}"), "expensive", False)
         }
 
         # Process Meta once per class
@@ -138,6 +265,40 @@ class Form():
         if not isinstance(pk, str):
             raise ValueError("Meta.pk must be a string.")
         processed.pk = pk
+        executor = getattr(processed, "executor", None)
+        if executor is not None and not isinstance(executor, Executor):
+            raise ValueError("Meta.executor must be a `concurrent.futures.Executor`.")
+        processed.executor = executor
+
+        timeout = getattr(processed, "timeout", None)
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise ValueError("Meta.timeout must be a positive number.")
+        processed.timeout = timeout
+        timeouts = getattr(processed, "timeouts", {})
+        if not isinstance(timeouts, dict):
+            raise ValueError("Meta.timeouts must be a dictionary.")
+        for name, value in timeouts.items():
+            if name not in field_names:
+                raise ValueError(f"Meta.timeouts: `{name}` is not a field of the form.")
+            if not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"Meta.timeouts: `{name}` must be a positive number.")
+        processed.timeouts = timeouts
+        processed.timeout_error = getattr(processed, "timeout_error", err.TIMEOUT)
+        clock = getattr(processed, "clock", utcnow)
+        if not callable(clock):
+            raise ValueError("Meta.clock must be a callable.")
+        processed.clock = clock
+
+        cls._has_budget = (
+            timeout is not None
+            or bool(timeouts)
+            or any(getattr(cls, name).timeout is not None for name in field_names)
+        )
+        cls._has_lookups = any(getattr(cls, name)._has_lookups for name in field_names)
+        cls._clock_fields = tuple(
+            name for name in field_names if getattr(cls, name)._uses_clock
+        )
+        cls._uses_clock = bool(cls._clock_fields)
         cls._ProcessedMeta = processed
 
     def __init__(
@@ -161,9 +322,13 @@ class Form():
             field.field_name = name
 
             if name in self._custom_filters:
-                field._custom_filter = getattr(self, f"filter_{name}")
+                field._custom_filter = _get_hook(self, f"filter_{name}")
             if name in self._custom_validators:
-                field._custom_validator = getattr(self, f"validate_{name}")
+                field._custom_validator = _get_hook(self, f"validate_{name}")
+                if name in self._expensive_validators:
+                    field.expensive = True
+            if name in self.Meta.timeouts:
+                field.timeout = self.Meta.timeouts[name]
 
             # Inline set_messages + set_name_format to avoid extra iterations
             field.set_messages(merged_messages)
@@ -213,6 +378,22 @@ class Form():
         """
         return not self.is_valid
 
+    async def ais_valid(self, *, max_concurrency: int = 10) -> bool:
+        """
+        Async version of `is_valid`, needed if the form, or any of its sub-forms,
+        has async custom validators (`async def validate_<name>(...)`).
+
+        The async validators of all fields, including those of the forms of
+        `NestedForms` and `FormField` fields, run concurrently, but no more than
+        `max_concurrency` at the same time. `after_validate()` can also be async.
+
+        The result is cached, so to re-validate the form, you need to call
+        `await form.avalidate()`.
+        """
+        if self._valid is None:
+            return await self.avalidate(max_concurrency=max_concurrency)
+        return self._valid
+
     def get_errors(self) -> dict[str, str]:
         """
         Returns a dictionary of field names and their error messages.
@@ -265,27 +446,207 @@ class Form():
         data.update(extra)
         return self._object.save(data)
 
+    @classmethod
+    def validate_many(
+        cls,
+        items: Iterable[t.Any],
+        *,
+        messages: dict[str, str] | None = None,
+    ) -> Iterator[ValidationResult]:
+        """
+        Validates a sequence of request data records with this form class.
+
+        A single form instance is built and `reset()` for every record, so the
+        per-instance setup is paid only once and only one form is alive at any time.
+        This is a generator, so the memory use stays flat for arbitrarily long inputs.
+
+        Args:
+            items:
+                An iterable of request data records.
+            messages:
+                Custom messages for validation errors. Defaults to `None`.
+
+        Yields:
+            A `ValidationResult(valid, errors, data)` for each record, in order.
+            `data` is a dictionary of the cleaned values, or `None` if the record
+            is invalid. Nothing is saved.
+
+        """
+        if cls._has_lookups:
+            yield from cls._validate_many_batched(items, messages)
+            return
+
+        form = cls(messages=messages)
+        for reqdata in items:
+            form.reset(reqdata or {})
+            if form.is_valid:
+                yield ValidationResult(True, {}, form._get_data())
+            else:
+                yield ValidationResult(False, form.get_errors(), None)
+        form.reset()
+
+    @classmethod
+    def validate_columns(
+        cls,
+        columns: Mapping[str, Sequence[t.Any]],
+        *,
+        messages: dict[str, str] | None = None,
+    ) -> ColumnsResult:
+        """
+        Validates a batch of records given as columns: a dictionary of field names
+        and the sequences of their values, one item per record.
+
+        Each field filters and validates its whole column at once. `IntegerField`,
+        `FloatField`, `DateField`, and `DateTimeField` do it column-wise (with NumPy,
+        if installed, for the numeric fields) unless they have custom filters or
+        validators. The other fields validate their values one by one.
+
+        Only the field validations run: `after_validate()` is *not* called, because
+        there is no form instance for each record.
+
+        Args:
+            columns:
+                A dictionary of field names and sequences of values. All the
+                sequences must have the same length. Missing fields are treated
+                as missing values.
+            messages:
+                Custom messages for validation errors. Defaults to `None`.
+
+        Returns:
+            A `ColumnsResult(columns, column_errors, errors)` tuple.
+
+        """
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("All the columns must have the same length")
+        size = sizes.pop() if sizes else 0
+
+        form = cls(messages=messages)
+        if form._uses_clock:
+            form._set_now(form.Meta.clock())
+        cleaned = {}
+        column_errors = {}
+        errors: list[dict[str, t.Any]] = [{} for _ in range(size)]
+
+        for name, field in form._fields.items():
+            values = columns.get(name)
+            if values is None:
+                values = [None] * size
+            cleaned[name], column_errors[name] = field.validate_column(values)
+            for index, error in enumerate(column_errors[name]):
+                if error is not None:
+                    errors[index][name] = error
+
+        return ColumnsResult(cleaned, column_errors, errors)
+
+    def reset(self, reqdata: t.Any = None, object: t.Any = None) -> None:
+        """
+        Clears the values, errors, and nested forms of the form, as if it had just
+        been created, and optionally loads new data into it.
+
+        This lets you reuse a form instance for a new request instead of building a
+        new one, skipping the field cloning, message merging, and hook binding.
+
+        Args:
+            reqdata:
+                The request data to parse and set the form fields. Defaults to `None`.
+            object:
+                An object to use as the source of the initial data for the form.
+                Defaults to `None`.
+
+        """
+        self._valid = None
+        self._now = None
+        self._deleted = False
+        for field in self._fields.values():
+            field.reset()
+
+        if reqdata is not None or object is not None:
+            self._set(reqdata, object)
+        else:
+            self._object = self._ObjectManager(orm_cls=self.Meta.orm_cls)
+
     def validate(self) -> bool:
         """
         Triggers validation of each of the fields and the form itself.
 
+        If `Meta.executor` is set, the expensive fields of this form and of all
+        its sub-forms are first sent to the executor to be validated in parallel.
+        The results are still collected in field order.
+
+        The slow lookups needed by the fields of the form and its sub-forms, like
+        the DNS checks of email addresses or the search for unique slugs, are
+        done at the same time before validating the fields.
+
+        If the form has a time budget (`Meta.timeout` and/or `Meta.timeouts`), the
+        fields that run out of time get a `Meta.timeout_error` error. Once the form
+        budget is spent, the remaining fields are not validated.
+
+        The current time, for the past/future checks of the date and time fields,
+        is taken once from `Meta.clock`, so all the fields of the form and its
+        sub-forms compare their values with the same time.
+
         Returns:
             `True` or `False`, whether the form is valid after validation.
 
         """
-        self._valid = True
-
-        for field in self._fields.values():
-            field.validate()
-            if field.error is not None:
-                self._valid = False
+        if self._uses_clock and (self._now is None or self._valid is not None):
+            # Unless it's a sub-form that got the time from its parent form
+            self._set_now(self.Meta.clock())
+        if self._has_lookups and self._valid is None:
+            self._run_lookups()
+        if self.Meta.executor is not None:
+            self._submit_validation(self.Meta.executor)
+
+        try:
+            if self._has_budget:
+                self._valid = self._validate_fields_timed()
+            else:
+                self._valid = True
+                for field in self._fields.values():
+                    field.validate()
+                    if field.error is not None:
+                        self._valid = False
+        finally:
+            if self.Meta.executor is not None:
+                # If a validator raised, the fields after it were not validated
+                self._cancel_validation()
 
         if not self._valid:
             return False
 
-        self._valid = self.after_validate()
+        valid = self.after_validate()
+        if inspect.isawaitable(valid):
+            if inspect.iscoroutine(valid):
+                valid.close()
+            raise RuntimeError("`after_validate()` is async, use `await form.ais_valid()` instead.")
+        self._valid = valid
         return self._valid
 
+    async def avalidate(self, *, max_concurrency: int = 10) -> bool:
+        """
+        Async version of `validate()`, that also runs async custom validators.
+        See `ais_valid()`.
+
+        Args:
+            max_concurrency:
+                Maximum number of async validators running at the same time.
+                Defaults to `10`.
+
+        Returns:
+            `True` or `False`, whether the form is valid after validation.
+
+        """
+        import asyncio  # Slow to import and not needed by sync code
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be a positive integer")
+        if self._has_lookups:
+            await asyncio.to_thread(self._run_lookups)
+        if self._uses_clock and (self._now is None or self._valid is not None):
+            self._set_now(self.Meta.clock())
+        return await self._avalidate(asyncio.Semaphore(max_concurrency))
+
     def after_validate(self) -> bool:
         """
         Called after the individual field validations.
@@ -316,6 +677,197 @@ class Form():
 
     # Private methods
 
+    def _submit_validation(self, executor: Executor) -> None:
+        """
+        Sends the validation of the expensive fields of the form, and its
+        sub-forms, to the executor.
+        """
+        if self._valid is not None:
+            return
+        for field in self._fields.values():
+            field._submit_validation(executor)
+
+    def _cancel_validation(self) -> None:
+        """
+        Cancels the validations of the form, and its sub-forms, that were sent
+        to the executor and not used yet.
+        """
+        for field in self._fields.values():
+            field._cancel_validation()
+
+    def _collect_lookups(self, lookups: Lookups) -> None:
+        """
+        Adds the lookups needed by the fields of the form, and its sub-forms,
+        to `lookups`.
+        """
+        if self._valid is not None:
+            return
+        for field in self._fields.values():
+            field._collect_lookups(lookups)
+
+    def _set_now(self, now: "datetime.datetime") -> None:
+        """
+        Shares the time taken when the validation started with the fields of
+        the form, and its sub-forms, that need it.
+        """
+        self._now = now
+        for name in self._clock_fields:
+            self._fields[name]._set_now(now)
+
+    def _run_lookups(self) -> None:
+        """
+        Does at the same time the lookups needed by all the fields of the form
+        and its sub-forms.
+        """
+        lookups = Lookups()
+        self._collect_lookups(lookups)
+        lookups.run()
+
+    @classmethod
+    def _validate_many_batched(
+        cls,
+        items: Iterable[t.Any],
+        messages: dict[str, str] | None,
+    ) -> Iterator[ValidationResult]:
+        """
+        Like `validate_many()`, but builds the forms of a batch of records first, so
+        the lookups of the whole batch are done at the same time.
+        """
+        it = iter(items)
+        while batch := list(itertools.islice(it, cls._lookups_batch_size)):
+            forms = [cls(reqdata or {}, messages=messages) for reqdata in batch]
+            lookups = Lookups()
+            for form in forms:
+                form._collect_lookups(lookups)
+            lookups.run()
+            for form in forms:
+                if form.is_valid:
+                    yield ValidationResult(True, {}, form._get_data())
+                else:
+                    yield ValidationResult(False, form.get_errors(), None)
+
+    async def _ais_valid(self, limiter: "asyncio.Semaphore") -> bool:
+        if self._valid is None:
+            return await self._avalidate(limiter)
+        return self._valid
+
+    async def _avalidate(self, limiter: "asyncio.Semaphore") -> bool:
+        import asyncio
+
+        self._valid = True
+        if self._has_budget:
+            self._timings = {}
+            deadline = self._get_deadline()
+            await asyncio.gather(*(
+                self._avalidate_field_timed(name, field, limiter, deadline)
+                for name, field in self._fields.items()
+            ))
+        else:
+            await asyncio.gather(*(field.avalidate(limiter) for field in self._fields.values()))
+
+        for field in self._fields.values():
+            if field.error is not None:
+                self._valid = False
+
+        if not self._valid:
+            return False
+
+        valid = self.after_validate()
+        if inspect.isawaitable(valid):
+            valid = await valid
+        self._valid = valid
+        return self._valid
+
+    def get_timings(self) -> dict[str, float]:
+        """
+        Returns a dictionary of field names and the seconds their last validation
+        took, so you can see which fields use the time budget.
+
+        Only recorded if the form has a time budget (`Meta.timeout` and/or
+        `Meta.timeouts`).
+        """
+        return dict(self._timings)
+
+    def _get_deadline(self) -> float | None:
+        if self.Meta.timeout is None:
+            return None
+        return time.perf_counter() + self.Meta.timeout
+
+    def _get_field_timeout(self, field: Field, deadline: float | None, now: float) -> float | None:
+        timeout = field.timeout
+        if deadline is not None:
+            remaining = deadline - now
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+    def _validate_fields_timed(self) -> bool:
+        valid = True
+        timings = self._timings = {}
+        deadline = self._get_deadline()
+
+        for name, field in self._fields.items():
+            start = time.perf_counter()
+            timeout = self._get_field_timeout(field, deadline, start)
+
+            if timeout is not None and timeout <= 0:
+                # Out of budget: skip the validation
+                if field._promote_error():
+                    self._set_timeout(name, field)
+            else:
+                try:
+                    field.validate(timeout=timeout)
+                except TimeoutError:
+                    self._set_timeout(name, field)
+                else:
+                    if timeout is not None and time.perf_counter() - start > timeout:
+                        self._set_timeout(name, field)
+
+            timings[name] = time.perf_counter() - start
+            if field.error is not None:
+                valid = False
+
+        return valid
+
+    async def _avalidate_field_timed(
+        self,
+        name: str,
+        field: Field,
+        limiter: "asyncio.Semaphore",
+        deadline: float | None,
+    ) -> None:
+        import asyncio
+
+        start = time.perf_counter()
+        timeout = self._get_field_timeout(field, deadline, start)
+
+        if timeout is not None and timeout <= 0:
+            if field._promote_error():
+                self._set_timeout(name, field)
+        else:
+            try:
+                await asyncio.wait_for(field.avalidate(limiter), timeout)
+            except TimeoutError:
+                self._set_timeout(name, field)
+            else:
+                # Sync validators can't be interrupted
+                if timeout is not None and time.perf_counter() - start > timeout:
+                    self._set_timeout(name, field)
+
+        self._timings[name] = time.perf_counter() - start
+
+    def _set_timeout(self, name: str, field: Field) -> None:
+        logger.warning("Validation of %s.%s ran out of time", self.__class__.__name__, name)
+        field._cancel_validation()
+        if self.Meta.timeout_error is not None:
+            field.error = self.Meta.timeout_error
+            field.error_args = None
+
+    def _get_data(self) -> dict[str, t.Any]:
+        """
+        Returns the cleaned values of the fields, without saving anything.
+        """
+        return {name: field._get_data() for name, field in self._fields.items()}
+
     def _set_messages(self, messages: dict[str, str]):
         self._messages = {**self.Meta.messages, **messages}
         for field in self._fields.values():
@@ -328,6 +880,7 @@ class Form():
 
     def _set(self, reqdata: t.Any = None, object: t.Any = None) -> None:
         self._valid = None
+        self._now = None
 
         reqdata = parse(reqdata or {})
         self._object = self._ObjectManager(
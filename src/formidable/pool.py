@@ -0,0 +1,121 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import threading
+import typing as t
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+if t.TYPE_CHECKING:
+    from .form import Form
+
+
+class FormPool:
+    """
+    A pool of reusable instances of a form class.
+
+    Instead of building a new form for every request, the pool hands out an
+    instance that was already built and `reset()` it with the new data.
+    Each thread has its own set of instances, so a form is never shared
+    between threads.
+
+    Args:
+        FormClass:
+            The class of the forms in the pool.
+        max_size:
+            Maximum number of idle instances kept per thread. Defaults to `8`.
+        name_format:
+            A format string for the field names. Defaults to "{name}".
+        messages:
+            Custom messages for validation errors. Defaults to `None`.
+
+    Example:
+        ```python
+        pool = FormPool(SignUpForm)
+
+        with pool.form(request.form) as form:
+            if form.is_valid:
+                form.save()
+        ```
+
+    """
+
+    def __init__(
+        self,
+        FormClass: "type[Form]",
+        *,
+        max_size: int = 8,
+        name_format: str = "{name}",
+        messages: dict[str, str] | None = None,
+    ):
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError("`max_size` must be a positive integer")
+        self.FormClass = FormClass
+        self.max_size = max_size
+        self.name_format = name_format
+        self.messages = messages
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        """Number of idle instances available to the current thread."""
+        return len(self._get_idle())
+
+    def acquire(self, reqdata: t.Any = None, object: t.Any = None) -> "Form":
+        """
+        Returns a form instance loaded with the `reqdata` and/or `object`.
+        A new instance is created only if there is no idle one in this thread.
+
+        Args:
+            reqdata:
+                The request data to parse and set the form fields. Defaults to `None`.
+            object:
+                An object to use as the source of the initial data for the form.
+                Defaults to `None`.
+
+        """
+        idle = self._get_idle()
+        if not idle:
+            return self.FormClass(
+                reqdata,
+                object,
+                name_format=self.name_format,
+                messages=self.messages,
+            )
+
+        form = idle.pop()
+        if reqdata is not None or object is not None:
+            form._set(reqdata, object)
+        return form
+
+    def release(self, form: "Form") -> None:
+        """
+        Returns a form instance to the pool of the current thread.
+        The form is reset, so it doesn't keep the request data alive.
+        Releasing a form that is already idle does nothing.
+        """
+        if not isinstance(form, self.FormClass):
+            raise ValueError(f"Expected a `{self.FormClass.__name__}` instance")
+        idle = self._get_idle()
+        if len(idle) >= self.max_size or any(other is form for other in idle):
+            return
+        form.reset()
+        idle.append(form)
+
+    @contextmanager
+    def form(self, reqdata: t.Any = None, object: t.Any = None) -> Iterator["Form"]:
+        """
+        Context manager that acquires a form instance and releases it on exit.
+        """
+        form = self.acquire(reqdata, object)
+        try:
+            yield form
+        finally:
+            self.release(form)
+
+    def _get_idle(self) -> list["Form"]:
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
@@ -0,0 +1,141 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import asyncio
+
+import pytest
+
+import formidable as f
+
+
+TAKEN = {"taken@example.com", "root"}
+
+
+class Tracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def check(self, value):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if value in TAKEN:
+            raise ValueError("taken")
+        return value
+
+
+tracker = Tracker()
+
+
+class UserForm(f.Form):
+    username = f.TextField()
+    email = f.TextField()
+    age = f.IntegerField(required=False, gte=18)
+
+    async def validate_username(self, value):
+        return await tracker.check(value)
+
+    async def validate_email(self, value):
+        return await tracker.check(value)
+
+    def validate_age(self, value):
+        return value
+
+
+class TeamForm(f.Form):
+    name = f.TextField()
+    owner = f.FormField(UserForm)
+    members = f.NestedForms(UserForm)
+
+
+@pytest.fixture(autouse=True)
+def reset_tracker():
+    tracker.running = 0
+    tracker.max_running = 0
+
+
+def test_ais_valid():
+    form = UserForm({"username": "zoe", "email": "zoe@example.com", "age": "20"})
+    assert asyncio.run(form.ais_valid())
+    assert form.is_valid
+    assert tracker.max_running == 2
+
+
+def test_ais_valid_errors():
+    form = UserForm({"username": "root", "email": "taken@example.com", "age": "2"})
+    assert not asyncio.run(form.ais_valid())
+    assert form.get_errors() == {"username": "taken", "email": "taken", "age": "gte"}
+
+
+def test_ais_valid_nested():
+    data = {
+        "name": "A-Team",
+        "owner[username]": "hannibal",
+        "owner[email]": "h@example.com",
+    }
+    for i in range(10):
+        data[f"members[{i}][username]"] = f"user{i}" if i != 7 else "root"
+        data[f"members[{i}][email]"] = f"user{i}@example.com"
+
+    form = TeamForm(data)
+    assert not asyncio.run(form.ais_valid(max_concurrency=5))
+    assert tracker.max_running == 5
+    assert form.get_errors() == {"members": "invalid"}
+    assert form.members.error_args == {7: {"username": "taken"}}
+
+
+def test_ais_valid_is_cached():
+    form = UserForm({"username": "zoe", "email": "zoe@example.com"})
+    assert asyncio.run(form.ais_valid())
+    form.username.value = "root"
+    assert asyncio.run(form.ais_valid())
+    assert not asyncio.run(form.avalidate())
+
+
+def test_sync_validation_of_async_validators():
+    form = UserForm({"username": "zoe", "email": "zoe@example.com"})
+    with pytest.raises(RuntimeError):
+        form.is_valid
+
+
+def test_sync_validators_only():
+    class TestForm(f.Form):
+        name = f.TextField()
+
+        def validate_name(self, value):
+            return value.upper()
+
+    form = TestForm({"name": "zoe"})
+    assert asyncio.run(form.ais_valid())
+    assert form.name.value == "ZOE"
+
+
+def test_async_after_validate():
+    class TestForm(f.Form):
+        password1 = f.TextField()
+        password2 = f.TextField()
+
+        async def after_validate(self):
+            await asyncio.sleep(0)
+            if self.password1.value != self.password2.value:
+                self.password2.error = "mismatch"
+                return False
+            return True
+
+    form = TestForm({"password1": "a", "password2": "b"})
+    assert not asyncio.run(form.ais_valid())
+    assert form.password2.error == "mismatch"
+
+    form = TestForm({"password1": "a", "password2": "a"})
+    with pytest.raises(RuntimeError):
+        form.validate()
+    assert asyncio.run(form.avalidate())
+
+
+def test_invalid_max_concurrency():
+    form = UserForm({})
+    with pytest.raises(ValueError):
+        asyncio.run(form.ais_valid(max_concurrency=0))
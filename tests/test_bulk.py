@@ -0,0 +1,163 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import json
+
+import pytest
+
+import formidable as f
+from formidable.bulk import bulk_import, get_form_ref, load_form_class, validate_rows
+
+
+class AddressForm(f.Form):
+    city = f.TextField()
+
+
+class PersonForm(f.Form):
+    name = f.TextField()
+    age = f.IntegerField(gte=18)
+    birthday = f.DateField(required=False)
+    address = f.FormField(AddressForm)
+
+
+class ScoresForm(f.Form):
+    name = f.TextField()
+    scores = f.ArrayField(float, gte=0)
+
+
+CSV_DATA = """name,age,birthday,address[city]
+Zoe,20,2000-01-02,Lima
+Bob,12,,Quito
+,30,,
+Ana,40,,Bogotá
+"""
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_get_form_ref():
+    ref = get_form_ref(PersonForm)
+    assert ref.endswith(":PersonForm")
+    assert load_form_class(ref) is PersonForm
+
+
+def test_get_form_ref_local_class():
+    class LocalForm(f.Form):
+        name = f.TextField()
+
+    with pytest.raises(ValueError):
+        get_form_ref(LocalForm)
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_validate_rows_in_order(max_workers):
+    rows = [{"name": f"p{i}", "age": str(i), "address[city]": "X"} for i in range(25)]
+    results = list(
+        validate_rows(
+            PersonForm,
+            rows,
+            chunk_size=3,
+            max_workers=max_workers,
+            max_pending=2,
+        )
+    )
+    assert len(results) == 25
+    for i, result in enumerate(results):
+        assert result.valid == (i >= 18)
+        if result.valid:
+            assert result.data["name"] == f"p{i}"
+        else:
+            assert result.errors == {"age": "gte"}
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_bulk_import_csv(tmp_path, max_workers):
+    path = tmp_path / "people.csv"
+    path.write_text(CSV_DATA, encoding="utf-8")
+    data_path = tmp_path / "data.jsonl"
+    errors_path = tmp_path / "errors.jsonl"
+
+    summary = bulk_import(
+        PersonForm,
+        path,
+        data_path=data_path,
+        errors_path=errors_path,
+        chunk_size=1,
+        max_workers=max_workers,
+    )
+    assert summary == (4, 2, 2)
+    assert read_jsonl(data_path) == [
+        {"name": "Zoe", "age": 20, "birthday": "2000-01-02", "address": {"city": "Lima"}},
+        {"name": "Ana", "age": 40, "birthday": None, "address": {"city": "Bogotá"}},
+    ]
+    assert read_jsonl(errors_path) == [
+        {"row": 2, "errors": {"age": "gte"}},
+        {"row": 3, "errors": {"name": "required", "address": {"city": "required"}}},
+    ]
+
+
+def test_bulk_import_jsonl(tmp_path):
+    path = tmp_path / "people.jsonl"
+    path.write_text(
+        '{"name": "Zoe", "age": 20, "address": {"city": "Lima"}}\n'
+        "\n"
+        '{"name": "Bob", "age": 2, "address": {"city": "Quito"}}\n',
+        encoding="utf-8",
+    )
+    data_path = tmp_path / "data.jsonl"
+    errors_path = tmp_path / "errors.jsonl"
+
+    summary = bulk_import(
+        PersonForm,
+        path,
+        data_path=data_path,
+        errors_path=errors_path,
+        max_workers=1,
+    )
+    assert summary.total == 2
+    assert summary.valid == 1
+    assert summary.invalid == 1
+    assert read_jsonl(data_path) == [
+        {"name": "Zoe", "age": 20, "birthday": None, "address": {"city": "Lima"}},
+    ]
+    assert read_jsonl(errors_path) == [{"row": 2, "errors": {"age": "gte"}}]
+
+
+def test_bulk_import_array_field(tmp_path):
+    path = tmp_path / "scores.jsonl"
+    path.write_text(
+        '{"name": "Zoe", "scores[]": [1, 2.5]}\n'
+        '{"name": "Bob", "scores[]": [-1]}\n',
+        encoding="utf-8",
+    )
+    data_path = tmp_path / "data.jsonl"
+    errors_path = tmp_path / "errors.jsonl"
+
+    summary = bulk_import(
+        ScoresForm,
+        path,
+        data_path=data_path,
+        errors_path=errors_path,
+        max_workers=1,
+    )
+    assert summary.valid == 1
+    assert read_jsonl(data_path) == [{"name": "Zoe", "scores": [1.0, 2.5]}]
+    assert read_jsonl(errors_path) == [{"row": 2, "errors": {"scores": "gte"}}]
+
+
+def test_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        bulk_import(
+            PersonForm,
+            tmp_path / "people.xml",
+            data_path=tmp_path / "data.jsonl",
+            errors_path=tmp_path / "errors.jsonl",
+        )
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(validate_rows(PersonForm, [], chunk_size=0))
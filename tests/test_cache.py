@@ -0,0 +1,257 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import asyncio
+import datetime
+import decimal
+import pickle
+import sqlite3
+import time
+import uuid
+
+import pytest
+
+import formidable as f
+
+
+def make_form(**cache_kw):
+    calls = []
+
+    class SignUpForm(f.Form):
+        username = f.TextField()
+
+        @f.cached(**cache_kw)
+        def validate_username(self, value):
+            calls.append(value)
+            if value == "taken":
+                raise ValueError("taken", {"name": value})
+            return value.lower()
+
+    return SignUpForm, calls
+
+
+def test_cached_validator():
+    SignUpForm, calls = make_form()
+
+    for _ in range(3):
+        form = SignUpForm({"username": "Zoe"})
+        assert form.validate()
+        assert form.username.value == "zoe"
+
+    assert calls == ["Zoe"]
+
+
+def test_cached_validator_errors():
+    SignUpForm, calls = make_form()
+
+    for _ in range(2):
+        form = SignUpForm({"username": "taken"})
+        assert not form.validate()
+        assert form.username.error == "taken"
+        assert form.username.error_args == {"name": "taken"}
+
+    assert calls == ["taken"]
+
+
+def test_cached_validator_ttl():
+    SignUpForm, calls = make_form(ttl=0.05)
+
+    SignUpForm({"username": "zoe"}).validate()
+    SignUpForm({"username": "zoe"}).validate()
+    time.sleep(0.06)
+    SignUpForm({"username": "zoe"}).validate()
+
+    assert calls == ["zoe", "zoe"]
+
+
+def test_cached_validator_max_size():
+    SignUpForm, calls = make_form(max_size=2)
+
+    for name in ["a", "b", "c", "a"]:
+        SignUpForm({"username": name}).validate()
+
+    assert calls == ["a", "b", "c", "a"]
+
+
+def test_cached_validator_invalidate():
+    SignUpForm, calls = make_form()
+
+    SignUpForm({"username": "zoe"}).validate()
+    SignUpForm({"username": "ana"}).validate()
+    SignUpForm.validate_username.invalidate("zoe")
+    SignUpForm({"username": "zoe"}).validate()
+    SignUpForm({"username": "ana"}).validate()
+    assert calls == ["zoe", "ana", "zoe"]
+
+    SignUpForm.validate_username.cache_clear()
+    SignUpForm({"username": "ana"}).validate()
+    assert calls == ["zoe", "ana", "zoe", "ana"]
+
+
+def test_cached_async_validator():
+    calls = []
+
+    class SignUpForm(f.Form):
+        username = f.TextField()
+
+        @f.cached()
+        async def validate_username(self, value):
+            calls.append(value)
+            await asyncio.sleep(0)
+            if value == "taken":
+                raise ValueError("taken")
+            return value
+
+    async def run():
+        for name in ["zoe", "taken", "zoe", "taken"]:
+            form = SignUpForm({"username": name})
+            assert await form.ais_valid() == (name == "zoe")
+
+    asyncio.run(run())
+    assert calls == ["zoe", "taken"]
+
+
+def test_cached_uncacheable_values():
+    calls = []
+
+    class Thing:
+        pass
+
+    @f.cached()
+    def validate(value):
+        calls.append(value)
+        return value
+
+    thing = Thing()
+    validate(thing)
+    validate(thing)
+    validate(["a", 1])
+    validate(["a", 1])
+    assert calls == [thing, thing, ["a", 1]]
+
+
+def test_cached_keeps_expensive_mark():
+    class CompanyForm(f.Form):
+        tax_id = f.TextField()
+
+        @f.expensive
+        @f.cached()
+        def validate_tax_id(self, value):
+            return value
+
+    assert CompanyForm._expensive_validators == {"tax_id"}
+
+
+def test_cached_bad_ttl():
+    with pytest.raises(ValueError):
+        f.cached(ttl=0)
+
+
+def test_memory_cache():
+    cache = f.MemoryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # "b" is the least recently used
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.set("x:1", 1)
+    cache.clear("x:")
+    assert cache.get("x:1") is None
+    assert cache.get("c") == 3
+
+
+def test_sqlite_cache(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = f.SQLiteCache(path)
+    cache.set("a", (True, "zoe"))
+    cache.set("b", (False, ("taken",)), ttl=0.01)
+    cache.set("p:1", (True, 1))
+    cache.set("p:2", (True, 2))
+    time.sleep(0.02)
+
+    # Shared with other connections, like other processes would do
+    other = f.SQLiteCache(path)
+    assert other.get("a") == (True, "zoe")
+    assert other.get("b") is None
+
+    other.clear("p:")
+    assert cache.get("p:1") is None
+    assert cache.get("a") == (True, "zoe")
+
+    cache.delete("a")
+    assert other.get("a") is None
+    cache.close()
+    other.close()
+
+
+def test_sqlite_cache_values(tmp_path):
+    cache = f.SQLiteCache(tmp_path / "cache.db")
+    values = [
+        (True, "zoe"),
+        (False, ("taken", {"min": 3})),
+        [1, 2.5, None, True],
+        {"t": "x", "v": (decimal.Decimal("1.10"),)},
+        datetime.datetime(2025, 1, 2, 3, 4, 5),
+        datetime.date(2025, 1, 2),
+        datetime.time(10, 30),
+        uuid.UUID(int=7),
+    ]
+    for i, value in enumerate(values):
+        cache.set(str(i), value)
+    for i, value in enumerate(values):
+        result = cache.get(str(i))
+        assert result == value
+        assert type(result) is type(value)
+
+    # Other values are not stored
+    cache.set("obj", (True, object()))
+    cache.set("keys", {1: "a"})
+    assert cache.get("obj") is None
+    assert cache.get("keys") is None
+    cache.close()
+
+
+class Exploit:
+    def __reduce__(self):
+        return (exec, ("raise SystemExit('unpickled')",))
+
+
+def test_sqlite_cache_never_unpickles(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = f.SQLiteCache(path)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO formidable_cache (key, value, expires) VALUES (?, ?, NULL)",
+        ("a", pickle.dumps(Exploit())),
+    )
+    conn.commit()
+    conn.close()
+
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_sqlite_cache_max_size(tmp_path):
+    cache = f.SQLiteCache(tmp_path / "cache.db", max_size=10)
+    for i in range(cache.PRUNE_EVERY):
+        cache.set(str(i), i)
+    assert len(cache) == 10
+    assert cache.get(str(cache.PRUNE_EVERY - 1)) == cache.PRUNE_EVERY - 1
+    assert cache.get("0") is None
+
+
+def test_cached_validator_sqlite_backend(tmp_path):
+    backend = f.SQLiteCache(tmp_path / "cache.db")
+    SignUpForm, calls = make_form(backend=backend)
+
+    for name in ["zoe", "taken", "zoe", "taken"]:
+        SignUpForm({"username": name}).validate()
+    assert calls == ["zoe", "taken"]
+
+    SignUpForm.validate_username.invalidate("taken")
+    SignUpForm({"username": "taken"}).validate()
+    assert calls == ["zoe", "taken", "taken"]
+    backend.close()
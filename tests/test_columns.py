@@ -0,0 +1,154 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import datetime
+import random
+
+import pytest
+
+import formidable as f
+from formidable import columns
+
+
+UTCNOW = datetime.datetime(2025, 6, 15, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+class RecordForm(f.Form):
+    class Meta:
+        clock = lambda: UTCNOW  # noqa: E731
+
+    qty = f.IntegerField(gt=0, lte=100, multiple_of=2)
+    price = f.FloatField(required=False, gte=0.5, lt=1000)
+    code = f.IntegerField(required=False, one_of=[1, 2, 3])
+    day = f.DateField(
+        required=False,
+        after_date="2020-01-01",
+        past_date=True,
+    )
+    at = f.DateTimeField(
+        required=False,
+        before_date="2030-01-01T00:00:00",
+        future_date=True,
+    )
+    name = f.TextField(required=False, max_length=3)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns, "_np", None)
+    return request.param
+
+
+def make_columns(size, seed=42):
+    rnd = random.Random(seed)
+
+    def pick(options):
+        return [rnd.choice(options) for _ in range(size)]
+
+    return {
+        "qty": pick(["2", "4", "3", "0", "102", "", None, "x", 8, "100"]),
+        "price": pick(["1.5", "0.1", "999.99", "1000", "", None, "nan?", 3]),
+        "code": pick(["1", "2", "4", "", None]),
+        "day": pick(["2024-01-01", "2019-12-31", "2025-06-15", "2026-01-01", "", "bad"]),
+        "at": pick([
+            "2025-06-15T12:00:01",
+            "2025-06-15T11:59:59",
+            "2030-01-01T00:00:00",
+            "",
+            "2025-13-01T00:00:00",
+        ]),
+        "name": pick(["abc", "abcd", "", None]),
+    }
+
+
+def test_validate_columns(engine):
+    result = RecordForm.validate_columns({
+        "qty": ["2", "3", "", "200", "x"],
+        "price": ["1.5", "0.1", None, "2", ""],
+        "code": ["1", "", "4", None, "2"],
+        "day": ["2024-01-01", "2019-01-01", "", "2025-06-15", None],
+        "at": ["", "2025-06-16T00:00:00", None, "2025-01-01T00:00:00", ""],
+    })
+
+    assert result.columns["qty"][:2] == [2, 3]
+    assert result.columns["price"][0] == 1.5
+    assert result.columns["day"][0] == datetime.date(2024, 1, 1)
+    assert result.column_errors["qty"] == [None, "multiple_of", "required", "lte", "invalid"]
+    assert result.column_errors["name"] == [None] * 5
+    assert result.errors == [
+        {},
+        {"qty": "multiple_of", "price": "gte", "day": "after_date"},
+        {"qty": "required", "code": "one_of"},
+        {"qty": "lte", "day": "past_date", "at": "future_date"},
+        {"qty": "invalid"},
+    ]
+
+
+def test_validate_columns_same_as_validate_many(engine):
+    data = make_columns(300)
+    result = RecordForm.validate_columns(data)
+
+    records = [
+        {name: values[i] for name, values in data.items() if values[i] is not None}
+        for i in range(300)
+    ]
+    for i, expected in enumerate(RecordForm.validate_many(records)):
+        assert result.errors[i] == expected.errors
+        if expected.valid:
+            row = {name: values[i] for name, values in result.columns.items()}
+            assert row == expected.data
+
+
+def test_validate_columns_fast_cast(engine):
+    result = RecordForm.validate_columns({
+        "qty": ["2", "4", "6"],
+        "price": [1, 2.5, "3"],
+    })
+    assert result.columns["qty"] == [2, 4, 6]
+    assert result.columns["price"] == [1.0, 2.5, 3.0]
+    assert result.errors == [{}, {}, {}]
+
+
+def test_validate_columns_with_custom_hooks(engine):
+    class TestForm(f.Form):
+        qty = f.IntegerField(gt=0)
+
+        def filter_qty(self, value):
+            return str(value).replace("#", "")
+
+        def validate_qty(self, value):
+            if value == 13:
+                raise ValueError("unlucky")
+            return value
+
+    result = TestForm.validate_columns({"qty": ["#1", "13", "0"]})
+    assert result.columns["qty"] == [1, 13, 0]
+    assert result.errors == [{}, {"qty": "unlucky"}, {"qty": "gt"}]
+
+
+def test_validate_columns_other_fields(engine):
+    class TestForm(f.Form):
+        tags = f.ListField(int)
+        ok = f.BooleanField(required=True)
+
+    result = TestForm.validate_columns({
+        "tags": [["1", "2"], "3"],
+        "ok": ["1", None],
+    })
+    assert result.columns == {"tags": [[1, 2], [3]], "ok": [True, False]}
+    assert result.errors == [{}, {"ok": "required"}]
+
+
+def test_validate_columns_different_lengths():
+    with pytest.raises(ValueError):
+        RecordForm.validate_columns({"qty": ["1"], "price": []})
+
+
+def test_validate_columns_empty():
+    result = RecordForm.validate_columns({})
+    assert result.errors == []
+    assert result.columns["qty"] == []
@@ -0,0 +1,163 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import formidable as f
+
+
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+def slow_check(value):
+    time.sleep(0.05)
+    if value == "bad":
+        raise ValueError("bad_value")
+    return value
+
+
+class ItemForm(f.Form):
+    class Meta:
+        executor = executor
+
+    name = f.TextField()
+    code = f.TextField()
+
+    @f.expensive
+    def validate_code(self, value):
+        return slow_check(value)
+
+
+class OrderForm(f.Form):
+    class Meta:
+        executor = executor
+
+    ref = f.TextField()
+    note = f.TextField(required=False)
+    items = f.NestedForms(ItemForm)
+
+    @f.expensive
+    def validate_ref(self, value):
+        return slow_check(value)
+
+    def validate_note(self, value):
+        return value
+
+
+def test_expensive_marks_field():
+    form = OrderForm()
+    assert form.ref.expensive
+    assert not form.note.expensive
+    assert OrderForm._expensive_validators == {"ref"}
+
+
+def test_executor_runs_in_parallel():
+    data = {"ref": "r1"}
+    for i in range(8):
+        data[f"items[{i}][name]"] = f"item{i}"
+        data[f"items[{i}][code]"] = "bad" if i in (2, 5) else f"c{i}"
+
+    form = OrderForm(data)
+    start = time.perf_counter()
+    assert form.is_invalid
+    elapsed = time.perf_counter() - start
+
+    # 9 expensive validations of 0.05s each, in 8 threads
+    assert elapsed < 0.3
+    assert form.get_errors() == {"items": "invalid"}
+    assert form.items.error_args == {
+        2: {"code": "bad_value"},
+        5: {"code": "bad_value"},
+    }
+    assert all(field._future is None for field in form)
+
+
+def test_executor_keeps_field_order():
+    class TestForm(f.Form):
+        class Meta:
+            executor = executor
+
+        a = f.TextField()
+        b = f.TextField()
+        c = f.TextField()
+
+        @f.expensive
+        def validate_a(self, value):
+            time.sleep(0.05)
+            raise ValueError("slow")
+
+        def validate_b(self, value):
+            raise ValueError("fast")
+
+        @f.expensive
+        def validate_c(self, value):
+            raise ValueError("fastest")
+
+    form = TestForm({"a": "1", "b": "2", "c": "3"})
+    assert form.is_invalid
+    assert list(form.get_errors().items()) == [
+        ("a", "slow"),
+        ("b", "fast"),
+        ("c", "fastest"),
+    ]
+
+
+def test_expensive_without_executor():
+    threads = set()
+
+    class TestForm(f.Form):
+        name = f.TextField()
+
+        @f.expensive
+        def validate_name(self, value):
+            threads.add(threading.current_thread())
+            return value.upper()
+
+    form = TestForm({"name": "zoe"})
+    assert form.is_valid
+    assert form.name.value == "ZOE"
+    assert threads == {threading.current_thread()}
+
+
+def test_invalid_executor():
+    with pytest.raises(ValueError):
+        class TestForm(f.Form):
+            class Meta:
+                executor = "meh"
+
+            name = f.TextField()
+
+
+def test_email_check_dns_is_expensive(monkeypatch):
+    calls = []
+
+    def resolver(domain):
+        calls.append((domain, threading.current_thread()))
+        return domain != "nomx.example"
+
+    monkeypatch.setattr(f.EmailField, "dns_cache", f.MemoryCache())
+
+    class TestForm(f.Form):
+        class Meta:
+            executor = executor
+
+        email = f.EmailField(check_dns=True, resolver=resolver)
+        other = f.EmailField(required=False)
+
+    form = TestForm({"email": "Zoe@Mail.example", "other": "a@b.example"})
+    assert form.email.expensive
+    assert not form.other.expensive
+    assert calls == []
+    assert form.is_valid
+    assert form.email.value == "Zoe@mail.example"
+    assert len(calls) == 1
+    assert calls[0][1] is not threading.current_thread()
+
+    form = TestForm({"email": "zoe@nomx.example"})
+    assert form.is_invalid
+    assert form.get_errors() == {"email": "invalid_email"}
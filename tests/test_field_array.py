@@ -0,0 +1,161 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import array
+import math
+import random
+
+import pytest
+
+import formidable as f
+from formidable import columns
+from formidable import errors as err
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns, "_np", None)
+    return request.param
+
+
+def test_array_field():
+    class TestForm(f.Form):
+        ids = f.ArrayField()
+        coords = f.ArrayField(float, required=False)
+
+    form = TestForm({"ids[]": ["1", "2", "3"], "coords[]": ["1.5", "-2"]})
+    assert form.is_valid
+    assert form.ids.value == array.array("q", [1, 2, 3])
+    assert form.coords.value == array.array("d", [1.5, -2.0])
+    assert form.ids.name == "ids[]"
+
+    form = TestForm({})
+    assert form.coords.value == array.array("d")
+
+
+def test_invalid_items():
+    field = f.ArrayField()
+    field.set(["1", "x", "2"])
+    field.validate()
+    assert field.value == array.array("q", [1, 2])
+
+    field.set(["1", "x", str(2**63)])
+    field.validate()
+    assert field.error == err.INVALID
+
+    field = f.ArrayField(strict=True)
+    field.set(["1", "x"])
+    field.validate()
+    assert field.error == err.INVALID
+
+
+def test_array_values():
+    field = f.ArrayField()
+    field.set(None, array.array("q", [3, 1]))
+    assert field.value == array.array("q", [3, 1])
+
+    field = f.ArrayField(float, sort=True, unique=True)
+    field.set(None, array.array("q", [3, 1, 3]))
+    assert field.value == array.array("d", [1.0, 3.0])
+
+    field.set((2, 1))
+    assert field.value == array.array("d", [1.0, 2.0])
+
+
+def test_invalid_type():
+    with pytest.raises(ValueError):
+        f.ArrayField(str)  # type: ignore
+    with pytest.raises(ValueError):
+        f.ArrayField(gt="1")  # type: ignore
+
+
+@pytest.mark.parametrize("kwargs, values, error", [
+    ({"min_items": 2}, ["1"], err.MIN_ITEMS),
+    ({"max_items": 2}, ["1", "2", "3"], err.MAX_ITEMS),
+    ({"gt": 1}, ["2", "1", "3"], err.GT),
+    ({"gte": 1}, ["2", "0"], err.GTE),
+    ({"lt": 3}, ["2", "3"], err.LT),
+    ({"lte": 3}, ["4", "2"], err.LTE),
+    ({"multiple_of": 2}, ["2", "3"], err.MULTIPLE_OF),
+    ({"one_of": [1, 2]}, ["1", "3"], err.ONE_OF),
+    ({"gt": 0, "lte": 10, "multiple_of": 2, "one_of": [2, 4]}, ["2", "4", "2"], None),
+])
+def test_validate_array(engine, kwargs, values, error):
+    field = f.ArrayField(**kwargs)
+    field.set(values)
+    field.validate()
+    assert field.error == error
+    if error in kwargs:
+        assert field.error_args == {error: kwargs[error]}
+
+
+def test_validate_array_nans(engine):
+    field = f.ArrayField(float, gt=0, lt=10)
+    field.set(["nan", "5"])
+    field.validate()
+    assert field.error is None
+
+    field.set(["nan", "-5"])
+    field.validate()
+    assert field.error == err.GT
+
+    field.set(["nan"])
+    field.validate()
+    assert field.error is None
+    assert math.isnan(field.value[0])
+
+
+def test_validate_array_like_number_fields(engine):
+    rnd = random.Random(42)
+    limits = {"gt": -50, "gte": -40, "lt": 50, "lte": 40, "multiple_of": 3}
+    for _ in range(200):
+        kwargs = {key: value for key, value in limits.items() if rnd.random() < 0.5}
+        values = [str(rnd.randint(-60, 60)) for _ in range(rnd.randint(1, 5))]
+
+        field = f.ArrayField(**kwargs)
+        field.set(values)
+        field.validate()
+
+        expected = None
+        for code in limits:
+            item = f.IntegerField(**{k: v for k, v in kwargs.items() if k == code})
+            for value in values:
+                item.set(value)
+                item.validate()
+                if item.error:
+                    expected = code
+                    break
+            if expected:
+                break
+        assert field.error == expected, (kwargs, values)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("kwargs, error", [
+    ({}, err.INVALID),
+    ({"lte": 100}, err.LTE),
+    ({"lt": 100}, err.LT),
+    ({"gt": 0}, err.INVALID),
+])
+def test_item_out_of_range(strict, kwargs, error):
+    field = f.ArrayField(strict=strict, **kwargs)
+    field.set(["1", "99999999999999999999"])
+    field.validate()
+    assert field.error == error
+    if error in kwargs:
+        assert field.error_args == {error: kwargs[error]}
+
+    field.set(["1", str(-(2**70))])
+    field.validate()
+    assert field.error == (err.INVALID if "gt" not in kwargs else err.GT)
+
+
+def test_float_item_out_of_range():
+    field = f.ArrayField(float, strict=True, gt=0)
+    field.set([1, -(10**400)])
+    field.validate()
+    assert field.error == err.GT
@@ -46,7 +46,7 @@ def test_callable_default():
 
 
 def test_validate_date_past_date():
-    field = f.DateField(past_date=True, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0))
+    field = f.DateField(past_date=True, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0))
 
     field.set("2023-10-01")
     field.validate()
@@ -59,7 +59,7 @@ def test_validate_date_past_date():
 
 
 def test_validate_date_future_date():
-    field = f.DateField(future_date=True, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0))
+    field = f.DateField(future_date=True, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0))
 
     field.set("2026-01-01")
     field.validate()
@@ -72,7 +72,7 @@ def test_validate_date_future_date():
 
 
 def test_validate_date_future_date_with_offset():
-    field = f.DateField(future_date=True, offset=-5, _utcnow=datetime.datetime(2025, 1, 1, 3, 49, 0))
+    field = f.DateField(future_date=True, offset=-5, clock=lambda: datetime.datetime(2025, 1, 1, 3, 49, 0))
 
     field.set("2025-01-01")
     field.validate()
@@ -165,3 +165,79 @@ def test_invalid_date_one_of():
 
     with pytest.raises(ValueError):
         f.DateField(one_of=["a", "b", "c"])  # Invalid date types
+
+
+@pytest.mark.parametrize("value", [
+    "2024-05-17",
+    "2024-5-17",
+    "2024-05-7",
+    "20240517",
+    "2024-W20-5",
+    "2024-02-30",
+    "2024-05-17 ",
+    "2024/05/17",
+    "２０２４-05-17",
+    "+024-05-17",
+])
+def test_iso_fast_path_matches_strptime(value):
+    try:
+        expected = datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        expected = None
+
+    field = f.DateField(required=False)
+    field.set(value)
+    if expected is None:
+        assert field._error == err.INVALID
+    else:
+        assert field._error is None
+        assert field.value == expected
+
+
+def test_date_multiple_formats():
+    field = f.DateField(["%d/%m/%Y", "%Y-%m-%d", "%b %d %Y"])
+    assert field._parser.formats == ("%Y-%m-%d", "%d/%m/%Y", "%b %d %Y")
+
+    for value in ["2024-05-17", "17/05/2024", "May 17 2024", "17/05/2024"]:
+        field.set(value)
+        field.validate()
+        assert field.value == datetime.date(2024, 5, 17)
+
+    field.set("05.17.2024")
+    field.validate()
+    assert field.error == err.INVALID
+
+
+def test_date_multiple_formats_remembers_the_last_one():
+    field = f.DateField(["%d/%m/%Y", "%d.%m.%Y"])
+    field.set("17.05.2024")
+    assert field._parser._last == 1
+
+    # Shared by the copies of the field in the forms
+    class TestForm(f.Form):
+        day = field
+
+    form = TestForm({"day": "18.05.2024"})
+    assert form.day.value == datetime.date(2024, 5, 18)
+    assert form.day._parser is field._parser
+
+
+def test_date_multiple_formats_keeps_the_order_of_ambiguous_ones():
+    class TestForm(f.Form):
+        day = f.DateField(["%d/%m/%Y", "%m/%d/%Y"])
+
+    form = TestForm({"day": "03/04/2025"})
+    assert form.day.value == datetime.date(2025, 4, 3)
+
+    other = TestForm({"day": "12/31/2025"})
+    assert other.day.value == datetime.date(2025, 12, 31)
+
+    form = TestForm({"day": "03/04/2025"})
+    assert form.day.value == datetime.date(2025, 4, 3)
+    assert form.day._parser._last == 0
+
+
+@pytest.mark.parametrize("format", [[], None, [1]])
+def test_invalid_date_format(format):
+    with pytest.raises(ValueError):
+        f.DateField(format)
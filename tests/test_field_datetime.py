@@ -39,7 +39,7 @@ def test_callable_default():
 
 def test_validate_datetime_past_date():
     field = f.DateTimeField(
-        past_date=True, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0)
+        past_date=True, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0)
     )
 
     field.set("2023-10-01T12:00:00")
@@ -54,7 +54,7 @@ def test_validate_datetime_past_date():
 
 def test_validate_datetime_future_date():
     field = f.DateTimeField(
-        future_date=True, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0)
+        future_date=True, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0)
     )
 
     field.set("2025-01-01T12:50:00")
@@ -69,7 +69,7 @@ def test_validate_datetime_future_date():
 
 def test_validate_datetime_past_date_with_offset():
     field = f.DateTimeField(
-        past_date=True, offset=-5, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0)
+        past_date=True, offset=-5, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0)
     )
 
     field.set("2023-10-01T07:00:00")
@@ -84,7 +84,7 @@ def test_validate_datetime_past_date_with_offset():
 
 def test_validate_datetime_future_date_with_offset():
     field = f.DateTimeField(
-        future_date=True, offset=-5, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0)
+        future_date=True, offset=-5, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0)
     )
 
     field.set("2025-01-01T07:50:00")
@@ -178,3 +178,49 @@ def test_invalid_datetime_one_of():
 
     with pytest.raises(ValueError):
         f.DateTimeField(one_of=["a", "b", "c"])  # Invalid date types
+
+
+@pytest.mark.parametrize("format, value", [
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17T10:20:30"),
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17T1:2:3"),
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17T24:00:00"),
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17T10:20:60"),
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17 10:20:30"),
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17T10:20:30Z"),
+    ("%Y-%m-%dT%H:%M:%S", "2024-05-17T10:20:30.5"),
+    ("%Y-%m-%dT%H:%M", "2024-05-17T10:20"),
+    ("%Y-%m-%dT%H:%M", "2024-05-17T24:00"),
+    ("%Y-%m-%d %H:%M:%S", "2024-05-17 10:20:30"),
+    ("%Y-%m-%d %H:%M", "2024-05-17 10:20"),
+    ("%Y-%m-%d", "2024-05-17"),
+])
+def test_iso_fast_path_matches_strptime(format, value):
+    try:
+        expected = datetime.datetime.strptime(value, format)
+    except ValueError:
+        expected = None
+
+    field = f.DateTimeField(format, required=False)
+    field.set(value)
+    if expected is None:
+        assert field._error == err.INVALID
+    else:
+        assert field._error is None
+        assert field.value == expected
+
+
+def test_datetime_multiple_formats():
+    # The formats sent by the HTML "datetime-local" inputs, with and without seconds
+    field = f.DateTimeField(["%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M"])
+
+    field.set("2024-05-17T10:20")
+    field.validate()
+    assert field.value == datetime.datetime(2024, 5, 17, 10, 20)
+
+    field.set("2024-05-17T10:20:30")
+    field.validate()
+    assert field.value == datetime.datetime(2024, 5, 17, 10, 20, 30)
+
+    field.set("2024-05-17")
+    field.validate()
+    assert field.error == err.INVALID
@@ -0,0 +1,204 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import random
+from decimal import Decimal, localcontext
+
+import pytest
+
+import formidable as f
+from formidable import errors as err
+
+
+def test_decimal_field():
+    class TestForm(f.Form):
+        price = f.DecimalField()
+        discount = f.DecimalField(default=0)
+
+    form = TestForm({"price": ["19.99"]})
+
+    assert form.price.name == "price"
+    assert form.price.value == Decimal("19.99")
+    assert form.discount.value == Decimal("0")
+
+    data = form.save()
+    assert data == {
+        "price": Decimal("19.99"),
+        "discount": Decimal("0"),
+    }
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1.10", Decimal("1.10")),
+    (" -3 ", Decimal("-3")),
+    ("1e3", Decimal("1000")),
+    (5, Decimal("5")),
+    (0.1, Decimal("0.1")),
+    (Decimal("2.5"), Decimal("2.5")),
+])
+def test_filter_value(value, expected):
+    field = f.DecimalField()
+    field.set(value)
+    field.validate()
+    assert field.error is None
+    assert field.value == expected
+
+
+@pytest.mark.parametrize("value", ["abc", "NaN", "inf", "-Infinity", "1e-5000", True])
+def test_invalid_value(value):
+    field = f.DecimalField()
+    field.set(value)
+    field.validate()
+    assert field.error == err.INVALID
+
+
+def test_multiple_of_is_exact():
+    field = f.DecimalField(multiple_of=0.1)
+    assert field.multiple_of == Decimal("0.1")
+    for value in ("0.3", "0.7", "-1.1", "12", "0.30"):
+        field.set(value)
+        field.validate()
+        assert field.error is None, value
+
+    for value in ("0.35", "0.01", "0.10000000000000001"):
+        field.set(value)
+        field.validate()
+        assert field.error == err.MULTIPLE_OF, value
+        assert field.error_args == {"multiple_of": Decimal("0.1")}
+
+
+@pytest.mark.parametrize("kwargs, value, error", [
+    ({"gt": "0.5"}, "0.5", err.GT),
+    ({"gt": "0.5"}, "0.50001", None),
+    ({"gte": "0.5"}, "0.49999", err.GTE),
+    ({"gte": "0.5"}, "0.500", None),
+    ({"lt": 10}, "9.99999", None),
+    ({"lt": 10}, "10", err.LT),
+    ({"lte": "9.99"}, "9.991", err.LTE),
+    ({"lte": "9.99"}, "-100", None),
+    ({"one_of": [Decimal("1.5"), 2]}, "2.0", None),
+    ({"one_of": [Decimal("1.5"), 2]}, "2.5", err.ONE_OF),
+])
+def test_validate_limits(kwargs, value, error):
+    field = f.DecimalField(**kwargs)
+    field.set(value)
+    field.validate()
+    assert field.error == error
+    if error:
+        assert field.error_args == {error: getattr(field, error)}
+
+
+def test_validate_scale():
+    field = f.DecimalField(scale=2)
+    for value in ("1", "1.5", "1.25", "1.2500", "-0.01"):
+        field.set(value)
+        field.validate()
+        assert field.error is None, value
+
+    field.set("1.255")
+    field.validate()
+    assert field.error == err.SCALE
+    assert field.error_args == {"scale": 2}
+
+
+def test_validate_precision():
+    field = f.DecimalField(precision=5, scale=2)
+    for value in ("999.99", "-999.99", "0.01", "100"):
+        field.set(value)
+        field.validate()
+        assert field.error is None, value
+
+    for value in ("1000", "-1000.5", "1e3"):
+        field.set(value)
+        field.validate()
+        assert field.error == err.PRECISION, value
+        assert field.error_args == {"precision": 5}
+
+    field = f.DecimalField(precision=3)
+    for value in ("123", "1.23", "0.001", "12.300"):
+        field.set(value)
+        field.validate()
+        assert field.error is None, value
+
+    for value in ("1234", "1.234", "0.0001", "1e3"):
+        field.set(value)
+        field.validate()
+        assert field.error == err.PRECISION, value
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"gt": "abc"},
+    {"lte": float("nan")},
+    {"multiple_of": 0},
+    {"multiple_of": "-0.5"},
+    {"precision": 0},
+    {"scale": -1},
+    {"precision": 2, "scale": 3},
+])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        f.DecimalField(**kwargs)
+
+
+def test_decimal_locale():
+    field = f.DecimalField(locale="de", multiple_of="0.01")
+    field.set("1.234,56")
+    field.validate()
+    assert field.value == Decimal("1234.56")
+    assert field.error is None
+
+    field = f.DecimalField(locale="fr")
+    field.set("1 234,5")
+    field.validate()
+    assert field.value == Decimal("1234.5")
+
+
+def test_ignores_decimal_context():
+    field = f.DecimalField(lte="1.000000001", multiple_of="0.000000001")
+    with localcontext(prec=3):
+        field.set("1.000000002")
+        field.validate()
+        assert field.error == err.LTE
+
+        field.set("1.000000001")
+        field.validate()
+        assert field.error is None
+
+
+def test_validate_like_decimal():
+    rnd = random.Random(42)
+    for _ in range(500):
+        limits = {
+            "gt": Decimal(rnd.randint(-500, 0)) / 100,
+            "lt": Decimal(rnd.randint(0, 500)) / 100,
+            "multiple_of": Decimal(rnd.choice([1, 5, 25, 50])) / 100,
+        }
+        kwargs = {key: value for key, value in limits.items() if rnd.random() < 0.6}
+        value = Decimal(rnd.randint(-6000, 6000)) / 1000
+
+        field = f.DecimalField(**kwargs)
+        field.set(str(value))
+        field.validate()
+
+        expected = None
+        if "gt" in kwargs and not value > kwargs["gt"]:
+            expected = err.GT
+        elif "lt" in kwargs and not value < kwargs["lt"]:
+            expected = err.LT
+        elif "multiple_of" in kwargs and value % kwargs["multiple_of"] != 0:
+            expected = err.MULTIPLE_OF
+        assert field.error == expected, (kwargs, value)
+
+
+def test_decimal_column():
+    class TestForm(f.Form):
+        price = f.DecimalField(gt=0, scale=2, locale="de")
+
+    result = TestForm.validate_columns({
+        "price": ["1.234,50", "0", "1,234", "abc", "0,3"],
+    })
+    assert result.columns["price"][0] == Decimal("1234.50")
+    assert result.column_errors == {
+        "price": [None, err.GT, err.SCALE, err.INVALID, None],
+    }
@@ -2,10 +2,15 @@
 Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
+import asyncio
+import threading
+import time
+
 import pytest
 
 import formidable as f
 from formidable import errors as err
+from formidable.fields.email import get_dns_key, resolve_domain
 
 
 def test_email_field():
@@ -55,6 +60,19 @@ def test_email_field_invalid():
     assert form.email.error == err.INVALID_EMAIL
 
 
+def test_email_field_max_input_length(email_calls):
+    field = f.EmailField()
+    field.set("a" * 2000 + "@example.com")
+    field.validate()
+    assert field.error == err.INPUT_TOO_LONG
+    assert email_calls == []
+
+    field = f.EmailField(max_input_length=20)
+    field.set("hello@example.com")
+    field.validate()
+    assert field.error is None
+
+
 def test_validate_one_of():
     one_of = ["apple@example.com", "banana@example.com", "cherry@example.com"]
     field = f.EmailField(one_of=one_of, required=False)
@@ -72,3 +90,222 @@ def test_validate_one_of():
 def test_invalid_one_of():
     with pytest.raises(ValueError):
         f.EmailField(one_of="not a list")
+
+
+@pytest.fixture
+def email_calls(monkeypatch):
+    from formidable.fields import email
+
+    calls = []
+    real_validate_email = email.validate_email
+
+    def fake_validate_email(value, check_deliverability, **kwargs):
+        calls.append((value, check_deliverability))
+        if check_deliverability and value.endswith("@nomx.example"):
+            raise ValueError("undeliverable")
+        return real_validate_email(value, check_deliverability=False, **kwargs)
+
+    monkeypatch.setattr(email, "validate_email", fake_validate_email)
+    monkeypatch.setattr(f.EmailField, "normalize_cache", f.MemoryCache())
+    monkeypatch.setattr(f.EmailField, "dns_cache", f.MemoryCache())
+    return calls
+
+
+def test_normalization_is_cached(email_calls):
+    field = f.EmailField()
+    for _ in range(3):
+        field.set("Zoe@Mail.example")
+        assert field.value == "Zoe@mail.example"
+        field.set("not an email")
+        assert not field.validate()
+        assert field.error == err.INVALID_EMAIL
+
+    assert email_calls == [("Zoe@Mail.example", False), ("not an email", False)]
+    assert f.EmailField.normalize_cache.hits == 4
+    assert f.EmailField.normalize_cache.misses == 2
+
+
+def test_normalization_cache_key_includes_options(email_calls):
+    f.EmailField().set("zoe@mail.example")
+    f.EmailField(strict=False).set("zoe@mail.example")
+    f.EmailField(allow_smtputf8=True).set("zoe@mail.example")
+    f.EmailField(allow_smtputf8=True).set("zoe@mail.example")
+
+    assert len(email_calls) == 3
+
+
+def test_dns_check_is_cached(monkeypatch):
+    monkeypatch.setattr(f.EmailField, "dns_cache", f.MemoryCache())
+    calls = []
+
+    def resolver(domain):
+        calls.append(domain)
+        return domain != "nomx.example"
+
+    class TestForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+
+    for _ in range(2):
+        assert TestForm({"email": "zoe@mail.example"}).is_valid
+        assert TestForm({"email": "ana@mail.example"}).is_valid
+        assert TestForm({"email": "zoe@nomx.example"}).is_invalid
+
+    assert calls == ["mail.example", "nomx.example"]
+
+    # The results expire
+    monkeypatch.setattr(f.EmailField, "dns_ttl", 0.01)
+    f.EmailField.dns_cache.clear()
+    assert TestForm({"email": "zoe@mail.example"}).is_valid
+    time.sleep(0.02)
+    assert TestForm({"email": "zoe@mail.example"}).is_valid
+    assert calls == ["mail.example", "nomx.example"] + ["mail.example"] * 2
+
+
+class FakeResolver:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, domain):
+        with self.lock:
+            self.calls.append(domain)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if domain == "down.example":
+            raise OSError("network is down")
+        return domain != "nomx.example"
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    monkeypatch.setattr(f.EmailField, "dns_cache", f.MemoryCache())
+    return FakeResolver()
+
+
+def test_dns_checks_are_batched_in_form_tree(resolver):
+    class ContactForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+
+    class CompanyForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+        contacts = f.NestedForms(ContactForm)
+
+    assert CompanyForm._has_lookups
+    assert ContactForm._has_lookups
+
+    domains = ["a.example", "b.example", "nomx.example", "c.example"]
+    form = CompanyForm({
+        "email": "boss@a.example",
+        "contacts[0][email]": "x@a.example",
+        "contacts[1][email]": "y@b.example",
+        "contacts[2][email]": "z@nomx.example",
+        "contacts[3][email]": "w@c.example",
+    })
+    start = time.perf_counter()
+    assert form.is_invalid
+    elapsed = time.perf_counter() - start
+
+    assert sorted(resolver.calls) == sorted(domains)
+    assert resolver.max_running > 1
+    assert elapsed < resolver.delay * len(domains)
+    assert form.contacts.error_args == {2: {"email": "invalid_email"}}
+
+
+def test_dns_checks_are_batched_in_validate_many(resolver):
+    class ContactForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+        name = f.TextField(required=False)
+
+    rows = [{"email": f"user{i}@{d}.example"} for i in range(50) for d in "abc"]
+    rows.append({"email": "user@nomx.example"})
+    results = list(ContactForm.validate_many(rows))
+
+    assert len(results) == len(rows)
+    assert all(result.valid for result in results[:-1])
+    assert results[0].data == {"email": "user0@a.example", "name": ""}
+    assert results[-1].errors == {"email": "invalid_email"}
+    assert sorted(resolver.calls) == ["a.example", "b.example", "c.example", "nomx.example"]
+    assert resolver.max_running > 1
+
+
+def test_dns_checks_are_batched_in_async_validation(resolver):
+    class ContactForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+        other = f.EmailField(check_dns=True, resolver=resolver)
+
+    form = ContactForm({"email": "a@a.example", "other": "b@b.example"})
+    assert asyncio.run(form.ais_valid())
+    assert sorted(resolver.calls) == ["a.example", "b.example"]
+    assert resolver.max_running == 2
+
+
+def test_dns_check_resolver_errors_are_not_cached(resolver):
+    class ContactForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+        other = f.EmailField(check_dns=True, resolver=resolver)
+
+    form = ContactForm({"email": "a@a.example", "other": "b@down.example"})
+    with pytest.raises(OSError):
+        form.validate()
+    assert f.EmailField.dns_cache.get(get_dns_key(resolver, "a.example")) is True
+    assert f.EmailField.dns_cache.get(get_dns_key(resolver, "down.example")) is None
+
+
+def test_dns_cache_is_per_resolver(monkeypatch):
+    monkeypatch.setattr(f.EmailField, "dns_cache", f.MemoryCache())
+    calls = []
+
+    def accept(domain):
+        calls.append(("accept", domain))
+        return True
+
+    def reject(domain):
+        calls.append(("reject", domain))
+        return False
+
+    class AcceptForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=accept)
+
+    class RejectForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=reject)
+
+    class BothForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=accept)
+        other = f.EmailField(check_dns=True, resolver=reject)
+
+    assert AcceptForm({"email": "x@example.org"}).is_valid
+    assert RejectForm({"email": "x@example.org"}).is_invalid
+
+    form = BothForm({"email": "x@example.com", "other": "y@example.com"})
+    assert form.is_invalid
+    assert form.get_errors() == {"other": err.INVALID_EMAIL}
+    assert sorted(calls) == [
+        ("accept", "example.com"),
+        ("accept", "example.org"),
+        ("reject", "example.com"),
+        ("reject", "example.org"),
+    ]
+    assert get_dns_key(accept, "example.org") != get_dns_key(reject, "example.org")
+    assert get_dns_key(resolve_domain, "example.org") == "example.org"
+
+
+def test_dns_prefetch_reuses_threads(resolver):
+    from formidable.fields import email
+
+    class ContactForm(f.Form):
+        email = f.EmailField(check_dns=True, resolver=resolver)
+        other = f.EmailField(check_dns=True, resolver=resolver)
+
+    assert ContactForm({"email": "a@a.example", "other": "b@b.example"}).is_valid
+    executor = email._executor
+    assert executor is not None
+
+    assert ContactForm({"email": "a@c.example", "other": "b@d.example"}).is_valid
+    assert email._executor is executor
+    assert resolver.max_running == 2
@@ -143,3 +143,63 @@ def test_validate_one_of():
 def test_invalid_one_of():
     with pytest.raises(ValueError):
         f.ListField(one_of="not a list")
+
+
+@pytest.mark.parametrize("type, items, expected", [
+    (int, ["1", "2", "x", "3"], [1, 2, 3]),
+    (float, ["1.5", None, "2"], [1.5, 2.0]),
+    (str, [1, "a"], ["1", "a"]),
+])
+def test_fast_cast(type, items, expected):
+    field = f.ListField(type)
+    field.set(items)
+    assert field.value == expected
+
+    field = f.ListField(type, strict=True)
+    field.set(items)
+    field.validate()
+    assert field.error == (None if len(items) == len(expected) else err.INVALID)
+
+
+def test_unique():
+    field = f.ListField(int, unique=True, max_items=3)
+    field.set(["3", "1", "3", "2", "1", "03"])
+    field.validate()
+    assert field.error is None
+    assert field.value == [3, 1, 2]
+
+    field = f.ListField(unique=True)
+    field.set([[1], [2], [1]])
+    assert field.value == [[1], [2]]
+
+
+def test_sort():
+    field = f.ListField(int, sort=True)
+    field.set(["3", "1", "2", "1"])
+    assert field.value == [1, 1, 2, 3]
+
+    field = f.ListField(int, sort=True, unique=True)
+    field.set(["3", "1", "2", "1"])
+    assert field.value == [1, 2, 3]
+
+    field = f.ListField(sort=True)
+    field.set([1, "a"])
+    field.validate()
+    assert field.error == err.INVALID
+
+
+def test_validate_one_of_many_values():
+    one_of = [str(i) for i in range(5000)]
+    field = f.ListField(one_of=one_of)
+
+    field.set(one_of[::-1])
+    field.validate()
+    assert field.error is None
+
+    field.set(one_of + ["5000"])
+    field.validate()
+    assert field.error == err.ONE_OF
+
+    field.set([["1"]])
+    field.validate()
+    assert field.error == err.ONE_OF
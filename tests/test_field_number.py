@@ -194,3 +194,80 @@ def test_validate_one_of_float():
 def test_invalid_one_of(FieldType):
     with pytest.raises(ValueError):
         FieldType(one_of="not a list")
+
+
+@pytest.mark.parametrize("locale, value, expected", [
+    ("en", "1,234,567.5", 1234567.5),
+    ("en_US", "1234.5", 1234.5),
+    ("de", "1.234.567,5", 1234567.5),
+    ("de-DE", "-1.234", -1234.0),
+    ("es_ES.UTF-8", "0,25", 0.25),
+    ("fr", "1 234,5", 1234.5),
+    ("fr_FR", "1 234,5", 1234.5),
+    ("pl", "1 234", 1234.0),
+    ("de_CH", "1'234.5", 1234.5),
+    ("pt_BR", "1.234,5", 1234.5),
+    ("pt_PT", "1 234,5", 1234.5),
+    ("de", "1e3", 1000.0),
+])
+def test_float_locale(locale, value, expected):
+    field = f.FloatField(locale=locale)
+    field.set(value)
+    field.validate()
+    assert field.error is None
+    assert field.value == expected
+
+
+@pytest.mark.parametrize("locale, value", [
+    ("en", "1,5"),
+    ("en", "12,34,567"),
+    ("de", "1.5"),
+    ("de", "1234.5"),
+    ("de", "1,5,0"),
+    ("de", "1,234.5"),
+    ("fr", "12 34"),
+])
+def test_float_locale_invalid(locale, value):
+    field = f.FloatField(locale=locale)
+    field.set(value)
+    field.validate()
+    assert field.error == err.INVALID
+
+
+def test_integer_locale():
+    field = f.IntegerField(locale="de", gt=1000)
+    field.set("1.234")
+    field.validate()
+    assert field.value == 1234
+    assert field.error is None
+
+    field.set("1.234,5")
+    field.validate()
+    assert field.error == err.INVALID
+
+    field.locale = "en"
+    field.set("1,234")
+    field.validate()
+    assert field.value == 1234
+
+    field.locale = None
+    field.set("1,234")
+    field.validate()
+    assert field.error == err.INVALID
+
+
+def test_invalid_locale():
+    with pytest.raises(ValueError):
+        f.IntegerField(locale="xx")
+
+
+def test_locale_column():
+    class TestForm(f.Form):
+        price = f.FloatField(locale="de", gte=0)
+
+    result = TestForm.validate_columns({"price": ["1.234,5", "2", "-1,5"]})
+    assert result.columns == {"price": [1234.5, 2.0, -1.5]}
+    assert result.column_errors == {"price": [None, None, err.GTE]}
+
+    result = TestForm.validate_columns({"price": ["1.5", "2"]})
+    assert result.column_errors == {"price": [err.INVALID, None]}
@@ -68,3 +68,204 @@ def test_validate_one_of():
 def test_invalid_one_of():
     with pytest.raises(ValueError):
         f.SlugField(one_of="not a list")
+
+
+@pytest.mark.parametrize("value", (
+    "already-a-slug",
+    "with_underscore",
+    "a",
+    "123",
+    "a_-b",
+    "-leading",
+    "trailing_",
+    "double--dash",
+    "UPPER-case",
+    "with space",
+    "dot.ted",
+    "",
+    "__",
+))
+def test_slugify_ascii_fast_path(value):
+    from formidable.fields.slug import _rx_non_word, _rx_sep, slugify
+
+    expected = _rx_sep.sub("-", _rx_non_word.sub("", value.lower())).strip("-_")
+    assert slugify(value) == expected
+
+
+def test_slug_field_cache():
+    calls = []
+
+    def slugify(value):
+        calls.append(value)
+        return value.lower()
+
+    field = f.SlugField(slugify=slugify, cache_size=2)
+    for value in ["A", "B", "A", "C", "A", "B"]:
+        field.set(value)
+    assert field.value == "b"
+    assert calls == ["A", "B", "C", "B"]
+
+
+def test_slug_field_invalid_cache_size():
+    with pytest.raises(ValueError):
+        f.SlugField(cache_size=-1)
+
+
+def test_slug_field_max_input_length():
+    calls = []
+
+    def slugify(value):
+        calls.append(value)
+        return value.lower()
+
+    field = f.SlugField(slugify=slugify)
+    field.set("a" * 4097)
+    field.validate()
+    assert field.error == err.INPUT_TOO_LONG
+    assert calls == []
+
+    field = f.SlugField(slugify=slugify, max_input_length=10)
+    field.set("Hello")
+    field.validate()
+    assert field.value == "hello"
+    assert calls == ["Hello"]
+
+
+def test_translate_table_is_loaded_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, formidable as f\n"
+        "assert 'formidable.fields.slug_table' not in sys.modules\n"
+        "assert f.SlugField().filter_value('Hello World') == 'hello-world'\n"
+        "assert 'formidable.fields.slug_table' not in sys.modules\n"
+        "assert f.SlugField().filter_value('Café') == 'cafe'\n"
+        "assert 'formidable.fields.slug_table' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_char_map():
+    from formidable.fields import slug
+
+    assert slug.CHAR_MAP["ä"] == "ae"
+    assert slug.CHAR_MAP["ç"] == "c"
+    assert len(slug.CHAR_MAP) == len(slug.get_translate_table())
+
+
+class FakeSlugLookup:
+    def __init__(self, taken):
+        self.taken = set(taken)
+        self.calls = []
+
+    def __call__(self, candidates):
+        self.calls.append(list(candidates))
+        return [slug for slug in candidates if slug in self.taken]
+
+
+def test_unique_slug():
+    lookup = FakeSlugLookup(["hello-world", "hello-world-2"])
+
+    class PageForm(f.Form):
+        slug = f.SlugField(unique=lookup)
+
+    form = PageForm({"slug": "Hello World"})
+    assert form.is_valid
+    assert form.slug.value == "hello-world-3"
+    assert len(lookup.calls) == 1
+
+    form = PageForm({"slug": "Other"})
+    assert form.is_valid
+    assert form.slug.value == "other"
+
+
+def test_unique_slug_of_edited_object():
+    lookup = FakeSlugLookup(["hello-world"])
+
+    class PageForm(f.Form):
+        slug = f.SlugField(unique=lookup)
+
+    form = PageForm({}, object={"slug": "hello-world"})
+    assert form.is_valid
+    assert form.slug.value == "hello-world"
+
+
+def test_unique_slug_standalone_field():
+    lookup = FakeSlugLookup(["a"])
+    field = f.SlugField(unique=lookup)
+    field.set("A")
+    assert field.validate()
+    assert field.value == "a-2"
+
+
+def test_unique_slugs_in_nested_forms():
+    lookup = FakeSlugLookup(["post", "post-3"])
+
+    class PostForm(f.Form):
+        slug = f.SlugField(unique=lookup)
+
+    class BlogForm(f.Form):
+        slug = f.SlugField(unique=lookup)
+        posts = f.NestedForms(PostForm)
+
+    assert BlogForm._has_lookups
+
+    form = BlogForm({
+        "slug": "Post",
+        "posts[0][slug]": "Post",
+        "posts[1][slug]": "Other",
+        "posts[2][slug]": "Post",
+    })
+    assert form.is_valid
+    # In field order, and "posts" comes before "slug"
+    assert [post.slug.value for post in form.posts.forms] == ["post-2", "other", "post-4"]
+    assert form.slug.value == "post-5"
+    assert len(lookup.calls) == 1
+    assert sorted(set(lookup.calls[0])) == sorted(lookup.calls[0])
+
+
+def test_unique_slugs_in_validate_many():
+    lookup = FakeSlugLookup(["hello"])
+
+    class PageForm(f.Form):
+        slug = f.SlugField(unique=lookup)
+
+    rows = [{"slug": "Hello"}] * 150
+    slugs = []
+    calls = []
+    for result in PageForm.validate_many(rows):
+        slugs.append(result.data["slug"])
+        calls.append(len(lookup.calls))
+        # Saved as soon as it's validated
+        lookup.taken.add(result.data["slug"])
+
+    assert slugs == [f"hello-{n}" for n in range(2, 152)]
+    # One lookup for the first batch of 100 records
+    assert calls[:100] == [1] * 100
+
+
+def test_unique_slug_popular_title():
+    lookup = FakeSlugLookup(["popular"] + [f"popular-{n}" for n in range(2, 501)])
+    field = f.SlugField(unique=lookup)
+    field.set("Popular")
+    assert field.validate()
+    assert field.value == "popular-501"
+    # 10 + 20 + 40 + 80 + 160 + 320 candidates
+    assert len(lookup.calls) == 6
+
+
+def test_unique_slug_not_found():
+    class AllTaken:
+        calls = 0
+
+        def __call__(self, candidates):
+            self.calls += 1
+            return candidates
+
+    lookup = AllTaken()
+    field = f.SlugField(unique=lookup)
+    field.set("taken")
+    assert not field.validate()
+    assert field.error == err.INVALID
+    assert lookup.calls == 20
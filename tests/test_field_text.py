@@ -75,6 +75,40 @@ def test_invalid_max_length():
         f.TextField(max_length="not an int")  # type: ignore
 
 
+def test_max_input_length():
+    class TestForm(f.Form):
+        name = f.TextField(max_input_length=10)
+
+        def filter_name(self, value):
+            raise AssertionError("should not be called")
+
+    form = TestForm({"name": "x" * 11})
+    assert not form.validate()
+    assert form.name.error == err.INPUT_TOO_LONG
+    assert form.name.error_args == {"max_input_length": 10}
+    assert form.name.error_message == "Must have at most 10 characters"
+
+
+def test_max_input_length_default():
+    assert f.TextField().max_input_length is None
+    assert f.TextField(max_length=5).max_input_length == 20
+    assert f.TextField(max_length=5, max_input_length=8).max_input_length == 8
+
+    field = f.TextField(max_length=5)
+    field.set("  12345  ")
+    field.validate()
+    assert field.error is None
+
+    field.set("1" * 21)
+    field.validate()
+    assert field.error == err.INPUT_TOO_LONG
+
+
+def test_invalid_max_input_length():
+    with pytest.raises(ValueError):
+        f.TextField(max_input_length=0)
+
+
 def test_validate_pattern():
     field = f.TextField(pattern=r"^\d{3}-\d{2}-\d{4}$", required=False)
 
@@ -115,3 +149,41 @@ def test_validate_one_of():
 def test_invalid_one_of():
     with pytest.raises(ValueError):
         f.TextField(one_of="not a list")
+
+
+def test_pattern_is_compiled_once():
+    field = f.TextField(pattern=r"^[a-z]+$")
+    assert field.rx_pattern.pattern == r"^[a-z]+$"
+
+    clone = field.__copy__()
+    assert clone.rx_pattern is field.rx_pattern
+
+
+def test_one_of_index():
+    one_of = [f"value-{i}" for i in range(10_000)]
+    field = f.TextField(one_of=one_of)
+    assert field.one_of is one_of
+    assert isinstance(field._one_of_index, frozenset)
+
+    field.set("value-9999")
+    assert field.validate()
+
+    # Changing `one_of` rebuilds the index
+    field.one_of = ["a", "b"]
+    field.set("value-1")
+    assert not field.validate()
+    assert field.error == err.ONE_OF
+    assert field.error_args == {"one_of": ["a", "b"]}
+
+
+def test_one_of_iterator():
+    field = f.TextField(one_of=(value for value in ["a", "b"]))
+    assert field.one_of == ["a", "b"]
+    for _ in range(2):
+        field.set("b")
+        assert field.validate()
+
+
+def test_one_of_unhashable_values():
+    field = f.ListField(one_of=[[1, 2], [3]])
+    assert field._one_of_index == ([1, 2], [3])
@@ -69,7 +69,7 @@ def test_time_threshold():
 
 
 def test_validate_past_time():
-    field = f.TimeField(past_time=True, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0))
+    field = f.TimeField(past_time=True, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0))
 
     field.set("11:10")
     field.validate()
@@ -87,7 +87,7 @@ def test_validate_past_time():
 
 
 def test_validate_past_time_offset():
-    field = f.TimeField(past_time=True, offset=2, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0))
+    field = f.TimeField(past_time=True, offset=2, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0))
 
     field.set("13:10")
     field.validate()
@@ -105,7 +105,7 @@ def test_validate_past_time_offset():
 
 
 def test_validate_future_time():
-    field = f.TimeField(future_time=True, _utcnow=datetime.datetime(2025, 1, 1, 11, 49, 0))
+    field = f.TimeField(future_time=True, clock=lambda: datetime.datetime(2025, 1, 1, 11, 49, 0))
 
     field.set("23:59")
     field.validate()
@@ -223,3 +223,67 @@ def test_invalid_one_of():
 
     with pytest.raises(ValueError):
         f.TimeField(one_of=["a", "b"])  # Invalid time values
+
+
+def parse_time_with_regex(value):
+    # The regex-based implementation that `parse_time()` replaced
+    import re
+
+    rx_time = re.compile(
+        (
+            r"^(?:"
+            r"(?P<hour>[0-2]?[0-9])"
+            r"|(?P<hour12>[0-2]?[0-9])\s*(?P<tt>am|pm)"
+            r"|(?P<hour_min>[0-2]?[0-9]):(?P<minute>[0-5][0-9])"
+            r"|(?P<hour12_min>[0-2]?[0-9]):(?P<minute12>[0-5][0-9])\s*(?P<tt_min>am|pm)"
+            r"|(?P<hour_sec>[0-2]?[0-9]):(?P<minute_sec>[0-5][0-9]):(?P<second>[0-5][0-9])"
+            r"|(?P<hour12_sec>[0-2]?[0-9]):(?P<minute12_sec>[0-5][0-9]):(?P<second12>[0-5][0-9])\s*(?P<tt_sec>am|pm)"
+            r")$"
+        ),
+        re.IGNORECASE,
+    )
+    match = rx_time.match(value)
+    if not match:
+        return None
+    gd = match.groupdict()
+    hour = int(
+        gd["hour"] or gd["hour12"] or gd["hour_min"] or gd["hour12_min"]
+        or gd["hour_sec"] or gd["hour12_sec"] or 0
+    )
+    minute = int(
+        gd["minute"] or gd["minute12"] or gd["minute_sec"] or gd["minute12_sec"] or 0
+    )
+    second = int(gd["second"] or gd["second12"] or 0)
+    tt = (gd["tt"] or gd["tt_min"] or gd["tt_sec"] or "").upper()
+    if tt == "PM" and hour < 12:
+        hour += 12
+    elif tt == "AM" and hour == 12:
+        hour = 0
+    try:
+        return datetime.time(hour, minute, second)
+    except ValueError:
+        return None
+
+
+def test_parse_time_matches_the_old_regex():
+    import random
+
+    from formidable.fields.time import parse_time
+
+    rnd = random.Random(42)
+    pieces = [
+        "0", "1", "2", "5", "9", "00", "07", "12", "13", "23", "24", "29", "30",
+        "59", "60", "123", ":", ":", ":", " ", "  ", "\t", " ",
+        "am", "pm", "AM", "Pm", "a", "m", "x", "٣", "²", "-",
+    ]
+    values = [
+        "14", "2pm", "2 PM", "12am", "12 pm", "0am", "13pm", "14:30", "2:30 am",
+        "14:30:15", "2:30:15pm", "12:00:00 AM", "24", "25:00", "12:60", "9:5",
+        "am", "pm", "", ":", "10::", "10:30:", "1:2:3",
+    ]
+    for _ in range(20_000):
+        values.append("".join(rnd.choice(pieces) for _ in range(rnd.randint(1, 6))))
+
+    for value in values:
+        value = value.strip()
+        assert parse_time(value) == parse_time_with_regex(value), repr(value)
@@ -2,6 +2,9 @@
 Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
 """
 
+import gc
+import weakref
+
 import pytest
 
 import formidable as f
@@ -330,6 +333,62 @@ def test_custom_validator_with_error():
     assert form.name.error == "no-z-names"
 
 
+def test_static_custom_filter():
+    class TestForm(f.Form):
+        name = f.TextField()
+
+        @staticmethod
+        def filter_name(value):
+            return value.upper()
+
+    form = TestForm({"name": "Zoe"})
+    assert form.is_valid
+    assert form.name.value == "ZOE"
+
+
+def test_field_parent():
+    class TestForm(f.Form):
+        name = f.TextField()
+
+    form = TestForm()
+    assert form.name.parent is form
+    assert TestForm.name.parent is None
+
+
+def test_form_freed_without_cyclic_gc():
+    class ChildForm(f.Form):
+        meh = f.TextField()
+
+    class TestForm(f.Form):
+        name = f.TextField()
+        child = f.FormField(ChildForm)
+        children = f.NestedForms(ChildForm)
+
+        def filter_name(self, value):
+            return value
+
+        def validate_name(self, value):
+            return value
+
+    gc.collect()
+    gc.disable()
+    try:
+        form = TestForm({
+            "name": "Zoe",
+            "child[meh]": "a",
+            "children[0][meh]": "b",
+        })
+        assert form.is_valid
+        form.hidden_tags()
+        ref = weakref.ref(form)
+        sub_ref = weakref.ref(form.children.forms[0])
+        del form
+        assert ref() is None
+        assert sub_ref() is None
+    finally:
+        gc.enable()
+
+
 def test_boolean_custom_filter_with_error():
     class TestForm(f.Form):
         bool = f.BooleanField()
@@ -410,3 +469,196 @@ def test_hidden_tags_full():
         '<input type="hidden" name="_id" value="42" />'
     )
     assert str(form.hidden_tags()) == expected
+
+
+def test_reset():
+    class ChildForm(f.Form):
+        meh = f.TextField()
+
+    class TestForm(f.Form):
+        name = f.TextField()
+        age = f.IntegerField(default=18)
+        child = f.FormField(ChildForm)
+        children = f.NestedForms(ChildForm)
+
+    form = TestForm({"name": "", "age": "20", "children[0][meh]": "a"})
+    assert form.is_invalid
+    assert form.children.forms
+
+    form.reset()
+    assert form._valid is None
+    assert form.name.value is None
+    assert form.name.error is None
+    assert form.name._error is None
+    assert form.age.value == 18
+    assert form.children.forms == []
+    assert form.child.form.meh.value is None
+    assert not form._object.exists()
+
+    form.reset({"name": "Zoe", "child[meh]": "b"}, object={"id": 3})
+    assert form.is_valid
+    assert form.name.value == "Zoe"
+    assert form.age.value == 18
+    assert form.child.form.meh.value == "b"
+    assert form._object.object == {"id": 3}
+
+
+def test_reset_deleted():
+    class TestForm(f.Form):
+        name = f.TextField()
+
+    form = TestForm({"name": "Zoe"})
+    form.reset({"_destroy": "1"})
+    assert form._deleted
+    assert form.name.value is None
+
+    form.reset({"name": "Bob"})
+    assert not form._deleted
+    assert form.name.value == "Bob"
+
+
+def test_validate_many():
+    class ChildForm(f.Form):
+        meh = f.TextField(required=False)
+
+    class TestForm(f.Form):
+        name = f.TextField()
+        age = f.IntegerField(required=False, gte=18)
+        child = f.FormField(ChildForm, required=False)
+        children = f.NestedForms(ChildForm)
+
+    items = [
+        {"name": "Zoe", "age": "20", "children[0][meh]": "a"},
+        {"name": "", "age": "12"},
+        {},
+        {"name": "Bob", "child[meh]": "b"},
+    ]
+    results = TestForm.validate_many(iter(items))
+    assert not isinstance(results, list)
+
+    assert list(results) == [
+        (True, {}, {
+            "name": "Zoe",
+            "age": 20,
+            "child": {"meh": ""},
+            "children": [{"meh": "a"}],
+        }),
+        (False, {"name": "required", "age": "gte"}, None),
+        (False, {"name": "required"}, None),
+        (True, {}, {
+            "name": "Bob",
+            "age": None,
+            "child": {"meh": "b"},
+            "children": [],
+        }),
+    ]
+
+
+def test_validate_many_does_not_save():
+    class Model:
+        def __init__(self, **data):
+            raise AssertionError("should not be called")
+
+    class TestForm(f.Form):
+        class Meta:
+            orm_cls = Model
+
+        name = f.TextField()
+
+    result = next(TestForm.validate_many([{"name": "Zoe"}]))
+    assert result.valid
+    assert result.data == {"name": "Zoe"}
+
+
+def test_field_named_many():
+    class TestForm(f.Form):
+        many = f.TextField()
+
+    assert TestForm._custom_validators == set()
+    form = TestForm({"many": "x"})
+    assert form.is_valid
+
+
+def make_clock_forms():
+    import datetime
+
+    calls = []
+    # Just before midnight, the days of the rows must not change midway
+    times = iter([
+        datetime.datetime(2025, 1, 1, 23, 59, 59, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2025, 1, 2, 0, 0, 0, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2025, 1, 2, 0, 0, 1, tzinfo=datetime.timezone.utc),
+    ])
+
+    def fake_clock():
+        calls.append(1)
+        return next(times)
+
+    class RowForm(f.Form):
+        day = f.DateField(past_date=True)
+        at = f.TimeField(required=False, past_time=True)
+
+    class TestForm(f.Form):
+        class Meta:
+            clock = fake_clock
+
+        first = f.FormField(RowForm)
+        rows = f.NestedForms(RowForm)
+
+    reqdata = {
+        "first[day]": "2025-01-01",
+        "rows[0][day]": "2024-12-31",
+        "rows[1][day]": "2025-01-01",
+        "rows[1][at]": "23:00",
+    }
+    return TestForm, reqdata, calls
+
+
+def test_clock_is_read_once_per_validation():
+    TestForm, reqdata, calls = make_clock_forms()
+
+    form = TestForm(reqdata)
+    assert not form.validate()
+    assert calls == [1]
+    assert form.first.form.day.error == "past_date"
+    assert form.rows.forms[1].day.error == "past_date"
+    assert form.rows.forms[1].at.error is None
+
+    # The time is taken again for the next validation
+    form.validate()
+    assert calls == [1, 1]
+    form.reset(reqdata)
+    form.validate()
+    assert calls == [1, 1, 1]
+
+
+def test_clock_is_read_once_per_async_validation():
+    import asyncio
+
+    TestForm, reqdata, calls = make_clock_forms()
+
+    form = TestForm(reqdata)
+    assert not asyncio.run(form.ais_valid())
+    assert calls == [1]
+    assert form.rows.forms[1].day.error == "past_date"
+
+
+def test_field_clock_overrides_form_clock():
+    import datetime
+
+    class TestForm(f.Form):
+        class Meta:
+            clock = lambda: datetime.datetime(2025, 1, 1)  # noqa: E731
+
+        day = f.DateField(past_date=True, clock=lambda: datetime.datetime(2030, 1, 1))
+
+    assert TestForm({"day": "2026-01-01"}).is_valid
+
+
+def test_invalid_clock():
+    with pytest.raises(ValueError):
+        class TestForm(f.Form):
+            class Meta:
+                clock = "now"
+
+            day = f.DateField()
@@ -0,0 +1,130 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import formidable as f
+
+
+class SkillForm(f.Form):
+    name = f.TextField()
+    level = f.IntegerField(default=1)
+
+
+def test_pool_reuses_instances():
+    pool = f.FormPool(SkillForm)
+
+    with pool.form({"name": "Python", "level": "5"}) as form:
+        assert form.is_valid
+        assert form.save() == {"name": "Python", "level": 5}
+        first = form
+
+    assert len(pool) == 1
+    assert first.name.value is None
+
+    with pool.form({"name": ""}) as form:
+        assert form is first
+        assert form.is_invalid
+        assert form.level.value == 1
+        assert form.get_errors() == {"name": "required"}
+
+    with pool.form() as form:
+        assert form is first
+        assert form._valid is None
+        assert form.name.error is None
+
+
+def test_pool_max_size():
+    pool = f.FormPool(SkillForm, max_size=1)
+
+    form1 = pool.acquire()
+    form2 = pool.acquire()
+    assert form1 is not form2
+
+    pool.release(form1)
+    pool.release(form2)
+    assert len(pool) == 1
+
+
+def test_pool_options():
+    pool = f.FormPool(
+        SkillForm,
+        name_format="skill[{name}]",
+        messages={"required": "meh"},
+    )
+    form = pool.acquire({})
+    assert form.name.name == "skill[name]"
+    assert form.is_invalid
+    assert form.name.error_message == "meh"
+
+
+def test_pool_per_thread():
+    pool = f.FormPool(SkillForm)
+    pool.release(pool.acquire())
+    assert len(pool) == 1
+
+    sizes = []
+    thread = threading.Thread(target=lambda: sizes.append(len(pool)))
+    thread.start()
+    thread.join()
+    assert sizes == [0]
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        f.FormPool(SkillForm, max_size=-1)
+
+
+def test_pool_release_twice():
+    pool = f.FormPool(SkillForm)
+    form = pool.acquire()
+    pool.release(form)
+    pool.release(form)
+    assert len(pool) == 1
+
+    assert pool.acquire() is form
+    assert pool.acquire() is not form
+
+
+def test_pool_release_other_form():
+    class OtherForm(f.Form):
+        name = f.TextField()
+
+    pool = f.FormPool(SkillForm)
+    with pytest.raises(ValueError):
+        pool.release(OtherForm())
+    assert len(pool) == 0
+
+
+def test_pool_discards_pending_validations():
+    class SecretForm(f.Form):
+        class Meta:
+            executor = ThreadPoolExecutor(max_workers=2)
+
+        check = f.TextField()
+        secret = f.TextField()
+
+        def validate_check(self, value):
+            if value == "boom":
+                raise RuntimeError("boom")
+            return value
+
+        @f.expensive
+        def validate_secret(self, value):
+            return value
+
+    pool = f.FormPool(SecretForm)
+    with pytest.raises(RuntimeError):
+        with pool.form({"check": "boom", "secret": "first-user-secret"}) as form:
+            form.validate()
+
+    assert form.secret._future is None
+
+    with pool.form({"check": "ok", "secret": "second"}) as second:
+        assert second is form
+        assert second.is_valid
+        assert second.secret.value == "second"
@@ -0,0 +1,184 @@
+"""
+Formidable | Copyright (c) 2025 Juan-Pablo Scaletti
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import formidable as f
+from formidable import errors as err
+
+
+executor = ThreadPoolExecutor(max_workers=4)
+
+
+def test_field_timeout_with_executor():
+    class TestForm(f.Form):
+        class Meta:
+            executor = executor
+            timeouts = {"slow": 0.05}
+
+        slow = f.TextField()
+        fast = f.TextField()
+
+        @f.expensive
+        def validate_slow(self, value):
+            time.sleep(0.3)
+            return value.upper()
+
+    form = TestForm({"slow": "a", "fast": "b"})
+    start = time.perf_counter()
+    assert form.is_invalid
+    assert time.perf_counter() - start < 0.25
+
+    assert form.get_errors() == {"slow": err.TIMEOUT}
+    assert form.slow.error_message == err.MESSAGES[err.TIMEOUT]
+    assert form.slow._future is None
+
+    # The abandoned validation doesn't change the field later
+    time.sleep(0.35)
+    assert form.slow.value == "a"
+    assert form.slow.error == err.TIMEOUT
+
+    timings = form.get_timings()
+    assert list(timings) == ["fast", "slow"]
+    assert 0.04 < timings["slow"] < 0.25
+
+
+def test_field_timeout_sync():
+    class TestForm(f.Form):
+        class Meta:
+            timeouts = {"slow": 0.01}
+
+        slow = f.TextField()
+        fast = f.TextField()
+
+        def validate_slow(self, value):
+            time.sleep(0.03)
+            return value
+
+    form = TestForm({"slow": "a", "fast": "b"})
+    assert form.is_invalid
+    assert form.get_errors() == {"slow": err.TIMEOUT}
+    assert form.get_timings()["slow"] >= 0.03
+
+
+def test_form_timeout_skips_remaining_fields():
+    calls = []
+
+    class TestForm(f.Form):
+        class Meta:
+            timeout = 0.02
+
+        a = f.TextField()
+        b = f.TextField()
+        c = f.TextField()
+        d = f.TextField()
+
+        def validate_a(self, value):
+            calls.append("a")
+            time.sleep(0.03)
+            return value
+
+        def validate_b(self, value):
+            calls.append("b")
+            return value
+
+    form = TestForm({"a": "1", "b": "2", "c": ""})
+    assert form.is_invalid
+    assert calls == ["a"]
+    assert form.get_errors() == {
+        "a": err.TIMEOUT,
+        "b": err.TIMEOUT,
+        # Pending errors are still reported
+        "c": err.REQUIRED,
+        "d": err.REQUIRED,
+    }
+
+
+def test_timeout_fallback():
+    class TestForm(f.Form):
+        class Meta:
+            executor = executor
+            timeouts = {"slow": 0.02}
+            timeout_error = None
+
+        slow = f.TextField()
+
+        @f.expensive
+        def validate_slow(self, value):
+            time.sleep(0.1)
+            raise ValueError("nope")
+
+    form = TestForm({"slow": "a"})
+    assert form.is_valid
+    assert form.slow.value == "a"
+
+
+def test_custom_timeout_error():
+    class TestForm(f.Form):
+        class Meta:
+            timeouts = {"slow": 0.001}
+            timeout_error = "too_slow"
+
+        slow = f.TextField()
+
+        def validate_slow(self, value):
+            time.sleep(0.01)
+            return value
+
+    form = TestForm({"slow": "a"})
+    assert form.is_invalid
+    assert form.slow.error == "too_slow"
+
+
+def test_async_timeout():
+    class TestForm(f.Form):
+        class Meta:
+            timeout = 0.05
+
+        slow = f.TextField()
+        fast = f.TextField()
+
+        async def validate_slow(self, value):
+            await asyncio.sleep(1)
+            return value
+
+        async def validate_fast(self, value):
+            await asyncio.sleep(0)
+            return value.upper()
+
+    form = TestForm({"slow": "a", "fast": "b"})
+    start = time.perf_counter()
+    assert not asyncio.run(form.ais_valid())
+    assert time.perf_counter() - start < 0.5
+    assert form.get_errors() == {"slow": err.TIMEOUT}
+    assert form.fast.value == "B"
+    assert set(form.get_timings()) == {"slow", "fast"}
+
+
+def test_no_budget_no_timings():
+    class TestForm(f.Form):
+        name = f.TextField()
+
+    form = TestForm({"name": "a"})
+    assert form.is_valid
+    assert form.get_timings() == {}
+
+
+@pytest.mark.parametrize("meta", [
+    {"timeout": 0},
+    {"timeout": "1"},
+    {"timeouts": []},
+    {"timeouts": {"meh": 1}},
+    {"timeouts": {"name": -1}},
+])
+def test_invalid_budgets(meta):
+    with pytest.raises(ValueError):
+        type("TestForm", (f.Form,), {
+            "Meta": type("Meta", (), meta),
+            "name": f.TextField(),
+        })